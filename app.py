@@ -0,0 +1,976 @@
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from datetime import datetime
+from io import BytesIO
+import json
+import os
+import random
+import tempfile
+import time
+import warnings
+import zipfile
+from translations import translations, translator
+warnings.filterwarnings("ignore")
+
+REPORT_POLL_SECONDS = 0.5
+
+st.set_page_config(
+    page_title="Data Analytics Platform",
+    page_icon="📊",
+    layout="wide"
+)
+
+if 'language' not in st.session_state:
+    st.session_state.language = 'en'
+
+def t(key):
+    """Get translation for current language"""
+    return translations[st.session_state.language].get(key, key)
+
+st.markdown("""
+<style>
+    .stTabs [data-baseweb="tab-list"] {
+        gap: 8px;
+        background-color: rgba(255, 255, 255, 0.1);
+        padding: 10px;
+        border-radius: 10px;
+    }
+    
+    .stTabs [data-baseweb="tab"] {
+        height: 60px;
+        white-space: pre-wrap;
+        background-color: rgba(255, 255, 255, 0.8);
+        border-radius: 8px;
+        color: #1976d2;
+        font-size: 18px;
+        font-weight: 700;
+        padding: 10px 30px;
+        border: 2px solid transparent;
+    }
+    
+    .stTabs [aria-selected="true"] {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        border: 2px solid white;
+        box-shadow: 0 4px 8px rgba(0,0,0,0.2);
+    }
+    
+    .stTabs [data-baseweb="tab"]:hover {
+        background-color: rgba(102, 126, 234, 0.3);
+    }
+    
+    .block-container {
+        padding-top: 2rem;
+        padding-bottom: 2rem;
+    }
+    
+    .stButton > button {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        border: none;
+        padding: 12px 28px;
+        font-size: 16px;
+        font-weight: 600;
+        border-radius: 10px;
+        box-shadow: 0 4px 12px rgba(102, 126, 234, 0.4);
+        transition: all 0.3s ease;
+    }
+    
+    .stButton > button:hover {
+        transform: translateY(-2px);
+        box-shadow: 0 6px 16px rgba(102, 126, 234, 0.6);
+        background: linear-gradient(135deg, #764ba2 0%, #667eea 100%);
+    }
+</style>
+""", unsafe_allow_html=True)
+
+with st.sidebar:
+    st.markdown("### 🌐 Language / Bahasa")
+    language = st.radio("", ["English", "Bahasa Indonesia"], index=0 if st.session_state.language == 'en' else 1, label_visibility="collapsed")
+    if language == "English":
+        st.session_state.language = 'en'
+    else:
+        st.session_state.language = 'id'
+
+def descriptive_labels():
+    return {
+        'count': t('count'), 'missing': t('missing'), 'mean': t('mean'), 'median': t('median'),
+        'std': t('std_dev'), 'var': t('variance'), 'min': t('min'), 'max': t('max'),
+        'range': t('range'), 'skew': t('skewness'), 'kurtosis': t('kurtosis')
+    }
+
+def stop_permutation():
+    # the click interrupts the running script; the rerun it starts resumes the analysis,
+    # and the permutation test then returns at once with the permutations drawn so far
+    st.session_state.permutation_cancel = True
+    st.session_state.analysis_resume = True
+
+def _report_panel(report_key, report_ctx, polled=False):
+    try:
+        from report import build_report, cached_report, report_job, submit_report
+    except ImportError:
+        st.error("❌ ReportLab library not found. Install with: pip install reportlab")
+        return
+
+    pdf_path = cached_report(report_key)
+    job = report_job(report_key)
+    if pdf_path is None and (job is None or job.status != "running"):
+        if job is not None and job.status == "failed":
+            st.error(f"❌ Error generating PDF: {str(job.error)}")
+        elif job is not None and job.status == "cancelled":
+            st.info(t('pdf_cancelled'))
+        if st.button(f"🛠️ {t('pdf_generate')}", type="primary", use_container_width=True, key="pdf_generate"):
+            job = submit_report(report_key, report_ctx, translator(report_ctx['lang']))
+
+    if pdf_path is None and job is not None and job.status == "running":
+        st.progress(min(job.progress, 1.0), text=f"{t('pdf_generating')}: {t('pdf_section_' + job.section)}")
+        if st.button(f"⏹️ {t('pdf_cancel')}", key="pdf_cancel"):
+            job.cancel()
+        if not polled and get_script_run_ctx().fragment_ids_this_run:
+            time.sleep(REPORT_POLL_SECONDS)
+            st.rerun(scope="fragment")
+        return
+
+    if pdf_path is not None:
+        # the report stays on disk; its bytes are read only when the button is clicked
+        def read_pdf():
+            try:
+                with open(pdf_path, "rb") as f:
+                    return f.read()
+            except FileNotFoundError:
+                # evicted from the report cache since the button was drawn: build a copy just for this download
+                path = build_report(report_ctx, translator(report_ctx['lang']))
+                try:
+                    with open(path, "rb") as f:
+                        return f.read()
+                finally:
+                    os.remove(path)
+
+        st.download_button(
+            label=f"📥 {t('pdf_download_btn')}",
+            data=read_pdf,
+            file_name=f"statistical_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
+            mime="application/pdf",
+            type="primary",
+            use_container_width=True
+        )
+        st.success(f"✅ {t('pdf_success')}")
+        st.info(f"📊 {t('pdf_includes')}")
+
+@st.fragment
+def report_panel(report_key, report_ctx):
+    # a fragment, so generating, polling and cancelling rerun only this panel and keep the analysis on screen
+    _report_panel(report_key, report_ctx)
+
+@st.fragment(run_every=REPORT_POLL_SECONDS)
+def polled_report_panel(report_key, report_ctx):
+    # a full run cannot rerun a fragment itself, so a report already building when the page is drawn
+    # (e.g. the analysis was rerun meanwhile) is followed by timed fragment reruns instead
+    _report_panel(report_key, report_ctx, polled=True)
+
+def report_section(report_key, report_ctx):
+    try:
+        from report import report_job
+    except ImportError:
+        report_job = lambda key: None
+    job = report_job(report_key)
+    (polled_report_panel if job is not None and job.status == "running" else report_panel)(report_key, report_ctx)
+
+@st.fragment
+def batch_panel(selection, options):
+    # a fragment, so starting a batch leaves the single-file analysis on screen
+    st.caption(t('batch_help'))
+    # only uploads here: server folders are for the command line (cli.py), not for every visitor of the page
+    batch_files = st.file_uploader(t('batch_files'), type=["csv", "xlsx", "xls"], accept_multiple_files=True, key="batch_files")
+    st.download_button(f"💾 {t('batch_save_selection')}", json.dumps(selection, indent=2), file_name="selection.json", mime="application/json")
+    if not st.button(f"📦 {t('batch_start')}", key="batch_start", disabled=not (selection['x_vars'] and selection['y_vars'])):
+        return
+    if not batch_files:
+        st.warning(t('batch_no_files'))
+        return
+    from batch import run_batch
+
+    # worker processes read from disk, so uploads are written out first, each in its own folder so equal names
+    # do not overwrite each other; everything is deleted once the results are zipped
+    with tempfile.TemporaryDirectory(prefix="batch-") as work_dir:
+        paths = []
+        for i, upload in enumerate(batch_files):
+            path = os.path.join(work_dir, "in", str(i), os.path.basename(upload.name))
+            os.makedirs(os.path.dirname(path))
+            with open(path, "wb") as f:
+                f.write(upload.getbuffer())
+            paths.append(path)
+        out_dir = os.path.join(work_dir, "out")
+        batch_bar = st.progress(0.0, text=t('batch_running'))
+        summary = run_batch(paths, selection, out_dir, lang=st.session_state.language,
+                            progress=lambda done, total: batch_bar.progress(done / total, text=f"{t('batch_running')}: {done}/{total}"),
+                            **options)
+        batch_bar.empty()
+        buffer = BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+            for name in sorted(os.listdir(out_dir)):
+                archive.write(os.path.join(out_dir, name), name)
+
+    st.markdown(f"#### 📋 {t('batch_summary')}")
+    st.dataframe(summary.drop(columns=["pdf"]), use_container_width=True)
+    failed = int((summary["status"] != "ok").sum())
+    if failed:
+        st.warning(f"⚠️ {failed} {t('batch_failed')}")
+
+    st.download_button(f"📥 {t('batch_download')}", buffer.getvalue(), file_name=f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip",
+                       mime="application/zip", type="primary", use_container_width=True)
+
+tab1, tab2, tab3 = st.tabs([f"🏠  {t('title').upper()[:4]}", "📘  INTRODUCTION", "📊  ANALYSIS"])
+
+with tab1:
+    st.markdown("""
+    <style>
+        [data-testid="stAppViewContainer"] {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        }
+        .glass-card {
+            background: rgba(255, 255, 255, 0.15);
+            backdrop-filter: blur(10px);
+            border-radius: 15px;
+            padding: 20px;
+            margin: 10px 0;
+            border: 1px solid rgba(255, 255, 255, 0.2);
+        }
+        .quote-card {
+            background: rgba(255, 255, 255, 0.1);
+            border-left: 4px solid #FFD700;
+            padding: 15px;
+            border-radius: 10px;
+            font-style: italic;
+        }
+    </style>
+    """, unsafe_allow_html=True)
+    
+    st.markdown('<div style="text-align: center; padding: 20px;">', unsafe_allow_html=True)
+    st.markdown(f'<h1 style="color: white; font-size: 3rem; margin-bottom: 10px;">📊 {t("title")}</h1>', unsafe_allow_html=True)
+    st.markdown(f'<p style="color: white; font-size: 1.3rem;">{t("subtitle")}</p>', unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    QUOTES = [
+        "Without data, you're just another person with an opinion. - W. Edwards Deming",
+        "Data is a precious thing and will last longer than the systems themselves. - Tim Berners-Lee",
+        "The goal is to turn data into information, and information into insight. - Carly Fiorina",
+        "In God we trust. All others must bring data. - W. Edwards Deming",
+        "Data really powers everything that we do. - Jeff Weiner"
+    ]
+    
+    quote = random.choice(QUOTES)
+    st.markdown(f"""
+    <div class="quote-card">
+        <p style="color: white; margin: 0; font-size: 1.1rem;">"{quote.split(' - ')[0]}"</p>
+        <p style="color: rgba(255, 255, 255, 0.7); text-align: right; margin: 5px 0 0 0; font-size: 1rem;">
+        — {quote.split(' - ')[1]}
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown(f"""
+    <div class="glass-card">
+        <h3 style="color: white; margin-bottom: 10px;">🌟 {t('welcome')}</h3>
+        <p style="color: rgba(255, 255, 255, 0.9); font-size: 1.05rem;">
+        {t('welcome_text')}
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown(f'<h3 style="color: white; margin: 30px 0 15px 0;">✨ {t("core_features")}</h3>', unsafe_allow_html=True)
+    
+    features = [
+        ("📋", t('descriptive_stats'), t('descriptive_desc')),
+        ("🔗", t('spearman'), t('spearman_desc')),
+        ("📊", t('data_viz'), t('data_viz_desc')),
+        ("📈", t('regression'), t('regression_desc')),
+        ("🎯", t('stat_testing'), t('stat_testing_desc')),
+        ("📊", t('corr_matrix'), t('corr_matrix_desc'))
+    ]
+    
+    cols = st.columns(3)
+    for idx, (icon, title, desc) in enumerate(features):
+        with cols[idx % 3]:
+            st.markdown(f"""
+            <div class="glass-card">
+                <div style="font-size: 1.8rem; margin-bottom: 8px;">{icon}</div>
+                <h4 style="color: white; margin: 0 0 5px 0;">{title}</h4>
+                <p style="color: rgba(255, 255, 255, 0.8); font-size: 0.9rem; margin: 0;">{desc}</p>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    st.markdown(f"""
+    <div style="text-align: center; color: rgba(255, 255, 255, 0.6); padding: 20px 0;">
+        <p style="font-size: 1rem;">{t('footer')}</p>
+        <p style="font-size: 0.9rem;">{t('footer_sub')}</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+with tab2:
+    st.markdown("""
+    <style>
+        [data-testid="stAppViewContainer"] {
+            background: linear-gradient(135deg, #1e3c72 0%, #2a5298 50%, #7e22ce 100%);
+        }
+        
+        .tech-card-1 { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); border-radius: 20px; padding: 2.5rem 1.5rem; text-align: center; transition: all 0.4s ease; border: 3px solid white; height: 180px; box-shadow: 0 8px 20px rgba(102, 126, 234, 0.5); display: flex; flex-direction: column; justify-content: center; }
+        .tech-card-2 { background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); border-radius: 20px; padding: 2.5rem 1.5rem; text-align: center; transition: all 0.4s ease; border: 3px solid white; height: 180px; box-shadow: 0 8px 20px rgba(240, 147, 251, 0.5); display: flex; flex-direction: column; justify-content: center; }
+        .tech-card-3 { background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); border-radius: 20px; padding: 2.5rem 1.5rem; text-align: center; transition: all 0.4s ease; border: 3px solid white; height: 180px; box-shadow: 0 8px 20px rgba(79, 172, 254, 0.5); display: flex; flex-direction: column; justify-content: center; }
+        .tech-card-4 { background: linear-gradient(135deg, #43e97b 0%, #38f9d7 100%); border-radius: 20px; padding: 2.5rem 1.5rem; text-align: center; transition: all 0.4s ease; border: 3px solid white; height: 180px; box-shadow: 0 8px 20px rgba(67, 233, 123, 0.5); display: flex; flex-direction: column; justify-content: center; }
+        .tech-card-5 { background: linear-gradient(135deg, #fa709a 0%, #fee140 100%); border-radius: 20px; padding: 2.5rem 1.5rem; text-align: center; transition: all 0.4s ease; border: 3px solid white; height: 180px; box-shadow: 0 8px 20px rgba(250, 112, 154, 0.5); display: flex; flex-direction: column; justify-content: center; }
+        .tech-card-6 { background: linear-gradient(135deg, #30cfd0 0%, #330867 100%); border-radius: 20px; padding: 2.5rem 1.5rem; text-align: center; transition: all 0.4s ease; border: 3px solid white; height: 180px; box-shadow: 0 8px 20px rgba(48, 207, 208, 0.5); display: flex; flex-direction: column; justify-content: center; }
+        
+        .tech-card-1:hover, .tech-card-2:hover, .tech-card-3:hover,
+        .tech-card-4:hover, .tech-card-5:hover, .tech-card-6:hover {
+            transform: translateY(-10px) scale(1.05);
+            box-shadow: 0 15px 35px rgba(0, 0, 0, 0.4);
+        }
+        
+        .tech-icon { font-size: 3.5rem; margin-bottom: 0.5rem; filter: drop-shadow(0 4px 8px rgba(0,0,0,0.3)); }
+        .tech-name { color: white; font-size: 1.4rem; font-weight: 700; text-shadow: 2px 2px 4px rgba(0,0,0,0.3); margin: 0; }
+        .about-section { background: rgba(255, 255, 255, 0.95); padding: 2rem; border-radius: 15px; margin: 2rem 0; box-shadow: 0 8px 20px rgba(0,0,0,0.2); }
+    </style>
+    """, unsafe_allow_html=True)
+    
+    st.markdown(f"""
+    <div style="text-align: center; padding: 1rem 0 2rem 0;">
+        <h1 style="margin-bottom: 0.5rem; color: white; text-shadow: 2px 2px 4px rgba(0,0,0,0.3);">📊 {t('platform_title')}</h1>
+        <p style="font-size: 1.3rem; color: white; margin-bottom: 1rem; font-weight: 600; text-shadow: 1px 1px 2px rgba(0,0,0,0.3);">{t('platform_subtitle')}</p>
+        <div style="padding: 1.2rem; background: rgba(255, 255, 255, 0.2); border-radius: 12px; display: inline-block; margin: 1rem auto; border-left: 5px solid #FFD700; box-shadow: 0 4px 12px rgba(0,0,0,0.2); backdrop-filter: blur(10px);">
+            <p style="font-style: italic; color: white; margin: 0; font-size: 1.15rem; font-weight: 600; text-shadow: 1px 1px 2px rgba(0,0,0,0.3);">"It is a capital mistake to theorize before one has data." — Sherlock Holmes</p>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown('<div style="height: 3px; background: linear-gradient(90deg, #FFD700, #FFA500, #FFD700); margin: 3rem 0; border-radius: 3px;"></div>', unsafe_allow_html=True)
+    
+    st.markdown(f'<h2 style="color: white; text-shadow: 2px 2px 4px rgba(0,0,0,0.3);">🎯 {t("objectives")}</h2>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown(f"""
+        <div style="background: rgba(255, 255, 255, 0.15); padding: 1.8rem; border-radius: 15px; height: 100%; box-shadow: 0 4px 12px rgba(0,0,0,0.2); backdrop-filter: blur(10px); border: 2px solid rgba(255,255,255,0.3);">
+            <h3 style="color: white; font-weight: 700; text-shadow: 2px 2px 4px rgba(0,0,0,0.3);">🌍 {t('global_access')}</h3>
+            <ul style="color: white; line-height: 1.9; font-size: 1.05rem; text-shadow: 1px 1px 2px rgba(0,0,0,0.3);">
+                <li><strong>{t('global_text_1')}</strong></li>
+                <li><strong>{t('global_text_2')}</strong></li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(f"""
+        <div style="background: rgba(255, 255, 255, 0.15); padding: 1.8rem; border-radius: 15px; height: 100%; box-shadow: 0 4px 12px rgba(0,0,0,0.2); backdrop-filter: blur(10px); border: 2px solid rgba(255,255,255,0.3);">
+            <h3 style="color: white; font-weight: 700; text-shadow: 2px 2px 4px rgba(0,0,0,0.3);">📈 {t('comprehensive')}</h3>
+            <ul style="color: white; line-height: 1.9; font-size: 1.05rem; text-shadow: 1px 1px 2px rgba(0,0,0,0.3);">
+                <li><strong>{t('comp_text_1')}</strong></li>
+                <li><strong>{t('comp_text_2')}</strong></li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown('<div style="height: 3px; background: linear-gradient(90deg, #FFD700, #FFA500, #FFD700); margin: 3rem 0; border-radius: 3px;"></div>', unsafe_allow_html=True)
+    
+    st.markdown(f'<h2 style="color: white; text-shadow: 2px 2px 4px rgba(0,0,0,0.3);">🛠️ {t("tech_stack")}</h2>', unsafe_allow_html=True)
+    st.markdown(f'<p style="color: white; font-size: 1.08rem; margin-bottom: 2rem; font-weight: 500; text-shadow: 1px 1px 2px rgba(0,0,0,0.3);">{t("tech_text")}</p>', unsafe_allow_html=True)
+    
+    tech_stack = [
+        {"icon": "🐍", "name": "Python 3.11+", "class": "tech-card-1"},
+        {"icon": "🐼", "name": "Pandas", "class": "tech-card-2"},
+        {"icon": "📊", "name": "Plotly", "class": "tech-card-3"},
+        {"icon": "⚡", "name": "Streamlit", "class": "tech-card-4"},
+        {"icon": "🔢", "name": "NumPy", "class": "tech-card-5"},
+        {"icon": "🔬", "name": "SciPy", "class": "tech-card-6"},
+    ]
+    
+    cols = st.columns(3)
+    for idx, tech in enumerate(tech_stack):
+        with cols[idx % 3]:
+            st.markdown(f'<div class="{tech["class"]}"><div class="tech-icon">{tech["icon"]}</div><h3 class="tech-name">{tech["name"]}</h3></div>', unsafe_allow_html=True)
+    
+    st.markdown('<div style="height: 3px; background: linear-gradient(90deg, #FFD700, #FFA500, #FFD700); margin: 3rem 0; border-radius: 3px;"></div>', unsafe_allow_html=True)
+    
+    st.markdown(f'<h2 style="color: white; text-shadow: 2px 2px 4px rgba(0,0,0,0.3);">👥 {t("our_team")}</h2>', unsafe_allow_html=True)
+    st.markdown(f'<p style="color: white; font-size: 1.08rem; margin-bottom: 2rem; font-weight: 500; text-shadow: 1px 1px 2px rgba(0,0,0,0.3);">{t("team_text")}</p>', unsafe_allow_html=True)
+    
+    team_members = [
+        {"name": "Hevita Zhofany Putri", "role": "Data Analyst", "id": "004202400016", "icon": "📈", "color": "#4CAF50"},
+        {"name": "Ristia Angelina Purba", "role": "Data Scientist", "id": "004202400071", "icon": "👩‍🔬", "color": "#2196F3"},
+        {"name": "Mika Lusia Panjaitan", "role": "Statistical Systems Developer", "id": "004202400101", "icon": "👩‍💻", "color": "#FF9800"},
+        {"name": "Sarah Aulya Fitri Ritonga", "role": "Project Manager", "id": "004202400090", "icon": "👩‍💼", "color": "#9C27B0"}
+    ]
+    
+    cols = st.columns(2)
+    for idx, member in enumerate(team_members):
+        with cols[idx % 2]:
+            st.markdown(f"""
+            <div style="background: rgba(255, 255, 255, 0.15); border-radius: 15px; padding: 2rem; margin: 1.5rem 0; box-shadow: 0 6px 15px rgba(0, 0, 0, 0.2); border-top: 5px solid {member['color']}; backdrop-filter: blur(10px);">
+                <div style="display: flex; align-items: center; gap: 1.5rem;">
+                    <div style="width: 80px; height: 80px; border-radius: 50%; display: flex; align-items: center; justify-content: center; font-size: 2.2rem; color: white; box-shadow: 0 6px 15px rgba(0, 0, 0, 0.3); background: linear-gradient(135deg, {member['color']}, {member['color']}dd);">{member['icon']}</div>
+                    <div style="flex: 1;">
+                        <div style="font-size: 1.4rem; font-weight: 700; color: white; margin-bottom: 0.5rem; text-shadow: 2px 2px 4px rgba(0,0,0,0.3);">{member['name']}</div>
+                        <div style="font-size: 1.1rem; font-weight: 600; color: white; margin-bottom: 0.5rem; text-shadow: 1px 1px 2px rgba(0,0,0,0.3);">{member['role']}</div>
+                        <div style="color: rgba(255,255,255,0.9); font-size: 0.95rem; text-shadow: 1px 1px 2px rgba(0,0,0,0.3);">Student ID: {member['id']}</div>
+                    </div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    st.markdown('<div style="height: 3px; background: linear-gradient(90deg, #FFD700, #FFA500, #FFD700); margin: 3rem 0; border-radius: 3px;"></div>', unsafe_allow_html=True)
+    
+    st.markdown(f'<h2 style="color: white; text-shadow: 2px 2px 4px rgba(0,0,0,0.3); margin-bottom: 1.5rem;">📊 {t("about_analysis")}</h2>', unsafe_allow_html=True)
+    
+    st.markdown('<div class="about-section">', unsafe_allow_html=True)
+    st.markdown(f'<h3 style="color: white; background: linear-gradient(135deg, #1e88e5, #1565c0); padding: 1rem; border-radius: 10px; text-shadow: 2px 2px 4px rgba(0,0,0,0.3); margin: -2rem -2rem 1.5rem -2rem;">{t("about_text")}</h3>', unsafe_allow_html=True)
+    
+    st.markdown(f'<ol style="color: #333; font-size: 1.05rem; line-height: 1.8; margin-top: 1rem;"><li><strong style="color: #333;">{t("descriptive_analysis")}</strong></li><li><strong style="color: #333;">{t("association_analysis")}</strong></li></ol>', unsafe_allow_html=True)
+    
+    st.markdown(f'<h3 style="color: #333; margin-top: 2rem; border-bottom: 3px solid #1565c0; padding-bottom: 0.5rem;">{t("desc_analysis_title")}</h3>', unsafe_allow_html=True)
+    st.markdown(f'<ul style="color: #333; font-size: 1.05rem; line-height: 1.8;"><li><strong style="color: #333;">{t("basic_stats_title")}</strong> {t("basic_stats_text")}</li><li><strong style="color: #333;">{t("distribution_title")}</strong> {t("distribution_text")}</li><li><strong style="color: #333;">{t("summaries_title")}</strong> {t("summaries_text")}</li></ul>', unsafe_allow_html=True)
+    
+    st.markdown(f'<h3 style="color: #333; margin-top: 2rem; border-bottom: 3px solid #1565c0; padding-bottom: 0.5rem;">{t("assoc_analysis_title")}</h3>', unsafe_allow_html=True)
+    st.markdown(f'<ul style="color: #333; font-size: 1.05rem; line-height: 1.8;"><li><strong style="color: #333;">{t("spearman_coef")}</strong></li><li><strong style="color: #333;">{t("p_value")}</strong></li><li><strong style="color: #333;">{t("visualizations")}</strong></li><li><strong style="color: #333;">{t("interpretations")}</strong></li></ul>', unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    st.markdown(f'<div class="about-section"><h3 style="color: #1565c0; margin-top: 2rem; border-bottom: 3px solid #1565c0; padding-bottom: 0.5rem;">📈 {t("understanding_corr")}</h3></div>', unsafe_allow_html=True)
+    
+    pearson_html = f'''<div class="about-section"><div style="background: linear-gradient(135deg, #e3f2fd 0%, #bbdefb 100%); padding: 1.5rem; border-radius: 10px; border-left: 5px solid #1565c0; margin: 1.5rem 0; box-shadow: 0 4px 8px rgba(0,0,0,0.1);">
+    <h4 style="color: #0d47a1; margin-top: 0; font-size: 1.3rem;">📊 {t("pearson_corr")}</h4>
+    <ul style="color: #333; line-height: 1.8; margin: 0;">
+    <li><strong>{t("purpose")}</strong> {t("pearson_purpose")}</li>
+    <li><strong>{t("requirements")}</strong> {t("pearson_req")}</li>
+    <li><strong>{t("when_use")}</strong> {t("pearson_when")}</li>
+    <li><strong>{t("formula")}</strong> {t("pearson_formula")}</li>
+    <li><strong>{t("range_val")}</strong> {t("pearson_range")}</li>
+    <li><strong>{t("sensitivity")}</strong> {t("pearson_sensitivity")}</li>
+    </ul></div></div>'''
+    st.markdown(pearson_html, unsafe_allow_html=True)
+    
+    spearman_html = f'''<div class="about-section"><div style="background: linear-gradient(135deg, #fff3e0 0%, #ffe0b2 100%); padding: 1.5rem; border-radius: 10px; border-left: 5px solid #ff9800; margin: 1.5rem 0; box-shadow: 0 4px 8px rgba(0,0,0,0.1);">
+    <h4 style="color: #e65100; margin-top: 0; font-size: 1.3rem;">📈 {t("spearman_corr")}</h4>
+    <ul style="color: #333; line-height: 1.8; margin: 0;">
+    <li><strong>{t("purpose")}</strong> {t("spearman_purpose")}</li>
+    <li><strong>{t("requirements")}</strong> {t("spearman_req")}</li>
+    <li><strong>{t("when_use")}</strong> {t("spearman_when")}</li>
+    <li><strong>{t("method_calc")}</strong> {t("spearman_method")}</li>
+    <li><strong>{t("advantage")}</strong> {t("spearman_advantage")}</li>
+    <li><strong>{t("perfect_for")}</strong> {t("spearman_perfect")}</li>
+    </ul></div></div>'''
+    st.markdown(spearman_html, unsafe_allow_html=True)
+    
+    comparison_table = f'''
+    <div class="about-section">
+        <div style="background: linear-gradient(135deg, #f1f8e9 0%, #dcedc8 100%); padding: 1.5rem; border-radius: 10px; margin: 1.5rem 0; box-shadow: 0 4px 8px rgba(0,0,0,0.1);">
+            <h4 style="color: #33691e; margin-top: 0; font-size: 1.3rem;">🔍 {t("key_diff")}</h4>
+            <table style="width: 100%; border-collapse: collapse; color: #333; margin-top: 1rem;">
+                <thead>
+                    <tr style="background: linear-gradient(135deg, #aed581, #9ccc65);">
+                        <th style="padding: 12px; text-align: left; border: 1px solid #689f38; color: #1b5e20; font-weight: 700;">{t("aspect")}</th>
+                        <th style="padding: 12px; text-align: left; border: 1px solid #689f38; color: #1b5e20; font-weight: 700;">Pearson</th>
+                        <th style="padding: 12px; text-align: left; border: 1px solid #689f38; color: #1b5e20; font-weight: 700;">Spearman</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    <tr style="background: #ffffff;">
+                        <td style="padding: 10px; border: 1px solid #c5e1a5;"><strong>{t("data_type")}</strong></td>
+                        <td style="padding: 10px; border: 1px solid #c5e1a5;">{t("continuous")}</td>
+                        <td style="padding: 10px; border: 1px solid #c5e1a5;">{t("ordinal_continuous")}</td>
+                    </tr>
+                    <tr style="background: #f9fbe7;">
+                        <td style="padding: 10px; border: 1px solid #c5e1a5;"><strong>{t("relationship_type")}</strong></td>
+                        <td style="padding: 10px; border: 1px solid #c5e1a5;">{t("linear_only")}</td>
+                        <td style="padding: 10px; border: 1px solid #c5e1a5;">{t("monotonic")}</td>
+                    </tr>
+                    <tr style="background: #ffffff;">
+                        <td style="padding: 10px; border: 1px solid #c5e1a5;"><strong>{t("distribution")}</strong></td>
+                        <td style="padding: 10px; border: 1px solid #c5e1a5;">{t("requires_norm")}</td>
+                        <td style="padding: 10px; border: 1px solid #c5e1a5;">{t("no_assumption")}</td>
+                    </tr>
+                    <tr style="background: #f9fbe7;">
+                        <td style="padding: 10px; border: 1px solid #c5e1a5;"><strong>{t("outliers")}</strong></td>
+                        <td style="padding: 10px; border: 1px solid #c5e1a5;">❌ {t("highly_sensitive")}</td>
+                        <td style="padding: 10px; border: 1px solid #c5e1a5;">✅ {t("robust_resistant")}</td>
+                    </tr>
+                    <tr style="background: #ffffff;">
+                        <td style="padding: 10px; border: 1px solid #c5e1a5;"><strong>{t("likert_scales")}</strong></td>
+                        <td style="padding: 10px; border: 1px solid #c5e1a5;">❌ {t("not_recommended")}</td>
+                        <td style="padding: 10px; border: 1px solid #c5e1a5;">✅ {t("ideal_choice")}</td>
+                    </tr>
+                    <tr style="background: #f9fbe7;">
+                        <td style="padding: 10px; border: 1px solid #c5e1a5;"><strong>{t("calculation")}</strong></td>
+                        <td style="padding: 10px; border: 1px solid #c5e1a5;">{t("uses_raw")}</td>
+                        <td style="padding: 10px; border: 1px solid #c5e1a5;">{t("uses_ranked")}</td>
+                    </tr>
+                    <tr style="background: #ffffff;">
+                        <td style="padding: 10px; border: 1px solid #c5e1a5;"><strong>{t("best_app")}</strong></td>
+                        <td style="padding: 10px; border: 1px solid #c5e1a5;">{t("experimental")}</td>
+                        <td style="padding: 10px; border: 1px solid #c5e1a5;">{t("survey_research")}</td>
+                    </tr>
+                </tbody>
+            </table>
+        </div>
+    </div>
+    '''
+    st.markdown(comparison_table, unsafe_allow_html=True)
+    
+    when_to_use = f'''
+    <div class="about-section">
+        <div style="background: linear-gradient(135deg, #e1f5fe 0%, #b3e5fc 100%); padding: 1.5rem; border-radius: 10px; border-left: 5px solid #0288d1; margin: 1.5rem 0;">
+            <h4 style="color: #01579b; margin-top: 0;">💡 {t("when_use_which")}</h4>
+            <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 1rem; margin-top: 1rem;">
+                <div style="background: white; padding: 1rem; border-radius: 8px; border: 2px solid #4fc3f7;">
+                    <h5 style="color: #0277bd; margin-top: 0;">{t("use_pearson_when")}</h5>
+                    <ul style="color: #333; font-size: 0.95rem; line-height: 1.6; margin: 0;">
+                        <li>{t("normal_dist")}</li>
+                        <li>{t("linear_rel")}</li>
+                        <li>{t("vars_continuous")}</li>
+                        <li>{t("no_outliers")}</li>
+                    </ul>
+                </div>
+                <div style="background: white; padding: 1rem; border-radius: 8px; border: 2px solid #ffb74d;">
+                    <h5 style="color: #e65100; margin-top: 0;">{t("use_spearman_when")}</h5>
+                    <ul style="color: #333; font-size: 0.95rem; line-height: 1.6; margin: 0;">
+                        <li>{t("ordinal_data")}</li>
+                        <li>{t("non_normal")}</li>
+                        <li>{t("presence_outliers")}</li>
+                        <li>{t("monotonic_not_linear")}</li>
+                    </ul>
+                </div>
+            </div>
+        </div>
+    </div>
+    '''
+    st.markdown(when_to_use, unsafe_allow_html=True)
+    
+    st.markdown('<div class="about-section">', unsafe_allow_html=True)
+    st.markdown(f'<h3 style="color: #1565c0; margin-top: 2rem; border-bottom: 3px solid #1565c0; padding-bottom: 0.5rem;">🎯 {t("program_obj")}</h3>', unsafe_allow_html=True)
+    st.markdown(f'<ol style="color: #333; font-size: 1.05rem; line-height: 1.8;"><li>{t("obj_1")}</li><li>{t("obj_2")}</li><li>{t("obj_3")}</li><li>{t("obj_4")}</li><li>{t("obj_5")}</li></ol>', unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+with tab3:
+    st.markdown("""
+    <style>
+        [data-testid="stAppViewContainer"] { background: linear-gradient(135deg, #0d47a1, #1976d2, #42a5f5); }
+        .content-box { background: white; padding: 28px; border-radius: 18px; margin-bottom: 28px; box-shadow: 0 12px 35px rgba(0,0,0,0.15); }
+        .stats-card { background: linear-gradient(135deg, #f8f9ff 0%, #ffffff 100%); border-radius: 12px; padding: 1.5rem; box-shadow: 0 4px 12px rgba(0,0,0,0.08); border-left: 5px solid #1e88e5; transition: all 0.3s ease; }
+        .stats-card:hover { transform: translateY(-3px); box-shadow: 0 8px 20px rgba(0,0,0,0.12); }
+        .interpretation-box { background: linear-gradient(135deg, #e3f2fd 0%, #f4f8ff 100%); border-left: 6px solid #1e88e5; padding: 1.5rem; border-radius: 12px; margin-top: 1.5rem; color: #1565c0; font-size: 15px; box-shadow: 0 4px 12px rgba(30, 136, 229, 0.1); }
+        .metric-badge { display: inline-block; background: linear-gradient(135deg, #1e88e5, #1565c0); color: white; padding: 8px 16px; border-radius: 20px; font-weight: 600; font-size: 14px; margin: 5px; box-shadow: 0 3px 8px rgba(30, 136, 229, 0.3); }
+        h1 { text-align: center; color: white; font-weight: 800; text-shadow: 2px 2px 4px rgba(0,0,0,0.2); }
+        h2 { color: #0d47a1; font-weight: 700; margin-top: 1rem; }
+        h3 { color: #1565c0; font-weight: 700; margin-top: 1rem; }
+        .stDataFrame { border-radius: 10px; overflow: hidden; box-shadow: 0 4px 12px rgba(0,0,0,0.08); }
+    </style>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("<h1>📊 STATISTICAL ANALYZER PRO</h1>", unsafe_allow_html=True)
+    st.markdown("<p style='text-align:center;color:white;font-size:18px;text-shadow: 1px 1px 2px rgba(0,0,0,0.3);'>Advanced Descriptive & Association Analysis</p>", unsafe_allow_html=True)
+    
+    st.markdown("<div class='content-box'>", unsafe_allow_html=True)
+    st.markdown(f"## 📤 {t('upload_dataset')}")
+    uploaded_file = st.file_uploader(t('accepted_formats'), type=["csv", "xlsx", "xls"])
+    st.markdown("</div>", unsafe_allow_html=True)
+    
+    if uploaded_file:
+        # the analysis stack (pandas, scipy, matplotlib, seaborn) loads with the first upload rather than
+        # on first paint; after that these imports are dictionary lookups in sys.modules
+        from charts import apply_theme, fingerprint, get_chart, render_charts
+        from composites import COMPOSITE_METHODS, parse_composite
+        from correlation import BOOTSTRAP_REPLICATES, P_ADJUST_METHODS
+        from engine import (associate, build_composites, composite_specs, describe_variables, is_likert, item_matrix,
+                            normality_of_totals, reliability_analysis, report_context, split_analysis)
+        from reliability import format_reliability, reliability_level
+        from normality import STRATEGIES as NORMALITY_STRATEGIES, format_statistic
+        from ingest import dataset_overview, list_excel_sheets, load_dataset, memory_report
+        apply_theme()
+
+        sheets = None
+        if not uploaded_file.name.endswith(".csv"):
+            sheet_rows = dict(list_excel_sheets(uploaded_file))
+            if len(sheet_rows) > 1:
+                sheets = st.multiselect(f"📑 {t('select_sheets')}", list(sheet_rows), default=list(sheet_rows)[:1],
+                                        format_func=lambda name: f"{name} ({sheet_rows[name] if sheet_rows[name] is not None else '?'} {t('rows').lower()})")
+
+        loading_bar = st.progress(0.0, text=t('loading_dataset'))
+        n_rows, columns, size_bytes, size_kind, preview = dataset_overview(uploaded_file, sheets=sheets, progress=lambda frac: loading_bar.progress(frac, text=t('loading_dataset')))
+        loading_bar.empty()
+
+        st.markdown("<div class='content-box'>", unsafe_allow_html=True)
+        st.success(f"✅ {t('dataset_loaded')}")
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.markdown(f"<div class='metric-badge'>📊 {t('rows')}: {n_rows}</div>", unsafe_allow_html=True)
+        with col2:
+            st.markdown(f"<div class='metric-badge'>📋 {t('columns')}: {len(columns)}</div>", unsafe_allow_html=True)
+        with col3:
+            st.markdown(f"<div class='metric-badge'>💾 {t('size' if size_kind == 'memory' else 'size_arrow')}: {size_bytes / 1024:.1f} KB</div>", unsafe_allow_html=True)
+        
+        st.markdown("<br>", unsafe_allow_html=True)
+        st.dataframe(preview, use_container_width=True)
+        if st.checkbox(f"🧮 {t('memory_report')}", value=False):
+            memory = memory_report(load_dataset(uploaded_file, sheets=sheets))
+            before, after = memory['bytes_before'].sum(), memory['bytes_after'].sum()
+            st.caption(t('memory_saved').format(before=f"{before / 1024:,.1f} KB", after=f"{after / 1024:,.1f} KB", ratio=before / max(after, 1)))
+            st.dataframe(memory.assign(bytes_before=memory['bytes_before'] / 1024, bytes_after=memory['bytes_after'] / 1024).rename(columns={
+                'dtype_before': f"{t('memory_before')} (dtype)", 'dtype_after': f"{t('memory_after')} (dtype)",
+                'bytes_before': f"{t('memory_before')} (KB)", 'bytes_after': f"{t('memory_after')} (KB)", 'ratio': t('memory_ratio')}).round(1),
+                use_container_width=True)
+        st.markdown("</div>", unsafe_allow_html=True)
+
+        st.markdown("<div class='content-box'>", unsafe_allow_html=True)
+        st.markdown(f"## 🔍 {t('variable_selection')}")
+        col1, col2 = st.columns(2)
+        with col1:
+            x_items = st.multiselect(f"📊 {t('select_x')}", columns, key="x_vars")
+        with col2:
+            y_items = st.multiselect(f"📈 {t('select_y')}", columns, key="y_vars")
+        create_total = st.checkbox(f"✨ {t('create_composite')}", value=True)
+        with st.expander(f"🧮 {t('composite_scoring')}"):
+            score_method = st.selectbox(t('score_method'), COMPOSITE_METHODS, format_func=lambda m: t(f'score_{m}'))
+            reverse_items = st.multiselect(f"🔁 {t('reverse_items')}", x_items + y_items, key="reverse_items")
+            col1, col2, col3 = st.columns(3)
+            scale_min = col1.number_input(t('scale_min'), value=1, step=1)
+            scale_max = col2.number_input(t('scale_max'), value=5, step=1)
+            min_answered = col3.number_input(t('min_answered'), min_value=0, value=0, step=1, help=t('min_answered_help'))
+            weights = {}
+            if score_method == 'weighted' and x_items + y_items:
+                weight_cols = st.columns(min(4, len(x_items + y_items)))
+                weights = {item: weight_cols[i % len(weight_cols)].number_input(f"{t('item_weight')}: {item}", min_value=0.0, value=1.0, step=0.5, key=f"weight_{item}")
+                           for i, item in enumerate(dict.fromkeys(x_items + y_items))}
+            extra_composites = []
+            for line in st.text_area(t('extra_composites'), help=t('extra_composites_help'), placeholder="Satisfaction = Q1, Q2, Q3").splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    extra = parse_composite(line)
+                except ValueError as e:
+                    st.error(str(e))
+                    continue
+                unknown = [item for item in extra['items'] if item not in columns]
+                if unknown:
+                    st.error(t('composite_unknown_items').format(name=extra['name'], items=", ".join(unknown)))
+                    continue
+                extra_composites.append(extra)
+        scoring = {'method': score_method, 'weights': weights, 'reverse': reverse_items, 'scale_min': scale_min,
+                   'scale_max': scale_max, 'min_answered': min_answered or None}
+        normality_strategy = st.selectbox(f"🧪 {t('normality_strategy')}", NORMALITY_STRATEGIES, format_func=lambda s: t(f'norm_{s}'))
+        corr_matrix_mode = st.checkbox(f"🧮 {t('corr_matrix_mode')}", value=False)
+        p_adjust = 'none'
+        if corr_matrix_mode:
+            p_adjust = st.selectbox(t('p_adjust'), P_ADJUST_METHODS, index=1, format_func=lambda m: t(f'p_adjust_{m}'))
+        split_by = st.selectbox(f"🧩 {t('split_by')}", [None] + [col for col in columns if col not in x_items + y_items],
+                                format_func=lambda col: t('split_none') if col is None else col)
+        permutation_mode = st.checkbox(f"🔀 {t('permutation_mode')}", value=False)
+        bootstrap_options = sorted({0, 1000, BOOTSTRAP_REPLICATES, 5000, 10000})
+        bootstrap_replicates = st.selectbox(f"🎲 {t('bootstrap_replicates')}", bootstrap_options, index=bootstrap_options.index(BOOTSTRAP_REPLICATES),
+                                            format_func=lambda b: f"{b:,}" if b else t('bootstrap_off'))
+        st.markdown("</div>", unsafe_allow_html=True)
+
+        with st.expander(f"📦 {t('batch_mode')}"):
+            batch_panel({'x_vars': x_items, 'y_vars': y_items, 'create_total': create_total, 'scoring': scoring, 'composites': extra_composites},
+                        {'normality_strategy': normality_strategy, 'corr_matrix': corr_matrix_mode, 'p_adjust': p_adjust,
+                         'permutation': permutation_mode, 'bootstrap_replicates': bootstrap_replicates, 'split_by': split_by})
+
+        resumed = st.session_state.pop('analysis_resume', False)
+        if st.button(f"▶️ {t('run_analysis')}", type="primary", use_container_width=True):
+            st.session_state.permutation_cancel = False
+            st.session_state.permutation_checkpoint = {}
+            resumed = True
+        if resumed:
+            lang = st.session_state.language
+            try:
+                data, variables_to_analyze = build_composites(load_dataset(uploaded_file, sheets=sheets), x_items, y_items, create_total,
+                                                              keep=[split_by] if split_by else [], scoring=scoring, composites=extra_composites)
+            except ValueError as e:
+                st.error(f"❌ {e}")
+                st.stop()
+
+            st.markdown("<br>", unsafe_allow_html=True)
+            st.markdown(f"## 📊 {t('desc_analysis')}")
+
+            desc_table, chart_specs, freq_tables = describe_variables(data, variables_to_analyze, t)
+            if len(desc_table):
+                st.dataframe(desc_table.rename(columns=descriptive_labels()).style.format(precision=3), use_container_width=True)
+            # render every variable's charts up front so they spread over the worker pool
+            render_charts([(kind, spec, col) for col, specs in chart_specs.items() for kind, spec in specs.items()], lang)
+
+            for col in variables_to_analyze:
+                st.markdown("<div class='content-box'>", unsafe_allow_html=True)
+                st.markdown(f"### 📌 {t('variable')}: {col}")
+                series = data[col]
+
+                if col in desc_table.index:
+                    desc = desc_table.loc[col]
+                    
+                    st.markdown("<div class='stats-card'>", unsafe_allow_html=True)
+                    col1, col2, col3, col4 = st.columns(4)
+                    with col1:
+                        st.metric(f"📊 {t('count')}", f"{int(desc['count'])}")
+                        st.metric(f"📈 {t('mean')}", f"{desc['mean']:.2f}")
+                    with col2:
+                        st.metric(f"🎯 {t('median')}", f"{desc['median']:.2f}")
+                        st.metric(f"📉 {t('min')}", f"{desc['min']:.2f}")
+                    with col3:
+                        st.metric(f"📊 {t('std_dev')}", f"{desc['std']:.2f}")
+                        st.metric(f"📈 {t('max')}", f"{desc['max']:.2f}")
+                    with col4:
+                        st.metric(f"🔄 {t('variance')}", f"{desc['var']:.2f}")
+                        st.metric(f"📏 {t('range')}", f"{desc['range']:.2f}")
+                    st.markdown("</div>", unsafe_allow_html=True)
+                    
+                    st.markdown("<br>", unsafe_allow_html=True)
+
+                    chart_col1, chart_col2 = st.columns(2)
+                    with chart_col1:
+                        st.image(get_chart('hist', chart_specs[col]['hist'], col, lang).image, use_container_width=True)
+                    with chart_col2:
+                        st.image(get_chart('box', chart_specs[col]['box'], col, lang).image, use_container_width=True)
+
+                    st.markdown(f"""
+                    <div class="interpretation-box">
+                    <h4 style="color: #1565c0; margin-top: 0;">🔍 {t('key_insights')}</h4>
+                    <ul style="margin: 0; padding-left: 1.5rem; line-height: 1.8;">
+                        <li><strong>{t('central_tendency')}:</strong> {t('mean')} = {desc['mean']:.2f}, {t('median')} = {desc['median']:.2f}</li>
+                        <li><strong>{t('spread')}:</strong> {t('std_dev')} = {desc['std']:.2f}</li>
+                        <li><strong>{t('range')}:</strong> {desc['min']:.2f} to {desc['max']:.2f}</li>
+                    </ul>
+                    </div>
+                    """, unsafe_allow_html=True)
+
+                    if is_likert(series):
+                        st.markdown(f"""
+                        <div class="interpretation-box" style="border-left-color: #9c27b0; background: linear-gradient(135deg, #f3e5f5 0%, #fce4ec 100%);">
+                        <h4 style="color: #7b1fa2; margin-top: 0;">🎯 {t('likert_detected')}</h4>
+                        <p style="margin: 0;">{t('likert_text')}</p>
+                        </div>
+                        """, unsafe_allow_html=True)
+
+                st.markdown("<br>", unsafe_allow_html=True)
+                st.markdown(f"#### 📊 {t('frequency_dist')}")
+                freq = freq_tables[col]
+                
+                st.dataframe(freq.style.background_gradient(subset=[t('frequency')], cmap='Blues').format({t('percentage'): '{:.2f}%'}), use_container_width=True)
+                
+                st.image(get_chart('freq', chart_specs[col]['freq'], col, lang).image, use_container_width=True)
+
+                st.markdown("</div>", unsafe_allow_html=True)
+
+            reliability = reliability_analysis(data, composite_specs(x_items, y_items, create_total, scoring, extra_composites))
+            if reliability:
+                st.markdown("<br>", unsafe_allow_html=True)
+                st.markdown("<div class='content-box'>", unsafe_allow_html=True)
+                st.markdown(f"## 🧷 {t('reliability_analysis')}")
+                st.caption(t('reliability_desc'))
+                reliability_labels = {'mean': t('mean'), 'std': t('std_dev'), 'item_total_r': t('item_total_r'),
+                                      'alpha_if_deleted': t('alpha_if_deleted'), 'loading': t('factor_loading')}
+                for name, rel in reliability.items():
+                    st.markdown(f"### {name}")
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        st.markdown(f"<div class='metric-badge'>{t('cronbach_alpha')}: {format_reliability(rel.alpha, t(f'alpha_{reliability_level(rel.alpha)}'))}</div>", unsafe_allow_html=True)
+                    with col2:
+                        st.markdown(f"<div class='metric-badge'>{t('mcdonald_omega')}: {format_reliability(rel.omega)}</div>", unsafe_allow_html=True)
+                    with col3:
+                        st.markdown(f"<div class='metric-badge'>{t('complete_responses')}: {rel.n:,}</div>", unsafe_allow_html=True)
+                    items_table = rel.items.rename(columns=reliability_labels).rename_axis(t('item'))
+                    st.dataframe(items_table.style.format('{:.3f}').background_gradient(subset=[t('item_total_r')], cmap='Blues'),
+                                 use_container_width=True)
+                st.markdown("</div>", unsafe_allow_html=True)
+
+            st.markdown("<br>", unsafe_allow_html=True)
+            st.markdown("<div class='content-box'>", unsafe_allow_html=True)
+            st.markdown(f"## 🧪 {t('normality_test')}")
+            
+            x_norm, y_norm = normality_of_totals(data, normality_strategy)
+
+            col1, col2 = st.columns(2)
+            with col1:
+                st.markdown(f"""
+                <div class="stats-card" style="border-left-color: {'#4caf50' if x_norm.normal else '#f44336'};">
+                    <h4 style="color: #1565c0; margin-top: 0;">X_total</h4>
+                    <p style="font-size: 1.8rem; font-weight: bold; color: {'#4caf50' if x_norm.normal else '#f44336'}; margin: 0.5rem 0;">{format_statistic(x_norm)}</p>
+                    <p style="margin: 0; color: #666;">{'✅ ' + t('normal') if x_norm.normal else '❌ ' + t('non_normal')} · {t(f'norm_{x_norm.test}')}</p>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col2:
+                st.markdown(f"""
+                <div class="stats-card" style="border-left-color: {'#4caf50' if y_norm.normal else '#f44336'};">
+                    <h4 style="color: #1565c0; margin-top: 0;">Y_total</h4>
+                    <p style="font-size: 1.8rem; font-weight: bold; color: {'#4caf50' if y_norm.normal else '#f44336'}; margin: 0.5rem 0;">{format_statistic(y_norm)}</p>
+                    <p style="margin: 0; color: #666;">{'✅ ' + t('normal') if y_norm.normal else '❌ ' + t('non_normal')} · {t(f'norm_{y_norm.test}')}</p>
+                </div>
+                """, unsafe_allow_html=True)
+
+            method_name = t('pearson') if (x_norm.normal and y_norm.normal) else t('spearman_rank')
+            st.markdown(f"""
+            <div class="interpretation-box">
+            <p style="margin: 0; padding: 1rem; background: rgba(30, 136, 229, 0.1); border-radius: 8px; font-weight: 600;">📊 <strong>{t('method')}: {method_name}</strong></p>
+            </div>
+            """, unsafe_allow_html=True)
+            st.markdown("</div>", unsafe_allow_html=True)
+
+            st.markdown("<br>", unsafe_allow_html=True)
+            st.markdown("<div class='content-box'>", unsafe_allow_html=True)
+            st.markdown(f"## 🔗 {t('association')}")
+
+            perm_progress = perm_cancel = None
+            if permutation_mode:
+                perm_bar = st.progress(0.0, text=t('permutation_running'))
+                perm_stop = st.empty()
+                perm_stop.button(f"⏹️ {t('permutation_stop')}", key="permutation_stop", on_click=stop_permutation)
+                perm_progress = lambda done: perm_bar.progress(min(done, 1.0), text=t('permutation_running'))
+                perm_cancel = lambda: st.session_state.get('permutation_cancel', False)
+            association = associate(data, x_norm, y_norm, t, permutation_mode, bootstrap_replicates, progress=perm_progress,
+                                    cancel=perm_cancel, checkpoint=st.session_state.setdefault('permutation_checkpoint', {}))
+            if permutation_mode:
+                perm_bar.empty()
+                perm_stop.empty()
+            corr_method, method, r, p, p_asymptotic, perm, ci, ci_level, strength, direction, scatter_spec, n_pairs = association
+
+            st.markdown(f"""
+            <div class="stats-card" style="border-left-color: #9c27b0;">
+                <h4 style="color: #7b1fa2; margin-top: 0;">📐 {method}</h4>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            st.markdown("<br>", unsafe_allow_html=True)
+
+            st.image(get_chart('scatter', scatter_spec, "X_total|Y_total", lang).image, use_container_width=True)
+            if scatter_spec['mode'] == 'hist2d':
+                st.caption(t('scatter_hist2d_note').format(n=f"{n_pairs:,}"))
+            elif scatter_spec['mode'] == 'sample':
+                st.caption(t('scatter_sample_note').format(shown=f"{len(scatter_spec['x']):,}", n=f"{n_pairs:,}"))
+
+            st.markdown("<br>", unsafe_allow_html=True)
+            col1, col2, col3, col4 = st.columns(4)
+            
+            with col1:
+                st.markdown(f"""
+                <div class="stats-card" style="text-align: center;">
+                    <h5 style="color: #666; margin: 0;">{t('coefficient')}</h5>
+                    <p style="font-size: 2rem; font-weight: bold; color: #1e88e5; margin: 0.5rem 0;">{r:.3f}</p>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col2:
+                st.markdown(f"""
+                <div class="stats-card" style="text-align: center;">
+                    <h5 style="color: #666; margin: 0;">{t('strength')}</h5>
+                    <p style="font-size: 1.3rem; font-weight: bold; color: #7b1fa2; margin: 0.5rem 0;">{strength}</p>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col3:
+                st.markdown(f"""
+                <div class="stats-card" style="text-align: center;">
+                    <h5 style="color: #666; margin: 0;">{t('direction')}</h5>
+                    <p style="font-size: 1.3rem; font-weight: bold; color: {'#4caf50' if r > 0 else '#f44336'}; margin: 0.5rem 0;">{direction}</p>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col4:
+                sig_text = t('yes') if p < 0.05 else t('no')
+                st.markdown(f"""
+                <div class="stats-card" style="text-align: center;">
+                    <h5 style="color: #666; margin: 0;">{t('significance')}</h5>
+                    <p style="font-size: 1.3rem; font-weight: bold; color: {'#4caf50' if p < 0.05 else '#f44336'}; margin: 0.5rem 0;">{sig_text}</p>
+                    <p style="font-size: 0.9rem; color: #666; margin: 0;">p = {p:.4f}</p>
+                </div>
+                """, unsafe_allow_html=True)
+
+            st.markdown(f"""
+            <div class="interpretation-box">
+            <h4 style="color: #1565c0; margin-top: 0;">🎯 {t('interpretation')}</h4>
+            <ul style="margin: 0; padding-left: 1.5rem; line-height: 1.8;">
+                <li>r = {r:.3f} → <strong>{strength.lower()}</strong> {t('relationship')}</li>
+                <li><strong>{direction}</strong> {t('correlation')}</li>
+                <li>p = {p:.4f} → {'<strong>' + t('significant') + '</strong>' if p < 0.05 else '<strong>' + t('not_significant') + '</strong>'}</li>
+                {f"<li>{t('p_permutation')}: {perm.p_value:.4f} ± {perm.mc_error:.4f} ({perm.permutations:,} {t('permutations')}, {t('perm_' + perm.status)}) · {t('p_asymptotic')}: {p_asymptotic:.4f}</li>" if perm else ""}
+                {f"<li>{ci_level} {t('ci_bca')}: <strong>[{ci.bca[0]:.3f}, {ci.bca[1]:.3f}]</strong> · {t('ci_percentile')}: [{ci.percentile[0]:.3f}, {ci.percentile[1]:.3f}] ({ci.replicates:,} {t('bootstrap_resamples')})</li>" if ci else ""}
+                <li><strong>{t('note')}:</strong> {t('causation_note')}</li>
+            </ul>
+            </div>
+            """, unsafe_allow_html=True)
+
+            st.markdown("</div>", unsafe_allow_html=True)
+
+            matrix_items = list(dict.fromkeys(x_items + y_items))
+            if corr_matrix_mode and len(matrix_items) > 1:
+                st.markdown("<br>", unsafe_allow_html=True)
+                st.markdown("<div class='content-box'>", unsafe_allow_html=True)
+                st.markdown(f"## 🧮 {t('corr_matrix')} ({method})")
+                matrix_progress = None
+                if permutation_mode:
+                    matrix_bar = st.progress(0.0, text=t('permutation_running'))
+                    matrix_progress = lambda done: matrix_bar.progress(min(done, 1.0), text=t('permutation_running'))
+                r_matrix, corr_pairs, matrix_spec = item_matrix(data, matrix_items, association, t, p_adjust, permutation_mode, matrix_progress)
+                if permutation_mode:
+                    matrix_bar.empty()
+
+                st.image(get_chart('corr_matrix', matrix_spec, "|".join(matrix_items), lang).image, use_container_width=True)
+
+                st.markdown(f"#### 🔗 {t('corr_pairs')}")
+                pair_labels = {'var_1': f"{t('variable')} 1", 'var_2': f"{t('variable')} 2", 'r': t('coefficient'), 'p': 'p-value', 'p_perm': t('p_permutation'), 'p_adj': t('p_adjusted'), 'n': 'n'}
+                st.dataframe(corr_pairs.head(1000).rename(columns=pair_labels).style.format(precision=4), use_container_width=True)
+                st.markdown("</div>", unsafe_allow_html=True)
+
+            groups = None
+            if split_by:
+                st.markdown("<br>", unsafe_allow_html=True)
+                st.markdown("<div class='content-box'>", unsafe_allow_html=True)
+                st.markdown(f"## 🧩 {t('group_analysis')}: {split_by}")
+                groups = split_analysis(data, split_by, variables_to_analyze, association, t, normality_strategy)
+                if groups.dropped:
+                    st.caption(t('group_dropped').format(rows=f"{groups.dropped:,}", levels=len(groups.levels)))
+
+                if groups.corr is not None:
+                    st.markdown(f"#### 🔗 {t('group_corr')} ({method})")
+                    group_table = groups.corr.rename(columns={'r': t('coefficient'), 'p': 'p-value', 'p_adj': t('p_adjusted')})
+                    group_table['X_total'] = [format_statistic(groups.normality[level][0]) for level in groups.levels]
+                    group_table['Y_total'] = [format_statistic(groups.normality[level][1]) for level in groups.levels]
+                    st.dataframe(group_table.style.format(precision=4), use_container_width=True)
+                    st.image(get_chart('group_scatter', groups.chart_specs['scatter'], split_by, lang).image, use_container_width=True)
+
+                for col in ("X_total", "Y_total"):
+                    if col in groups.chart_specs:
+                        st.image(get_chart('group_hist', groups.chart_specs[col], f"{split_by}|{col}", lang).image, use_container_width=True)
+
+                st.markdown(f"#### 📊 {t('group_desc')}")
+                st.dataframe(groups.desc.rename(columns=descriptive_labels()).style.format(precision=3), use_container_width=True)
+
+                for col, freq in groups.freq.items():
+                    with st.expander(f"{t('frequency_dist')}: {col}"):
+                        st.dataframe(freq, use_container_width=True)
+                st.markdown("</div>", unsafe_allow_html=True)
+
+            st.markdown("<br>", unsafe_allow_html=True)
+            st.markdown(f"""
+            <div class="content-box">
+            <h2 style="color: #1565c0;">🎓 {t('conclusion')}</h2>
+            <div class="stats-card" style="border-left-color: #4caf50;">
+                <h4 style="color: #2e7d32; margin-top: 0;">✅ {t('key_findings')}</h4>
+                <ul style="margin: 0; padding-left: 1.5rem; line-height: 1.8; color: #333;">
+                    <li>{t('finding_1')}</li>
+                    <li>{t('finding_2')}</li>
+                    <li>{t('finding_3')}</li>
+                    <li>{t('finding_4')}</li>
+                </ul>
+            </div>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            st.markdown("<br><br>", unsafe_allow_html=True)
+            st.markdown("<div class='content-box'>", unsafe_allow_html=True)
+            st.markdown(f"## 📄 {t('pdf_download_btn').split('(')[0]}")
+            
+            report_ctx = report_context(data, lang, x_items, y_items, variables_to_analyze, desc_table, chart_specs, freq_tables,
+                                        x_norm, y_norm, association, groups, reliability=reliability)
+            report_section(fingerprint(report_ctx), report_ctx)
+            
+            st.markdown("</div>", unsafe_allow_html=True)
+
+
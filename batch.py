@@ -0,0 +1,139 @@
+import json
+import os
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, wait
+
+import pandas as pd
+
+from engine import analyze_file
+from pools import SpawnPool
+
+BATCH_WORKERS = int(os.environ.get("ANALYSIS_BATCH_WORKERS", min(os.cpu_count() or 1, 4)))
+BATCH_MEMORY_BYTES = int(os.environ.get("ANALYSIS_BATCH_MEMORY_MB", "2048")) * 1024 * 1024
+BATCH_TASKS_PER_WORKER = int(os.environ.get("ANALYSIS_BATCH_TASKS_PER_WORKER", "8"))
+BATCH_EXTENSIONS = (".csv", ".xlsx", ".xls")
+# peak memory while analyzing a file, as a multiple of its size on disk; workbooks are compressed
+MEMORY_FACTOR = {".csv": 4, ".xlsx": 20, ".xls": 8}
+SELECTION_KEYS = ("x_vars", "y_vars", "create_total", "scoring", "composites")
+SUMMARY_COLUMNS = ["file", "status", "n", "method", "r", "p", "ci_low", "ci_high", "strength", "direction", "seconds", "pdf", "error"]
+
+
+def batch_paths(folder):
+    """Data files directly inside ``folder``, in name order"""
+    return sorted(os.path.join(folder, name) for name in os.listdir(folder)
+                  if name.lower().endswith(BATCH_EXTENSIONS) and not name.startswith("~$"))
+
+
+def output_names(paths):
+    """A distinct output name per path: the file's stem, with its extension and then a counter added where stems clash"""
+    stems = [os.path.splitext(os.path.basename(path))[0] for path in paths]
+    clashes = Counter(stem.lower() for stem in stems)
+    names, taken = [], set()
+    for path, stem in zip(paths, stems):
+        name = stem if clashes[stem.lower()] == 1 else f"{stem}_{os.path.splitext(path)[1].lstrip('.').lower()}"
+        base, copy = name, 1
+        # output files are compared case-insensitively, as some filesystems do
+        while name.lower() in taken:
+            copy += 1
+            name = f"{base}_{copy}"
+        taken.add(name.lower())
+        names.append(name)
+    return names
+
+
+def estimate_memory(path):
+    """Rough peak memory for analyzing ``path``, used to bound how many files run at once"""
+    ext = os.path.splitext(path)[1].lower()
+    return os.path.getsize(path) * MEMORY_FACTOR.get(ext, 4)
+
+
+def load_selection(path):
+    """A saved variable selection: JSON with x_vars, y_vars and optionally create_total, scoring and composites"""
+    with open(path, encoding="utf-8") as f:
+        selection = json.load(f)
+    missing = [key for key in SELECTION_KEYS[:2] if key not in selection]
+    if missing:
+        raise ValueError(f"{path}: selection is missing {', '.join(missing)}")
+    return {'x_vars': list(selection['x_vars']), 'y_vars': list(selection['y_vars']),
+            'create_total': bool(selection.get('create_total', True)),
+            'scoring': dict(selection.get('scoring') or {}), 'composites': list(selection.get('composites') or [])}
+
+
+def _init_batch_worker():
+    import charts
+    import ingest
+    # each file is read once, so keeping parsed frames and charts around only costs memory
+    ingest._parse_cache.max_bytes = 0
+    charts._figure_cache.max_bytes = 0
+    charts.apply_theme()
+
+
+def _analyze(path, name, selection, out_dir, lang, options):
+    summary = analyze_file(path, selection['x_vars'], selection['y_vars'], out_dir, lang=lang, name=name,
+                           create_total=selection['create_total'], scoring=selection.get('scoring'),
+                           composites=selection.get('composites', ()), **options)
+    return _summary_row(path, summary)
+
+
+def _summary_row(path, summary=None, error=None):
+    row = dict.fromkeys(SUMMARY_COLUMNS)
+    row['file'] = os.path.basename(path)
+    if summary is None:
+        row['status'], row['error'] = "failed", str(error)
+        return row
+    association = summary['association']
+    ci = association['ci'] or {}
+    row.update(status="ok", n=summary['n'], method=association['method'], r=association['r'], p=association['p'],
+               ci_low=ci.get('bca', [None, None])[0], ci_high=ci.get('bca', [None, None])[1],
+               strength=association['strength'], direction=association['direction'],
+               seconds=sum(summary['timings'].values()), pdf=summary.get('pdf'))
+    return row
+
+
+def run_batch(paths, selection, out_dir, lang="en", workers=BATCH_WORKERS, memory_bytes=BATCH_MEMORY_BYTES,
+              progress=None, **options):
+    """Analyze every file with one variable selection and return the summary table.
+
+    Each file gets its own JSON and PDF in ``out_dir``, named by
+    output_names so that files with the same stem do not overwrite each
+    other; the summary is also written there as summary.csv. Files run in a pool of ``workers``
+    processes, and a file only starts while the estimated memory of the
+    files in flight stays within ``memory_bytes``. When the next file in
+    line does not fit, smaller files behind it start instead, and a file
+    larger than the whole budget runs once nothing else is in flight. A
+    failing file becomes a "failed" row rather than stopping the batch.
+    ``progress(done, total)`` is called as files finish.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    rows = [None] * len(paths)
+    names = output_names(paths)
+    pending = [(i, path, estimate_memory(path)) for i, path in enumerate(paths)]
+    in_flight = {}
+    used = 0
+    workers = max(1, min(workers, len(paths)))
+    with SpawnPool(workers, initializer=_init_batch_worker,
+                   max_tasks_per_child=BATCH_TASKS_PER_WORKER) as pool:
+        while pending or in_flight:
+            for job in list(pending):
+                if len(in_flight) >= workers:
+                    break
+                i, path, size = job
+                if in_flight and used + size > memory_bytes:
+                    continue
+                pending.remove(job)
+                future = pool.submit(_analyze, path, names[i], selection, out_dir, lang, options)
+                in_flight[future] = (i, path, size)
+                used += size
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                i, path, size = in_flight.pop(future)
+                used -= size
+                try:
+                    rows[i] = future.result()
+                except Exception as e:
+                    rows[i] = _summary_row(path, error=e)
+                if progress is not None:
+                    progress(sum(row is not None for row in rows), len(rows))
+    summary = pd.DataFrame(rows, columns=SUMMARY_COLUMNS)
+    summary.to_csv(os.path.join(out_dir, "summary.csv"), index=False)
+    return summary
@@ -0,0 +1,263 @@
+"""Time every analysis stage on synthetic surveys of growing size, so slowdowns are caught.
+
+    python benchmark.py --rows 1000 100000 1000000 --out bench.json
+    python benchmark.py --rows 1000 100000 --baseline bench.json
+
+For each size a synthetic questionnaire (see synthetic.py) is written to
+CSV. The stages then run in the order the Analysis tab runs them: ingest
+(parse and store), reload (from the Arrow store), composites,
+frequencies, descriptives, reliability, normality, association, matrix,
+groups, charts and pdf. Caches are emptied before every size, so each
+stage runs cold and computes its own part once. For example, descriptives
+reuses the frequency tables the frequencies stage just built.
+
+Each stage records its wall time and peak memory. Peak memory is the
+highest resident set size sampled while the stage ran, minus the size at
+its start. With --tracemalloc it is the peak of Python and NumPy
+allocations instead, which is exact but slower. When charts render in
+worker processes (more than one RENDER_WORKERS), their memory is not
+counted.
+
+--out writes the results as JSON. With --baseline, any stage that is more
+than --tolerance slower than in the baseline, and at least --min-seconds
+slower, is reported, and the exit status is 1.
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+
+import charts
+import ingest
+import memo
+import normality
+from charts import apply_theme, get_chart, render_charts
+from correlation import BOOTSTRAP_REPLICATES
+from engine import (associate, build_composites, composite_specs, describe_variables, freq_table, item_matrix,
+                    normality_of_totals, reliability_analysis, report_context, split_analysis)
+from ingest import LocalFile, load_dataset
+from report import build_report
+from synthetic import SCALES, write_likert_csv
+from translations import translator
+
+STAGES = ("ingest", "reload", "composites", "frequencies", "descriptives", "reliability", "normality", "association",
+          "matrix", "groups", "charts", "pdf")
+SAMPLE_SECONDS = 0.01
+
+
+def _rss():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return 0
+
+
+class StageMeter:
+    """Wall time and peak memory of consecutive stages"""
+
+    def __init__(self, traced=False):
+        self.traced = traced
+        self.stages = {}
+
+    @contextmanager
+    def stage(self, name):
+        stop = threading.Event()
+        start_bytes = peak = 0
+        if self.traced:
+            tracemalloc.reset_peak()
+            start_bytes = tracemalloc.get_traced_memory()[0]
+        else:
+            start_bytes = peak = _rss()
+
+            def sample():
+                nonlocal peak
+                while not stop.wait(SAMPLE_SECONDS):
+                    peak = max(peak, _rss())
+
+            sampler = threading.Thread(target=sample, daemon=True)
+            sampler.start()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - started
+            if self.traced:
+                peak = tracemalloc.get_traced_memory()[1]
+            else:
+                stop.set()
+                sampler.join()
+                peak = max(peak, _rss())
+            self.stages[name] = {"seconds": round(seconds, 4), "peak_mb": round(max(peak - start_bytes, 0) / 2**20, 1)}
+
+
+def _clear_caches():
+    ingest._parse_cache.clear()
+    memo._results.clear()
+    charts._figure_cache.clear()
+    with normality._cache_lock:
+        normality._cache.clear()
+
+
+def _dataset(rows, data_dir, seed, generator):
+    name = "survey-{}-{}.csv".format(rows, "-".join(f"{key}{value}" for key, value in sorted({**generator, 'seed': seed}.items())))
+    path = os.path.join(data_dir, name)
+    if not os.path.exists(path):
+        write_likert_csv(path, rows, seed=seed, **generator)
+    return path
+
+
+def run_size(rows, path, items, bootstrap_replicates, permutation, pdf, traced):
+    """Run every stage once over the CSV at ``path``; returns the stage timings of this size"""
+    t = translator("en")
+    x_items, y_items = [f"{SCALES[0]}{i + 1}" for i in range(items)], [f"{SCALES[1]}{i + 1}" for i in range(items)]
+    _clear_caches()
+    meter = StageMeter(traced)
+
+    with meter.stage("ingest"):
+        data = load_dataset(LocalFile(path))
+    ingest._parse_cache.clear()
+    with meter.stage("reload"):
+        data = load_dataset(LocalFile(path))
+    with meter.stage("composites"):
+        data, variables = build_composites(data, x_items, y_items, keep=["region"])
+    with meter.stage("frequencies"):
+        for col in variables:
+            freq_table(data[col], t)
+    with meter.stage("descriptives"):
+        desc_table, chart_specs, freq_tables = describe_variables(data, variables, t)
+    specs = composite_specs(x_items, y_items)
+    with meter.stage("reliability"):
+        reliability = reliability_analysis(data, specs)
+    with meter.stage("normality"):
+        x_norm, y_norm = normality_of_totals(data)
+    with meter.stage("association"):
+        association = associate(data, x_norm, y_norm, t, permutation, bootstrap_replicates)
+    with meter.stage("matrix"):
+        item_matrix(data, x_items + y_items, association, t, "fdr_bh", permutation)
+    with meter.stage("groups"):
+        groups = split_analysis(data, "region", variables, association, t)
+    with meter.stage("charts"):
+        render_charts([(kind, spec, col) for col, col_specs in chart_specs.items() for kind, spec in col_specs.items()], "en")
+        get_chart("scatter", association.scatter_spec, "X_total|Y_total", "en")
+        get_chart("group_scatter", groups.chart_specs["scatter"], "region", "en")
+        for col in ("X_total", "Y_total"):
+            get_chart("group_hist", groups.chart_specs[col], f"region|{col}", "en")
+    if pdf:
+        ctx = report_context(data, "en", x_items, y_items, variables, desc_table, chart_specs, freq_tables, x_norm, y_norm,
+                             association, groups, specs, reliability)
+        with meter.stage("pdf"):
+            os.remove(build_report(ctx, t))
+    return meter.stages
+
+
+def _commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=os.path.dirname(os.path.abspath(__file__)),
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmark(sizes, items=5, levels=5, missing=0.05, loading=0.7, scale_corr=0.5, seed=0,
+                  bootstrap_replicates=BOOTSTRAP_REPLICATES, permutation=False, pdf=True, traced=False, data_dir=None,
+                  progress=None):
+    """Stage timings for every size in ``sizes``, with the settings needed to compare runs"""
+    generator = {'items': items, 'levels': levels, 'missing': missing, 'loading': loading, 'scale_corr': scale_corr}
+    work_dir = tempfile.mkdtemp(prefix="benchmark-")
+    store_dir, ingest.STORE_DIR = ingest.STORE_DIR, os.path.join(work_dir, "store")
+    if data_dir:
+        os.makedirs(data_dir, exist_ok=True)
+    if traced:
+        tracemalloc.start()
+    apply_theme()
+    runs = []
+    try:
+        for rows in sizes:
+            path = _dataset(rows, data_dir or work_dir, seed, generator)
+            stages = run_size(rows, path, items, bootstrap_replicates, permutation, pdf, traced)
+            runs.append({"rows": rows, "file_mb": round(os.path.getsize(path) / 2**20, 1), "stages": stages,
+                         "total_seconds": round(sum(stage["seconds"] for stage in stages.values()), 4)})
+            if progress is not None:
+                progress(runs[-1])
+    finally:
+        ingest.STORE_DIR = store_dir
+        if traced:
+            tracemalloc.stop()
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return {
+        "created": datetime.now().isoformat(timespec="seconds"), "commit": _commit(), "python": sys.version.split()[0],
+        "platform": platform.platform(), "cpus": os.cpu_count(), "render_workers": charts.RENDER_WORKERS, "memory": "tracemalloc" if traced else "rss",
+        "options": {**generator, 'seed': seed, 'bootstrap_replicates': bootstrap_replicates, 'permutation': permutation, 'pdf': pdf},
+        "runs": runs,
+    }
+
+
+def regressions(result, baseline, tolerance, min_seconds):
+    """Messages for every stage of ``result`` that is slower than the same stage and size in ``baseline``"""
+    found = []
+    if result["options"] != baseline["options"]:
+        found.append("options differ from the baseline, timings are not comparable")
+    before = {run["rows"]: run["stages"] for run in baseline["runs"]}
+    for run in result["runs"]:
+        for stage, stats in run["stages"].items():
+            old = before.get(run["rows"], {}).get(stage)
+            if old and stats["seconds"] > old["seconds"] * (1 + tolerance) and stats["seconds"] - old["seconds"] >= min_seconds:
+                found.append(f"{run['rows']:,} rows {stage}: {stats['seconds']:.3f}s, baseline {old['seconds']:.3f}s")
+    return found
+
+
+def _print_run(run):
+    print(f"{run['rows']:,} rows ({run['file_mb']} MB CSV)")
+    for stage, stats in run["stages"].items():
+        print(f"  {stage:<13} {stats['seconds']:9.3f} s {stats['peak_mb']:9.1f} MB")
+    print(f"  {'total':<13} {run['total_seconds']:9.3f} s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Wall time and peak memory of every analysis stage on synthetic surveys.")
+    parser.add_argument("--rows", nargs="+", type=int, default=[1_000, 100_000], metavar="N", help="survey sizes (default: 1000 100000)")
+    parser.add_argument("--items", type=int, default=5, help="items per scale (default: 5)")
+    parser.add_argument("--levels", type=int, default=5, help="answer levels (default: 5)")
+    parser.add_argument("--missing", type=float, default=0.05, help="share of missing answers (default: 0.05)")
+    parser.add_argument("--loading", type=float, default=0.7, help="average item loading on its scale (default: 0.7)")
+    parser.add_argument("--scale-corr", type=float, default=0.5, help="correlation between the X and Y scales (default: 0.5)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--bootstrap", type=int, default=BOOTSTRAP_REPLICATES, metavar="N", help="bootstrap replicates, 0 to skip")
+    parser.add_argument("--permutation", action="store_true", help="use permutation p-values")
+    parser.add_argument("--no-pdf", action="store_true", help="skip the PDF stage")
+    parser.add_argument("--tracemalloc", action="store_true", help="measure Python/NumPy allocations instead of resident memory")
+    parser.add_argument("--data-dir", help="keep the generated CSVs here and reuse them in later runs")
+    parser.add_argument("--out", metavar="JSON", help="write the results here")
+    parser.add_argument("--baseline", metavar="JSON", help="compare against an earlier --out file")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown against the baseline (default: 0.25)")
+    parser.add_argument("--min-seconds", type=float, default=0.05, help="ignore slowdowns smaller than this (default: 0.05)")
+    args = parser.parse_args(argv)
+
+    result = run_benchmark(args.rows, items=args.items, levels=args.levels, missing=args.missing, loading=args.loading,
+                           scale_corr=args.scale_corr, seed=args.seed, bootstrap_replicates=args.bootstrap,
+                           permutation=args.permutation, pdf=not args.no_pdf, traced=args.tracemalloc,
+                           data_dir=args.data_dir, progress=_print_run)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+    problems = []
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            problems = regressions(result, json.load(f), args.tolerance, args.min_seconds)
+    for problem in problems:
+        print(f"regression: {problem}", file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
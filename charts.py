@@ -0,0 +1,342 @@
+import atexit
+import hashlib
+import os
+import threading
+from collections import namedtuple
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+from matplotlib import colormaps, rcParams
+from matplotlib.colors import LogNorm
+from matplotlib.figure import Figure
+
+from ingest import ParseCache
+from pools import SpawnPool
+
+CHART_DPI = 200
+FIGURE_CACHE_BYTES = int(os.environ.get("ANALYSIS_FIGURE_CACHE_MB", "256")) * 1024 * 1024
+RENDER_WORKERS = int(os.environ.get("ANALYSIS_RENDER_WORKERS", "0")) or os.cpu_count() or 1
+RENDER_PARALLEL_MIN_JOBS = 6
+SCATTER_MAX_POINTS = int(os.environ.get("ANALYSIS_SCATTER_MAX_POINTS", "20000"))
+SCATTER_LARGE_MODE = os.environ.get("ANALYSIS_SCATTER_MODE", "hist2d")
+SCATTER_BINS = 100
+SCATTER_SEED = 0
+
+ChartArtifact = namedtuple("ChartArtifact", "image spec")
+
+
+_theme_applied = False
+
+
+def apply_theme():
+    """Set the global chart style; only the first call in a process does any work"""
+    global _theme_applied
+    if _theme_applied:
+        return
+    import seaborn as sns
+    sns.set_theme(style="whitegrid", palette=["#1e88e5", "#42a5f5", "#90caf9"])
+    rcParams['figure.facecolor'] = 'white'
+    rcParams['axes.facecolor'] = '#f8f9ff'
+    _theme_applied = True
+
+
+class FigureCache(ParseCache):
+    """LRU cache of rendered charts bounded by the size of their image bytes and specs"""
+
+    @staticmethod
+    def sizeof(artifact):
+        arrays = [v for v in artifact.spec.values() if isinstance(v, np.ndarray)]
+        return len(artifact.image) + sum(a.nbytes for a in arrays)
+
+
+_figure_cache = FigureCache(FIGURE_CACHE_BYTES)
+
+
+def _despine(ax, left=False):
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+    if left:
+        ax.spines['left'].set_visible(False)
+
+
+def _hist(spec):
+    fig = Figure(figsize=(7, 3.5))
+    ax = fig.subplots()
+    ax.hist(spec["edges"][:-1], bins=spec["edges"], weights=spec["counts"], alpha=0.75, color='#1e88e5', edgecolor='white', linewidth=1.5)
+    ax.axvline(spec["mean"], color='#d32f2f', linestyle='--', linewidth=2.5, label=f'{spec["mean_label"]}: {spec["mean"]:.2f}')
+    ax.axvline(spec["median"], color='#388e3c', linestyle='--', linewidth=2.5, label=f'{spec["median_label"]}: {spec["median"]:.2f}')
+    ax.set_title(spec["title"], fontsize=13, fontweight='bold', pad=12)
+    ax.set_xlabel(spec["xlabel"], fontsize=11, fontweight='bold')
+    ax.set_ylabel(spec["ylabel"], fontsize=11, fontweight='bold')
+    ax.legend(loc='upper right', framealpha=0.95, fontsize=10)
+    ax.grid(True, alpha=0.3, linestyle='--')
+    _despine(ax)
+    return fig
+
+
+def _box(spec):
+    fig = Figure(figsize=(7, 3.5))
+    ax = fig.subplots()
+    ax.bxp([spec["stats"]], vert=False, patch_artist=True,
+           boxprops=dict(facecolor='#90caf9', edgecolor='#1565c0', linewidth=2),
+           whiskerprops=dict(color='#1565c0', linewidth=2),
+           capprops=dict(color='#1565c0', linewidth=2),
+           medianprops=dict(color='#d32f2f', linewidth=3),
+           flierprops=dict(marker='o', markerfacecolor='#ff6b6b', markersize=8, markeredgecolor='white'))
+    ax.set_title(spec["title"], fontsize=13, fontweight='bold', pad=12)
+    ax.set_xlabel(spec["xlabel"], fontsize=11, fontweight='bold')
+    ax.grid(True, alpha=0.3, linestyle='--', axis='x')
+    _despine(ax, left=True)
+    return fig
+
+
+def _freq(spec):
+    fig = Figure(figsize=(10, 4))
+    ax = fig.subplots()
+    counts, percentages = spec["counts"], spec["percentages"]
+    bars = ax.bar(range(len(counts)), counts, color=colormaps['Blues'](np.linspace(0.4, 0.8, len(counts))), edgecolor='white', linewidth=1.5)
+    ax.set_xticks(range(len(counts)))
+    ax.set_xticklabels(spec["categories"], rotation=45, ha='right')
+    ax.set_title(spec["title"], fontsize=14, fontweight='bold', pad=15)
+    ax.set_xlabel(spec["xlabel"], fontsize=12, fontweight='bold')
+    ax.set_ylabel(spec["ylabel"], fontsize=12, fontweight='bold')
+    ax.grid(True, alpha=0.3, linestyle='--', axis='y')
+    _despine(ax)
+    for bar, pct in zip(bars, percentages):
+        height = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width() / 2., height, f'{int(height)}\n({pct:.1f}%)', ha='center', va='bottom', fontsize=9, fontweight='bold')
+    return fig
+
+
+def _grid_edges(values, bins=SCATTER_BINS):
+    """One bin per value for integer data such as Likert composites, else ``bins`` equal-width bins"""
+    low, high = values.min(), values.max()
+    if np.array_equal(values, np.round(values)) and high - low < 2 * bins:
+        return np.arange(low - 0.5, high + 1.5)
+    return np.linspace(low, high if high > low else low + 1, bins + 1)
+
+
+def _stratified_sample(x_cell, y_cell, counts, max_points, seed):
+    """Row indices keeping each 2-D cell's share of the rows, and at least one row of every occupied cell"""
+    cell = x_cell * counts.shape[1] + y_cell
+    order = np.random.default_rng(seed).permutation(len(cell))
+    by_cell = np.argsort(cell[order], kind="stable")
+    sorted_cells = cell[order][by_cell]
+    rank = np.arange(len(cell)) - np.searchsorted(sorted_cells, sorted_cells)
+    quota = np.maximum(1, np.round(counts.ravel() * (max_points / len(cell))))
+    return np.sort(order[by_cell][rank < quota[sorted_cells]])
+
+
+def scatter_layer(x, y, max_points=SCATTER_MAX_POINTS, mode=SCATTER_LARGE_MODE, seed=SCATTER_SEED):
+    """What the association scatter draws, as part of its chart spec.
+
+    Up to ``max_points`` rows every point is drawn. Above that the rows are
+    binned once with NumPy and either drawn as a 2-D histogram ("hist2d") or
+    thinned to a stratified sample of about ``max_points`` rows ("sample").
+    Trend lines are fitted by the caller on the full data either way.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if len(x) <= max_points:
+        return {"mode": "points", "x": x, "y": y}
+    x_edges, y_edges = _grid_edges(x), _grid_edges(y)
+    x_cell = np.clip(np.searchsorted(x_edges, x, side="right") - 1, 0, len(x_edges) - 2)
+    y_cell = np.clip(np.searchsorted(y_edges, y, side="right") - 1, 0, len(y_edges) - 2)
+    counts = np.zeros((len(x_edges) - 1, len(y_edges) - 1), dtype=np.int64)
+    np.add.at(counts, (x_cell, y_cell), 1)
+    if mode == "sample":
+        keep = _stratified_sample(x_cell, y_cell, counts, max_points, seed)
+        return {"mode": "sample", "x": x[keep], "y": y[keep], "n_total": len(x)}
+    return {"mode": "hist2d", "counts": counts, "x_edges": x_edges, "y_edges": y_edges}
+
+
+def _scatter(spec):
+    fig = Figure(figsize=(7, 5))
+    ax = fig.subplots()
+    if spec["mode"] == "hist2d":
+        counts = np.ma.masked_equal(spec["counts"].T, 0)
+        layer = ax.pcolormesh(spec["x_edges"], spec["y_edges"], counts, cmap='viridis', norm=LogNorm(vmin=1, vmax=max(counts.max(), 2)))
+        color_label = spec["count_label"]
+    else:
+        # thinned samples use smaller, fainter markers so the density still reads
+        small = spec["mode"] == "sample" or len(spec["x"]) > 2000
+        layer = ax.scatter(spec["x"], spec["y"], c=spec["y"], cmap='viridis', alpha=0.35 if small else 0.6,
+                           s=12 if small else 80, edgecolors='white', linewidth=0 if small else 1)
+        color_label = spec["ylabel"]
+    x_line = np.linspace(spec["x_range"][0], spec["x_range"][1], 100)
+    ax.plot(x_line, spec["slope"] * x_line + spec["intercept"], "r--", linewidth=3, alpha=0.8, label=spec["trend_label"])
+    ax.set_xlabel(spec["xlabel"], fontsize=12, fontweight='bold')
+    ax.set_ylabel(spec["ylabel"], fontsize=12, fontweight='bold')
+    ax.set_title(spec["title"], fontsize=13, fontweight='bold', pad=15)
+    ax.legend(fontsize=10, loc='best', framealpha=0.95)
+    ax.grid(True, alpha=0.3, linestyle='--')
+    _despine(ax)
+    cbar = fig.colorbar(layer, ax=ax)
+    cbar.set_label(color_label, fontsize=10, fontweight='bold')
+    return fig
+
+
+def _corr_matrix(spec):
+    import seaborn as sns
+    r = spec["r"]
+    size = min(max(6, 0.45 * len(r)), 30)
+    fig = Figure(figsize=(size, size * 0.8))
+    ax = fig.subplots()
+    sns.heatmap(r, ax=ax, cmap='RdBu_r', vmin=-1, vmax=1, center=0, square=True,
+                annot=len(r) <= 15, fmt='.2f', linewidths=0.5 if len(r) <= 40 else 0,
+                cbar_kws={'label': spec["cbar_label"]})
+    ax.set_title(spec["title"], fontsize=14, fontweight='bold', pad=15)
+    return fig
+
+
+def _panel_grid(n_panels, width=3.2, height=2.6, max_cols=4):
+    cols = min(n_panels, max_cols)
+    rows = -(-n_panels // cols)
+    fig = Figure(figsize=(width * cols, height * rows + 0.6))
+    axes = np.atleast_1d(fig.subplots(rows, cols, sharex=True, sharey=True, squeeze=False)).ravel()
+    for ax in axes[n_panels:]:
+        ax.set_visible(False)
+    return fig, axes[:n_panels]
+
+
+def _group_hist(spec):
+    """Small multiples: one histogram of the same variable per group, on shared bins and axes"""
+    fig, axes = _panel_grid(len(spec["labels"]))
+    edges = spec["edges"]
+    for ax, label, counts, mean in zip(axes, spec["labels"], spec["counts"], spec["means"]):
+        ax.hist(edges[:-1], bins=edges, weights=counts, alpha=0.75, color='#1e88e5', edgecolor='white', linewidth=1)
+        ax.axvline(mean, color='#d32f2f', linestyle='--', linewidth=1.5, label=f'{spec["mean_label"]}: {mean:.2f}')
+        ax.set_title(f'{label} (n = {int(counts.sum())})', fontsize=10, fontweight='bold')
+        ax.legend(loc='upper right', fontsize=8, framealpha=0.9)
+        ax.grid(True, alpha=0.3, linestyle='--')
+        _despine(ax)
+    fig.suptitle(spec["title"], fontsize=13, fontweight='bold')
+    fig.supxlabel(spec["xlabel"], fontsize=10)
+    return fig
+
+
+def _group_scatter(spec):
+    """Small multiples: X against Y with its trend line in each group"""
+    fig, axes = _panel_grid(len(spec["labels"]))
+    starts = spec["starts"]
+    for g, ax in enumerate(axes):
+        x, y = spec["x"][starts[g]:starts[g + 1]], spec["y"][starts[g]:starts[g + 1]]
+        ax.scatter(x, y, s=8 if len(x) > 500 else 20, alpha=0.35 if len(x) > 500 else 0.6, color='#1e88e5', linewidth=0)
+        x_line = np.linspace(spec["x_min"][g], spec["x_max"][g], 50)
+        ax.plot(x_line, spec["slopes"][g] * x_line + spec["intercepts"][g], "r--", linewidth=1.5)
+        ax.set_title(f'{spec["labels"][g]}: r = {spec["r"][g]:.3f}', fontsize=10, fontweight='bold')
+        ax.grid(True, alpha=0.3, linestyle='--')
+        _despine(ax)
+    fig.suptitle(spec["title"], fontsize=13, fontweight='bold')
+    fig.supxlabel(spec["xlabel"], fontsize=10)
+    fig.supylabel(spec["ylabel"], fontsize=10)
+    return fig
+
+
+RENDERERS = {"hist": _hist, "box": _box, "freq": _freq, "scatter": _scatter, "corr_matrix": _corr_matrix,
+             "group_hist": _group_hist, "group_scatter": _group_scatter}
+
+
+def render_chart(kind, spec, dpi=CHART_DPI, fmt="png"):
+    """Draw one chart off-screen and return its image bytes (PNG, or SVG for vector output)"""
+    fig = RENDERERS[kind](spec)
+    fig.tight_layout()
+    buffer = BytesIO()
+    fig.savefig(buffer, format=fmt, dpi=dpi, bbox_inches="tight")
+    return buffer.getvalue()
+
+
+def _update_digest(h, value):
+    if isinstance(value, dict):
+        for name in sorted(value):
+            h.update(name.encode())
+            _update_digest(h, value[name])
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _update_digest(h, item)
+    elif isinstance(value, pd.DataFrame):
+        _update_digest(h, [list(value.index), list(value.columns), value.to_numpy()])
+    elif isinstance(value, np.ndarray) and value.dtype != object:
+        h.update(str((value.dtype, value.shape)).encode())
+        h.update(np.ascontiguousarray(value).view(np.uint8))
+    elif isinstance(value, np.ndarray):
+        _update_digest(h, value.tolist())
+    else:
+        h.update(repr(value).encode())
+
+
+def fingerprint(value):
+    """Content hash of nested dicts, sequences, arrays, frames and scalars"""
+    h = hashlib.blake2b(digest_size=16)
+    _update_digest(h, value)
+    return h.hexdigest()
+
+
+def chart_key(kind, spec, column="", lang="en", dpi=CHART_DPI, fmt="png"):
+    """(dataset hash, column, kind, language, dpi, format) for one chart.
+
+    The spec holds the data the chart is drawn from (values, bins, quartiles)
+    plus its labels, so its digest stands in for the dataset hash and also
+    changes when a label that is not language-driven does.
+    """
+    return fingerprint(spec), column, kind, lang, dpi, fmt
+
+
+def get_chart(kind, spec, column="", lang="en", dpi=CHART_DPI, fmt="png"):
+    """Rendered chart for ``spec``, drawn at most once while it stays in the cache"""
+    key = chart_key(kind, spec, column, lang, dpi, fmt)
+    artifact = _figure_cache.get(key)
+    if artifact is None:
+        artifact = ChartArtifact(render_chart(kind, spec, dpi, fmt), spec)
+        _figure_cache.put(key, artifact)
+    return artifact
+
+
+_render_pool = None
+_render_pool_lock = threading.Lock()
+
+
+def _init_render_worker():
+    import matplotlib
+    matplotlib.use("Agg")
+    apply_theme()
+
+
+def _shutdown_render_pool():
+    if _render_pool is not None:
+        _render_pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _get_render_pool():
+    """Worker pool kept for the life of the server, so interpreter and matplotlib start-up is paid once"""
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is None:
+            _render_pool = SpawnPool(RENDER_WORKERS, initializer=_init_render_worker)
+            atexit.register(_shutdown_render_pool)
+        return _render_pool
+
+
+def render_charts(jobs, lang="en", dpi=CHART_DPI):
+    """Artifacts for a list of (kind, spec, column) jobs, in the order given.
+
+    Cached charts are returned as is; the rest are rendered in a pool of
+    Agg-backend worker processes when there are at least
+    RENDER_PARALLEL_MIN_JOBS of them and more than one worker, otherwise in
+    this process. Each worker receives only the job's spec, so the data sent
+    is bins, quartiles and counts rather than the dataset.
+    """
+    keys = [chart_key(kind, spec, column, lang, dpi) for kind, spec, column in jobs]
+    artifacts = [_figure_cache.get(key) for key in keys]
+    missing = [i for i, artifact in enumerate(artifacts) if artifact is None]
+    if len(missing) >= RENDER_PARALLEL_MIN_JOBS and RENDER_WORKERS > 1:
+        kinds = [jobs[i][0] for i in missing]
+        specs = [jobs[i][1] for i in missing]
+        images = _get_render_pool().map(render_chart, kinds, specs, [dpi] * len(missing))
+    else:
+        images = (render_chart(jobs[i][0], jobs[i][1], dpi) for i in missing)
+    for i, png in zip(missing, images):
+        artifacts[i] = ChartArtifact(png, jobs[i][1])
+        _figure_cache.put(keys[i], artifacts[i])
+    return artifacts
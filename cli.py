@@ -0,0 +1,95 @@
+"""Run the analysis on CSV/Excel files without Streamlit.
+
+    python cli.py survey.csv --x X1 X2 X3 --y Y1 Y2 --out results/
+
+writes ``results/survey.json`` (statistics and per-stage timings) and
+``results/survey.pdf``. Several files or a folder run as a batch in a
+process pool and also write ``results/summary.csv``:
+
+    python cli.py regions/ --selection selection.json --out results/
+"""
+import argparse
+import os
+import sys
+
+from batch import BATCH_WORKERS, batch_paths, load_selection, run_batch
+from charts import apply_theme
+from composites import COMPOSITE_METHODS, parse_composite, parse_weights
+from correlation import BOOTSTRAP_REPLICATES, P_ADJUST_METHODS
+from engine import analyze_file
+from normality import STRATEGIES as NORMALITY_STRATEGIES
+from translations import translations
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Descriptive, normality and association analysis of survey items.")
+    parser.add_argument("paths", nargs="+", metavar="PATH", help="CSV or Excel files, or folders of them")
+    parser.add_argument("--x", nargs="+", metavar="ITEM", help="items summed into X_total")
+    parser.add_argument("--y", nargs="+", metavar="ITEM", help="items summed into Y_total")
+    parser.add_argument("--selection", metavar="JSON", help="saved selection with x_vars, y_vars and create_total")
+    parser.add_argument("--no-composite", action="store_true", help="do not create X_total/Y_total")
+    parser.add_argument("--score", choices=COMPOSITE_METHODS, default="sum", help="how items combine into composites (default: sum)")
+    parser.add_argument("--weight", nargs="+", default=[], metavar="ITEM=W", help="item weights for --score weighted")
+    parser.add_argument("--reverse", nargs="+", default=[], metavar="ITEM", help="reverse-coded items")
+    parser.add_argument("--scale", nargs=2, type=float, default=(1, None), metavar=("MIN", "MAX"), help="answer scale, needed for --reverse")
+    parser.add_argument("--min-answered", type=int, metavar="N", help="answered items needed for a score; sums are prorated")
+    parser.add_argument("--composite", action="append", default=[], metavar="NAME=ITEM,ITEM",
+                        help="an extra named composite, scored like X_total/Y_total; repeatable")
+    parser.add_argument("--sheet", nargs="+", metavar="NAME", help="workbook sheets to read (default: the first)")
+    parser.add_argument("--out", default=".", help="output directory (default: current directory)")
+    parser.add_argument("--lang", choices=sorted(translations), default="en", help="report language")
+    parser.add_argument("--normality", choices=NORMALITY_STRATEGIES, default="auto", help="normality test strategy")
+    parser.add_argument("--matrix", action="store_true", help="add the item correlation matrix")
+    parser.add_argument("--p-adjust", choices=P_ADJUST_METHODS, default="fdr_bh", help="multiple-comparison adjustment for the matrix")
+    parser.add_argument("--permutation", action="store_true", help="use permutation p-values")
+    parser.add_argument("--split-by", metavar="COLUMN", help="also analyze every level of this column (region, gender, ...)")
+    parser.add_argument("--bootstrap", type=int, default=BOOTSTRAP_REPLICATES, metavar="N", help="bootstrap replicates for the CI, 0 to skip")
+    parser.add_argument("--no-pdf", action="store_true", help="write only the JSON results")
+    parser.add_argument("--workers", type=int, default=BATCH_WORKERS, help="files analyzed at once in a batch")
+    args = parser.parse_args(argv)
+    if args.selection is None and not (args.x and args.y):
+        parser.error("give --x and --y, or --selection")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    try:
+        if args.selection:
+            selection = load_selection(args.selection)
+        else:
+            selection = {'x_vars': args.x, 'y_vars': args.y, 'create_total': not args.no_composite,
+                         'scoring': {'method': args.score, 'weights': parse_weights(args.weight), 'reverse': args.reverse,
+                                     'scale_min': args.scale[0], 'scale_max': args.scale[1], 'min_answered': args.min_answered},
+                         'composites': []}
+        selection['composites'] = selection['composites'] + [parse_composite(text) for text in args.composite]
+        paths = [p for path in args.paths for p in (batch_paths(path) if os.path.isdir(path) else [path])]
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    options = dict(sheets=args.sheet, pdf=not args.no_pdf, normality_strategy=args.normality, corr_matrix=args.matrix,
+                   p_adjust=args.p_adjust, permutation=args.permutation, bootstrap_replicates=args.bootstrap,
+                   split_by=args.split_by)
+
+    if len(paths) > 1 or os.path.isdir(args.paths[0]):
+        summary = run_batch(paths, selection, args.out, lang=args.lang, workers=args.workers,
+                            progress=lambda done, total: print(f"{done}/{total} files", file=sys.stderr), **options)
+        print(summary.drop(columns=["pdf"]).to_string(index=False))
+        return 0 if (summary["status"] == "ok").all() else 1
+
+    apply_theme()
+    try:
+        summary = analyze_file(paths[0], selection['x_vars'], selection['y_vars'], args.out, lang=args.lang,
+                               create_total=selection['create_total'], scoring=selection['scoring'],
+                               composites=selection['composites'], **options)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    association = summary['association']
+    print(f"{paths[0]}: n = {summary['n']}, {association['method']} r = {association['r']:.4f}, p = {association['p']:.4g}, "
+          f"{sum(summary['timings'].values()):.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+COMPOSITE_METHODS = ("sum", "mean", "weighted")
+
+Composite = namedtuple("Composite", "name items method weights reverse scale_min scale_max min_answered")
+
+
+def composite(name, items, method="sum", weights=None, reverse=(), scale_min=1, scale_max=None, min_answered=None):
+    """A validated composite score definition.
+
+    ``method`` is "sum", "mean" or "weighted" (the mean of the answered items
+    weighted by ``weights``, a mapping of item to weight that defaults to 1).
+    Items in ``reverse`` are scored as scale_min + scale_max - answer, so
+    they need ``scale_max``. ``min_answered`` is the number of items a
+    respondent must answer to get a score: means use the answered items
+    only, and sums are prorated to the full item count. Without it a sum
+    counts missing answers as zero and a mean needs one answer; it is
+    capped at the composite's item count.
+    ``weights`` and ``reverse`` may name items of other composites, so one
+    set of scoring options can be shared by several composites.
+    """
+    items = tuple(dict.fromkeys(items))
+    if not items:
+        raise ValueError(f"composite {name} has no items")
+    if method not in COMPOSITE_METHODS:
+        raise ValueError(f"composite {name}: unknown method {method!r}, expected one of {', '.join(COMPOSITE_METHODS)}")
+    weights = weights or {}
+    item_weights = tuple(float(weights.get(item, 1.0)) if method == "weighted" else 1.0 for item in items)
+    if any(w < 0 for w in item_weights) or not any(item_weights):
+        raise ValueError(f"composite {name}: weights must be non-negative and not all zero")
+    reverse = tuple(item for item in items if item in set(reverse))
+    if reverse and scale_max is None:
+        raise ValueError(f"composite {name}: reverse-coded items need the scale maximum")
+    if min_answered is not None:
+        if min_answered < 1:
+            raise ValueError(f"composite {name}: min_answered must be at least 1")
+        min_answered = min(int(min_answered), len(items))
+    return Composite(name, items, method, item_weights, reverse, scale_min, scale_max, min_answered)
+
+
+def parse_composite(text):
+    """{"name", "items"} of an extra composite written as "NAME=ITEM,ITEM" """
+    name, sep, items = text.partition("=")
+    items = [item.strip() for item in items.split(",") if item.strip()]
+    if not sep or not name.strip() or not items:
+        raise ValueError(f"composite {text!r} should look like NAME=ITEM,ITEM")
+    return {'name': name.strip(), 'items': items}
+
+
+def parse_weights(pairs):
+    """{item: weight} from "ITEM=W" strings"""
+    weights = {}
+    for pair in pairs:
+        item, _, weight = pair.rpartition("=")
+        try:
+            weights[item.strip()] = float(weight)
+        except ValueError:
+            item = ""
+        if not item.strip():
+            raise ValueError(f"weight {pair!r} should look like ITEM=W")
+    return weights
+
+
+def item_block(data, items):
+    """The item columns as one float64 matrix, non-numeric answers as NaN"""
+    dtypes = [data[item].dtype for item in items]
+    if all(isinstance(dtype, np.dtype) and pd.api.types.is_numeric_dtype(dtype) for dtype in dtypes):
+        return data[items].to_numpy(dtype=np.float64)
+    if all(pd.api.types.is_numeric_dtype(dtype) for dtype in dtypes):
+        return data[items].to_numpy(dtype=np.float64, na_value=np.nan)
+    return data[items].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def score_composites(data, composites):
+    """{name: float64 scores} for every composite, from one pass over the union of their items.
+
+    Each composite is a column of an items x composites weight matrix, and
+    reverse coding is folded into it: a reversed item contributes
+    w * (scale_min + scale_max) for every answer minus w * answer. The
+    totals of all composites are one matrix product over the answers, and
+    the totals, answered counts and answered weights of respondents with
+    missing answers are corrected by products over their missing mask only.
+    """
+    items = list(dict.fromkeys(item for c in composites for item in c.items))
+    column = {item: i for i, item in enumerate(items)}
+    block = item_block(data, items)
+    missing = np.isnan(block)
+    gaps = np.flatnonzero(missing.any(axis=1))
+    if len(gaps):
+        if block.flags.writeable:
+            block[missing] = 0.0
+        else:
+            block = np.where(missing, 0.0, block)
+    missing = missing[gaps].astype(np.float64)
+
+    signed = np.zeros((len(items), len(composites)))
+    offset = np.zeros((len(items), len(composites)))
+    weight = np.zeros((len(items), len(composites)))
+    member = np.zeros((len(items), len(composites)))
+    for k, c in enumerate(composites):
+        rows = [column[item] for item in c.items]
+        reversed_items = np.isin(c.items, c.reverse)
+        weight[rows, k] = c.weights
+        member[rows, k] = 1.0
+        signed[rows, k] = np.where(reversed_items, -1.0, 1.0) * c.weights
+        if c.reverse:
+            offset[rows, k] = np.where(reversed_items, c.scale_min + c.scale_max, 0.0) * c.weights
+
+    totals = block @ signed + offset.sum(axis=0)
+    n_answered = np.tile(member.sum(axis=0), (len(block), 1))
+    weight_answered = np.tile(weight.sum(axis=0), (len(block), 1))
+    totals[gaps] -= missing @ offset
+    n_answered[gaps] -= missing @ member
+    weight_answered[gaps] -= missing @ weight
+
+    scores = {}
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for k, c in enumerate(composites):
+            total, n, w = totals[:, k], n_answered[:, k], weight_answered[:, k]
+            if c.method == "sum" and c.min_answered is None:
+                score = total
+            elif c.method == "sum":
+                # prorated: the mean of the answered items times the number of items
+                score = total / w * weight[:, k].sum()
+            else:
+                score = total / w
+            threshold = c.min_answered if c.min_answered is not None else (0 if c.method == "sum" else 1)
+            scores[c.name] = np.where(n >= threshold, score, np.nan)
+    return scores
@@ -0,0 +1,531 @@
+import math
+import os
+from collections import namedtuple
+from itertools import islice, permutations, repeat
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from pools import SpawnPool
+
+P_ADJUST_METHODS = ("none", "fdr_bh", "bonferroni")
+# Spearman pairs of columns with at most this many distinct values are re-ranked from value-code counts
+SPEARMAN_CODE_LEVELS = 128
+SPEARMAN_CODE_WIDTH = 2048
+SPEARMAN_BATCH_ELEMENTS = 4_000_000
+BOOTSTRAP_REPLICATES = 2000
+BOOTSTRAP_SEED = 0
+BOOTSTRAP_CHUNK = 500
+BOOTSTRAP_BATCH_ELEMENTS = 4_000_000
+BOOTSTRAP_PARALLEL_MIN_REPLICATES = 10_000
+BOOTSTRAP_PARALLEL_MIN_WORK = 200_000_000
+
+PERMUTATION_MAX = 100_000
+PERMUTATION_MIN = 1_000
+PERMUTATION_TARGET_SE = 0.002
+PERMUTATION_SEED = 0
+PERMUTATION_CHUNK = 2_000
+PERMUTATION_ROUND_CHUNKS = 8
+PERMUTATION_PARALLEL_MIN_WORK = 50_000_000
+
+BootstrapCI = namedtuple("BootstrapCI", "estimate percentile bca replicates confidence")
+PermutationResult = namedtuple("PermutationResult", "p_value mc_error permutations exact status")
+
+
+def rank_columns(values):
+    """Average ranks of each column on its own observed values; NaN stays NaN"""
+    return stats.rankdata(values, axis=0, nan_policy="omit")
+
+
+def _pairwise_pearson(values):
+    """Pearson r and pairwise-complete n for every column pair via a handful of matrix products"""
+    observed = ~np.isnan(values)
+    if observed.all():
+        n = np.full((values.shape[1], values.shape[1]), len(values), dtype=np.float64)
+        z = values - values.mean(axis=0)
+        z /= np.sqrt((z * z).sum(axis=0))
+        return z.T @ z, n
+
+    mask = observed.astype(np.float64)
+    x = np.where(observed, values, 0.0)
+    n = mask.T @ mask
+    # sums over the rows where both columns of a pair are observed
+    sum_x = x.T @ mask
+    sum_xx = (x * x).T @ mask
+    sum_xy = x.T @ x
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cov = sum_xy - sum_x * sum_x.T / n
+        var = sum_xx - sum_x * sum_x / n
+        return cov / np.sqrt(var * var.T), n
+
+
+def _value_codes(values, observed):
+    """Index of every observed value among its column's distinct values (-1 where missing), and their number"""
+    codes = np.full(values.shape, -1, dtype=np.int64)
+    levels = np.zeros(values.shape[1], dtype=np.int64)
+    for j in range(values.shape[1]):
+        distinct, codes[observed[:, j], j] = np.unique(values[observed[:, j], j], return_inverse=True)
+        levels[j] = len(distinct)
+    return codes, levels
+
+
+def _code_indicator(codes, offsets, width):
+    """0/1 (rows x width) matrix with a 1 at offset + code for every observed value of every column"""
+    rows, cols = np.nonzero(codes >= 0)
+    indicator = np.zeros((len(codes), width))
+    indicator[rows, offsets[cols] + codes[rows, cols]] = 1.0
+    return indicator
+
+
+def _coded_spearman(observed, codes, levels, n):
+    """Spearman r of every column pair ranked within the pair's complete rows, for columns with few distinct values.
+
+    Within the rows a partner also observes, the average rank of each value
+    follows from how often every value occurs there, so one product of the
+    value indicators with the observed mask ranks every column against every
+    partner. The products of two columns' indicators count how often each
+    pair of values occurs together, which gives the rank covariance of every
+    pair. Ranks are centred on the pair's mean rank before they are
+    multiplied, and columns are processed in groups of at most
+    SPEARMAN_CODE_WIDTH values, over row blocks of SPEARMAN_BATCH_ELEMENTS.
+    """
+    n_rows, k = codes.shape
+    mask = observed.astype(np.float64)
+    groups, start, width = [], 0, 0
+    for j in range(k):
+        if width and width + levels[j] > SPEARMAN_CODE_WIDTH:
+            groups.append(np.arange(start, j))
+            start, width = j, 0
+        width += levels[j]
+    groups.append(np.arange(start, k))
+
+    coded = []
+    for group in groups:
+        offsets = np.concatenate([[0], np.cumsum(levels[group])[:-1]]).astype(np.int64)
+        width = int(levels[group].sum())
+        owner = np.repeat(np.arange(len(group)), levels[group])
+        step = max(1, SPEARMAN_BATCH_ELEMENTS // max(width, k))
+        counts = np.zeros((width, k))
+        for lo in range(0, n_rows, step):
+            counts += _code_indicator(codes[lo:lo + step, group], offsets, width).T @ mask[lo:lo + step]
+        # average rank of every value among the rows each partner observes, minus the pair's mean rank
+        below = np.cumsum(counts, axis=0) - counts
+        below -= np.concatenate([np.zeros((1, k)), np.cumsum(counts, axis=0)])[offsets][owner]
+        ranks = below + (counts + 1) / 2 - (n[group][owner] + 1) / 2
+        var = np.add.reduceat(ranks * ranks * counts, offsets, axis=0) if width else np.zeros((len(group), k))
+        coded.append((group, offsets, width, owner, ranks, var))
+
+    cov, var = np.zeros((k, k)), np.zeros((k, k))
+    for g, (group, offsets, width, owner, ranks, group_var) in enumerate(coded):
+        var[group] = group_var
+        for other, other_offsets, other_width, other_owner, other_ranks, _ in coded[g:]:
+            if not width or not other_width:
+                continue
+            step = max(1, SPEARMAN_BATCH_ELEMENTS // (width + other_width))
+            together = np.zeros((width, other_width))
+            for lo in range(0, n_rows, step):
+                together += (_code_indicator(codes[lo:lo + step, group], offsets, width).T
+                             @ _code_indicator(codes[lo:lo + step, other], other_offsets, other_width))
+            products = ranks[:, other][:, other_owner] * together * other_ranks[:, group][:, owner].T
+            block = np.add.reduceat(np.add.reduceat(products, offsets, axis=0), other_offsets, axis=1)
+            cov[np.ix_(group, other)] = block
+            cov[np.ix_(other, group)] = block.T
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return cov / np.sqrt(var * var.T)
+
+
+def _pairwise_spearman(values):
+    """Spearman r and pairwise-complete n for every column pair, ranked within each pair's complete rows.
+
+    Columns are ranked once on their own observed values, which is exact for
+    pairs missing on the same rows. When missing rows differ, columns with at
+    most SPEARMAN_CODE_LEVELS distinct values (Likert items, counts) are
+    re-ranked all at once from value-code counts (see _coded_spearman), and
+    the remaining pairs one by one, so every r matches scipy.stats.spearmanr
+    on the complete pairs.
+    """
+    r, n = _pairwise_pearson(rank_columns(values))
+    answered = np.diag(n)
+    differ = (n != answered[:, None]) | (n != answered[None, :])
+    if not differ.any():
+        return r, n
+    observed = ~np.isnan(values)
+    codes, levels = _value_codes(values, observed)
+    few = np.flatnonzero(levels <= SPEARMAN_CODE_LEVELS)
+    if len(few) > 1:
+        pairs = np.ix_(few, few)
+        r[pairs] = np.where(differ[pairs], _coded_spearman(observed[:, few], codes[:, few], levels[few], n[pairs]), r[pairs])
+    many = levels > SPEARMAN_CODE_LEVELS
+    for i, j in zip(*np.nonzero(np.triu(differ & (many[:, None] | many[None, :]), k=1))):
+        both = observed[:, i] & observed[:, j]
+        ranks = []
+        for col in (i, j):
+            col_codes = codes[both, col]
+            counts = np.bincount(col_codes)
+            # tied values share the average of the ranks they span
+            ranks.append((np.cumsum(counts) - (counts - 1) / 2)[col_codes])
+        r[i, j] = r[j, i] = _rowwise_r(ranks[0][None, :], ranks[1][None, :])[0]
+    return r, n
+
+
+def correlation_matrix(values, method="pearson"):
+    """(r, p, n) matrices for every pair of columns of a 2-D array.
+
+    Spearman ranks each column once and reuses the Pearson product, re-ranking
+    only the pairs whose missing rows differ (see _pairwise_spearman), so r
+    matches scipy's spearmanr on each pair's complete rows. p-values use the
+    same t distribution with n - 2 degrees of freedom as scipy's
+    pearsonr/spearmanr.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if method == "spearman":
+        r, n = _pairwise_spearman(values)
+    else:
+        r, n = _pairwise_pearson(values)
+    r = np.clip(r, -1.0, 1.0)
+    np.fill_diagonal(r, 1.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        dof = n - 2
+        t_stat = r * np.sqrt(dof / ((1.0 - r) * (1.0 + r)))
+        p = 2 * stats.t.sf(np.abs(t_stat), dof)
+    p = np.where(np.abs(r) == 1.0, 0.0, p)
+    p = np.where(dof > 0, p, np.nan)
+    return r, p, n.astype(np.int64)
+
+
+def adjust_pvalues(p, method="none"):
+    """Multiple-comparison adjustment of a 1-D array of p-values (NaN entries are left out)"""
+    p = np.asarray(p, dtype=np.float64)
+    if method == "none":
+        return p
+    adjusted = np.full_like(p, np.nan)
+    valid = ~np.isnan(p)
+    m = valid.sum()
+    if not m:
+        return adjusted
+    pv = p[valid]
+    if method == "bonferroni":
+        adjusted[valid] = np.minimum(pv * m, 1.0)
+    elif method == "fdr_bh":
+        order = np.argsort(pv)
+        scaled = pv[order] * m / np.arange(1, m + 1)
+        scaled = np.minimum.accumulate(scaled[::-1])[::-1]
+        out = np.empty(m)
+        out[order] = np.minimum(scaled, 1.0)
+        adjusted[valid] = out
+    else:
+        raise ValueError(f"Unknown p-value adjustment: {method}")
+    return adjusted
+
+
+def correlation_pairs(data, columns, method="pearson", p_adjust="none", permutation=None):
+    """Correlation matrix of ``columns`` plus a long table of each distinct pair.
+
+    ``permutation`` is None or a dict of ``permutation_matrix`` options; when
+    given, a p_perm column is added and the adjustment is applied to it instead
+    of the t-distribution p-value.
+
+    Returns (r matrix frame, pairs frame with r, p, adjusted p and n sorted by p).
+    """
+    columns = list(dict.fromkeys(columns))
+    values = data[columns].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    r, p, n = correlation_matrix(values, method)
+    upper_i, upper_j = np.triu_indices(len(columns), k=1)
+    labels = np.asarray(columns, dtype=object)
+    pairs = pd.DataFrame({
+        "var_1": labels[upper_i],
+        "var_2": labels[upper_j],
+        "r": r[upper_i, upper_j],
+        "p": p[upper_i, upper_j],
+    })
+    if permutation is not None:
+        pairs["p_perm"] = permutation_matrix(values, method, **permutation).p_value[upper_i, upper_j]
+    pairs["p_adj"] = adjust_pvalues(pairs["p_perm" if permutation is not None else "p"], p_adjust)
+    pairs["n"] = n[upper_i, upper_j]
+    pairs = pairs.sort_values("p_perm" if permutation is not None else "p", kind="stable", ignore_index=True)
+    return pd.DataFrame(r, index=columns, columns=columns), pairs
+
+
+def group_correlations(x, y, codes, levels, method="pearson", p_adjust="none"):
+    """r, p and n of x against y within every group, from segment sums over all rows at once.
+
+    ``codes`` gives each row's group as an index into ``levels``. Spearman
+    ranks each variable within its group in one grouped pass before the same
+    sums. p-values use the t distribution as in correlation_matrix, and
+    ``p_adjust`` corrects them across groups. Returns a frame indexed by level.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    codes = np.asarray(codes)
+    keep = ~(np.isnan(x) | np.isnan(y))
+    x, y, codes = x[keep], y[keep], codes[keep]
+    if method == "spearman":
+        x = pd.Series(x).groupby(codes).rank().to_numpy()
+        y = pd.Series(y).groupby(codes).rank().to_numpy()
+    k = len(levels)
+    n = np.bincount(codes, minlength=k).astype(np.float64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        dx = x - (np.bincount(codes, x, k) / n)[codes]
+        dy = y - (np.bincount(codes, y, k) / n)[codes]
+        r = np.bincount(codes, dx * dy, k) / np.sqrt(np.bincount(codes, dx * dx, k) * np.bincount(codes, dy * dy, k))
+        r = np.clip(r, -1.0, 1.0)
+        dof = n - 2
+        t_stat = r * np.sqrt(dof / ((1.0 - r) * (1.0 + r)))
+        p = 2 * stats.t.sf(np.abs(t_stat), dof)
+    p = np.where(np.abs(r) == 1.0, 0.0, p)
+    p = np.where(dof > 0, p, np.nan)
+    return pd.DataFrame({"n": n.astype(np.int64), "r": r, "p": p, "p_adj": adjust_pvalues(p, p_adjust)},
+                        index=pd.Index(levels, name="group"))
+
+
+def _paired(x, y):
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    keep = ~(np.isnan(x) | np.isnan(y))
+    return x[keep], y[keep]
+
+
+def _rowwise_r(xs, ys):
+    xs = xs - xs.mean(axis=1, keepdims=True)
+    ys = ys - ys.mean(axis=1, keepdims=True)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return (xs * ys).sum(axis=1) / np.sqrt((xs * xs).sum(axis=1) * (ys * ys).sum(axis=1))
+
+
+def _bootstrap_chunk(x, y, method, replicates, seed):
+    """r for ``replicates`` resamples drawn as (batch x n) index matrices; runs in worker processes"""
+    rng = np.random.default_rng(seed)
+    n = len(x)
+    batch = max(1, BOOTSTRAP_BATCH_ELEMENTS // n)
+    out = np.empty(replicates)
+    for start in range(0, replicates, batch):
+        stop = min(start + batch, replicates)
+        idx = rng.integers(0, n, size=(stop - start, n))
+        xs, ys = x[idx], y[idx]
+        if method == "spearman":
+            xs = stats.rankdata(xs, axis=1)
+            ys = stats.rankdata(ys, axis=1)
+        out[start:stop] = _rowwise_r(xs, ys)
+    return out
+
+
+def _jackknife_r(x, y):
+    """Leave-one-out Pearson r for every row at once from running sums"""
+    n = len(x) - 1
+    sx, sy = x.sum() - x, y.sum() - y
+    sxx, syy, sxy = (x * x).sum() - x * x, (y * y).sum() - y * y, (x * y).sum() - x * y
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return (n * sxy - sx * sy) / np.sqrt((n * sxx - sx * sx) * (n * syy - sy * sy))
+
+
+def bootstrap_ci(x, y, method="pearson", replicates=BOOTSTRAP_REPLICATES, confidence=0.95,
+                 seed=BOOTSTRAP_SEED, workers=None):
+    """Percentile and BCa bootstrap intervals for Pearson's r or Spearman's rho.
+
+    Replicates are split into fixed chunks of BOOTSTRAP_CHUNK, each with its own
+    seed spawned from ``seed``, so results are identical whether the chunks run
+    serially or in a process pool. The pool is used for large jobs
+    (BOOTSTRAP_PARALLEL_MIN_REPLICATES replicates and n * replicates above
+    BOOTSTRAP_PARALLEL_MIN_WORK) unless ``workers`` says otherwise. The BCa
+    acceleration comes from a closed-form jackknife; for Spearman it is taken
+    on the full-sample ranks instead of re-ranking each leave-one-out sample.
+    """
+    x, y = _paired(x, y)
+    if method == "spearman":
+        # re-ranking resampled ranks gives the same ranks as ranking resampled raw values
+        x, y = stats.rankdata(x), stats.rankdata(y)
+    estimate = _rowwise_r(x[None, :], y[None, :])[0]
+    if len(x) < 3 or np.isnan(estimate):
+        return BootstrapCI(estimate, (np.nan, np.nan), (np.nan, np.nan), 0, confidence)
+
+    sizes = [min(BOOTSTRAP_CHUNK, replicates - start) for start in range(0, replicates, BOOTSTRAP_CHUNK)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    if workers is None:
+        parallel = replicates >= BOOTSTRAP_PARALLEL_MIN_REPLICATES and len(x) * replicates >= BOOTSTRAP_PARALLEL_MIN_WORK
+        workers = (os.cpu_count() or 1) if parallel else 1
+    if workers > 1:
+        with SpawnPool(workers) as pool:
+            chunks = list(pool.map(_bootstrap_chunk, repeat(x), repeat(y), repeat(method), sizes, seeds))
+    else:
+        chunks = [_bootstrap_chunk(x, y, method, size, chunk_seed) for size, chunk_seed in zip(sizes, seeds)]
+    boot = np.concatenate(chunks)
+    boot = boot[~np.isnan(boot)]
+
+    alpha = (1 - confidence) / 2
+    percentile = tuple(np.quantile(boot, [alpha, 1 - alpha]))
+
+    jack = _jackknife_r(x, y)
+    jack = jack[~np.isnan(jack)]
+    diff = jack.mean() - jack
+    denom = 6 * (diff * diff).sum() ** 1.5
+    accel = (diff ** 3).sum() / denom if denom > 0 else 0.0
+    prop = np.clip((boot < estimate).mean() + 0.5 * (boot == estimate).mean(), 1 / (len(boot) + 1), 1 - 1 / (len(boot) + 1))
+    z0 = stats.norm.ppf(prop)
+    z = stats.norm.ppf([alpha, 1 - alpha])
+    adjusted = stats.norm.cdf(z0 + (z0 + z) / (1 - accel * (z0 + z)))
+    bca = tuple(np.quantile(boot, adjusted))
+
+    return BootstrapCI(estimate, percentile, bca, len(boot), confidence)
+
+
+def _permutation_inputs(values, method):
+    values = np.asarray(values, dtype=np.float64)
+    if method == "spearman":
+        values = rank_columns(values)
+    observed = ~np.isnan(values)
+    if observed.all():
+        z = values - values.mean(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            z /= np.sqrt((z * z).sum(axis=0))
+        return z, None
+    return np.where(observed, values, 0.0), observed.astype(np.float64)
+
+
+def _permuted_r(values, mask, idx):
+    """(b, k, k) correlations of the rows of ``values`` reordered by each row of ``idx`` against the original rows"""
+    if mask is None:
+        return np.matmul(values[idx].transpose(0, 2, 1), values)
+    xp, mp = values[idx].transpose(0, 2, 1), mask[idx].transpose(0, 2, 1)
+    n = mp @ mask
+    sum_x, sum_y = xp @ mask, mp @ values
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cov = xp @ values - sum_x * sum_y / n
+        var_x = (xp * xp) @ mask - sum_x * sum_x / n
+        var_y = mp @ (values * values) - sum_y * sum_y / n
+        return cov / np.sqrt(var_x * var_y)
+
+
+def _permutation_batch(n, k):
+    # each permutation holds an (n, k) copy of the data and (k, k) correlations; keep both within the budget
+    return max(1, BOOTSTRAP_BATCH_ELEMENTS // (n * k + k * k))
+
+
+def _permutation_chunk(values, mask, threshold, size, seed):
+    """How often |r| under ``size`` random row permutations reaches the observed |r|; runs in worker processes"""
+    rng = np.random.default_rng(seed)
+    n, k = values.shape
+    batch = _permutation_batch(n, k)
+    hits = np.zeros((k, k), dtype=np.int64)
+    for start in range(0, size, batch):
+        idx = rng.permuted(np.broadcast_to(np.arange(n), (min(batch, size - start), n)), axis=1)
+        hits += (np.abs(_permuted_r(values, mask, idx)) >= threshold).sum(axis=0)
+    return hits
+
+
+def _resume(checkpoint, threshold, seed):
+    """(hits, permutations done) saved by an interrupted run on the same data, or a fresh start"""
+    saved = checkpoint.get("threshold") if checkpoint else None
+    if (saved is not None and saved.shape == threshold.shape and checkpoint["seed"] == seed
+            and np.array_equal(saved, threshold, equal_nan=True)):
+        return checkpoint["hits"].copy(), checkpoint["done"]
+    return np.zeros(threshold.shape, dtype=np.int64), 0
+
+
+def _save(checkpoint, threshold, seed, hits, done):
+    if checkpoint is not None:
+        checkpoint.update(threshold=threshold, seed=seed, hits=hits.copy(), done=done)
+
+
+def _exact_counts(values, mask, threshold, total, progress, cancel, checkpoint):
+    n, k = values.shape
+    batch = _permutation_batch(n, k)
+    hits, done = _resume(checkpoint, threshold, None)
+    orders = islice(permutations(range(n)), done, None)
+    while done < total:
+        if cancel is not None and cancel():
+            return hits, done, "cancelled"
+        idx = np.array(list(islice(orders, batch)))
+        hits += (np.abs(_permuted_r(values, mask, idx)) >= threshold).sum(axis=0)
+        done += len(idx)
+        _save(checkpoint, threshold, None, hits, done)
+        if progress is not None:
+            progress(done / total)
+    return hits, done, "exact"
+
+
+def permutation_matrix(values, method="pearson", max_permutations=PERMUTATION_MAX, target_se=PERMUTATION_TARGET_SE,
+                       seed=PERMUTATION_SEED, workers=None, progress=None, cancel=None, checkpoint=None):
+    """Two-sided permutation p-values for every column pair of a 2-D array.
+
+    Columns are ranked once for Spearman (on each column's own observed
+    values, so with missing data a pair's permutation r can differ slightly
+    from correlation_matrix's pairwise-complete ranks), then rows of the whole
+    array are shuffled in vectorized blocks and every pair is scored from one batched
+    matrix product per block. Samples small enough that n! fits in
+    ``max_permutations`` are enumerated exactly. Otherwise work runs in rounds of
+    PERMUTATION_ROUND_CHUNKS chunks with seeds spawned from ``seed`` (spread over
+    a process pool for large jobs) and stops once the Monte-Carlo standard error
+    of every p-value is below ``target_se``. ``progress`` receives the fraction of
+    ``max_permutations`` done; ``cancel`` is polled between rounds and, when it
+    returns True, stops with the permutations drawn so far. ``checkpoint`` is
+    a dict that receives the counts after every round; passing it back on the
+    same data continues from there instead of starting over. Fewer than two
+    rows give NaN p-values with status "too_few".
+    """
+    n, k = np.shape(values)
+    if n < 2 or not k:
+        p = np.full((k, k), np.nan)
+        return PermutationResult(p, p.copy(), 0, False, "too_few")
+    values, mask = _permutation_inputs(values, method)
+    observed = _permuted_r(values, mask, np.arange(n)[None, :])[0]
+    # a permuted |r| equal to the observed one up to rounding counts as extreme
+    threshold = np.abs(observed) - 1e-12
+
+    if n <= 12 and math.factorial(n) <= max_permutations:
+        total = math.factorial(n)
+        hits, done, status = _exact_counts(values, mask, threshold, total, progress, cancel, checkpoint)
+        hits = np.triu(hits, 1) + np.triu(hits, 1).T
+        # a pair without an observed r (a constant column) has no p-value, not p = 0
+        p = np.where(np.isnan(observed) | (done == 0), np.nan, hits / max(done, 1))
+        np.fill_diagonal(p, 0.0)
+        return PermutationResult(p, np.where(np.isnan(p), np.nan, 0.0) if status == "exact" else np.sqrt(p * (1 - p) / max(done, 1)),
+                                 done, status == "exact", status)
+
+    if workers is None:
+        workers = (os.cpu_count() or 1) if n * k * k * max_permutations >= PERMUTATION_PARALLEL_MIN_WORK else 1
+    round_size = PERMUTATION_CHUNK * PERMUTATION_ROUND_CHUNKS
+    hits, done = _resume(checkpoint, threshold, seed)
+    status = "max"
+    # a resumed run skips the chunk seeds already drawn, so it continues the same sequence
+    seeds = islice(np.random.SeedSequence(seed).spawn(-(-max_permutations // PERMUTATION_CHUNK)), -(-done // PERMUTATION_CHUNK), None)
+    pool = SpawnPool(workers) if workers > 1 else None
+    try:
+        while done < max_permutations:
+            if cancel is not None and cancel():
+                status = "cancelled"
+                break
+            sizes = [min(PERMUTATION_CHUNK, max_permutations - start)
+                     for start in range(done, min(done + round_size, max_permutations), PERMUTATION_CHUNK)]
+            chunk_seeds = list(islice(seeds, len(sizes)))
+            if pool is not None:
+                counts = pool.map(_permutation_chunk, repeat(values), repeat(mask), repeat(threshold), sizes, chunk_seeds)
+            else:
+                counts = map(_permutation_chunk, repeat(values), repeat(mask), repeat(threshold), sizes, chunk_seeds)
+            for count in counts:
+                hits += count
+            done += sum(sizes)
+            _save(checkpoint, threshold, seed, hits, done)
+            if progress is not None:
+                progress(done / max_permutations)
+            p = (hits + 1) / (done + 1)
+            if done >= PERMUTATION_MIN and np.nanmax(np.sqrt(p * (1 - p) / done)) < target_se:
+                status = "converged"
+                break
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+    # the same shuffle scores (i, j) and (j, i) as different events; report the upper one for both
+    hits = np.triu(hits, 1) + np.triu(hits, 1).T
+    # (hits + 1) / (done + 1) never reports an impossible p = 0 from a finite sample
+    p = (hits + 1) / (done + 1)
+    p = np.where(np.isnan(observed) | (done == 0), np.nan, p)
+    np.fill_diagonal(p, 0.0)
+    return PermutationResult(p, np.sqrt(p * (1 - p) / max(done, 1)), done, False, status)
+
+
+def permutation_test(x, y, method="pearson", **options):
+    """Permutation p-value for one pair; same options and result as ``permutation_matrix``"""
+    x, y = _paired(x, y)
+    res = permutation_matrix(np.column_stack([x, y]), method, **options)
+    return res._replace(p_value=res.p_value[0, 1], mc_error=res.mc_error[0, 1])
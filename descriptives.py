@@ -0,0 +1,403 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+BLOCK_ELEMENTS = 4_000_000
+# frames with more rows are described chunk by chunk, with median and charts from quantile sketches
+STREAM_DESCRIBE_ROWS = int(os.environ.get("ANALYSIS_STREAM_DESCRIBE_ROWS", "2000000"))
+STREAM_CHUNK_ROWS = 100_000
+SKETCH_K = 200
+MAX_EXACT_VALUES = 1024
+HIST_BINS = 20
+MAX_FLIERS = 1000
+DESCRIPTIVE_FIELDS = ["count", "missing", "mean", "median", "std", "var", "min", "max", "range", "skew", "kurtosis"]
+
+
+def numeric_block(data, columns):
+    """Stack the given columns into one float64 (rows x columns) array with NaN for missing values"""
+    return data[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _moments(values):
+    """Per-column (n, mean, M2, M3, M4) where Mk is the sum of k-th powers of deviations"""
+    observed = ~np.isnan(values)
+    n = observed.sum(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.where(observed, values, 0.0).sum(axis=0) / n
+        dev = np.where(observed, values - mean, 0.0)
+        dev2 = dev * dev
+        return n, mean, dev2.sum(axis=0), (dev2 * dev).sum(axis=0), (dev2 * dev2).sum(axis=0)
+
+
+def _merge_moments(a, b):
+    """Combine two (n, mean, M2, M3, M4) summaries (Chan et al. / Pebay pairwise update)"""
+    na, mean_a, m2a, m3a, m4a = a
+    nb, mean_b, m2b, m3b, m4b = b
+    n = na + nb
+    with np.errstate(invalid="ignore", divide="ignore"):
+        delta = np.where(nb > 0, mean_b, 0.0) - np.where(na > 0, mean_a, 0.0)
+        delta = np.where((na > 0) & (nb > 0), delta, 0.0)
+        mean = np.where(na > 0, mean_a, 0.0) + delta * nb / n
+        mean = np.where(na == 0, mean_b, np.where(nb == 0, mean_a, mean))
+        m2 = m2a + m2b + delta ** 2 * na * nb / n
+        m3 = (m3a + m3b + delta ** 3 * na * nb * (na - nb) / n ** 2
+              + 3 * delta * (na * m2b - nb * m2a) / n)
+        m4 = (m4a + m4b + delta ** 4 * na * nb * (na * na - na * nb + nb * nb) / n ** 3
+              + 6 * delta ** 2 * (na * na * m2b + nb * nb * m2a) / n ** 2
+              + 4 * delta * (na * m3b - nb * m3a) / n)
+    zero = n == 0
+    return n, mean, np.where(zero, 0.0, m2), np.where(zero, 0.0, m3), np.where(zero, 0.0, m4)
+
+
+def _shape(n, total_m2, total_m3, total_m4):
+    """(var, skew, excess kurtosis) from summed central moments, using pandas' bias corrections"""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        m2, m3, m4 = total_m2 / n, total_m3 / n, total_m4 / n
+        var = np.where(n > 1, total_m2 / (n - 1), np.nan)
+        skew = np.sqrt(n * (n - 1)) / (n - 2) * m3 / m2 ** 1.5
+        kurtosis = (n - 1) / ((n - 2) * (n - 3)) * ((n + 1) * m4 / (m2 * m2) - 3 * (n - 1))
+        # constant columns have no defined shape; pandas reports 0 there
+        skew = np.where(n > 2, np.where(m2 == 0, 0.0, skew), np.nan)
+        kurtosis = np.where(n > 3, np.where(m2 == 0, 0.0, kurtosis), np.nan)
+    return var, skew, kurtosis
+
+
+def _sorted_quantiles(ordered, qs):
+    """Linear-interpolated quantiles (numpy's default method) of an already sorted array"""
+    positions = np.asarray(qs, dtype=np.float64) * (len(ordered) - 1)
+    lower = ordered[np.floor(positions).astype(np.int64)]
+    upper = ordered[np.ceil(positions).astype(np.int64)]
+    return lower + (upper - lower) * (positions - np.floor(positions))
+
+
+def chart_stats(ordered, bins=HIST_BINS, whis=1.5):
+    """(histogram counts and edges, boxplot statistics) of one column's sorted observed values.
+
+    The histogram matches np.histogram over [min, max] and the box statistics
+    are in the form matplotlib's Axes.bxp expects. Both come from binary
+    searches in the sorted values, so they cost no extra pass over the data.
+    Fliers are thinned evenly to at most MAX_FLIERS distinct values, keeping
+    the extremes.
+    """
+    n = len(ordered)
+    edges = np.histogram_bin_edges(ordered[[0, -1]] if n else ordered, bins=bins)
+    # bins are half-open except the last one, which also holds the maximum
+    counts = np.diff(np.concatenate([[0], np.searchsorted(ordered, edges[1:-1], side="left"), [n]]))
+    if not n:
+        return (counts, edges), {"med": np.nan, "q1": np.nan, "q3": np.nan, "whislo": np.nan, "whishi": np.nan,
+                                 "fliers": np.empty(0)}
+    q1, med, q3 = _sorted_quantiles(ordered, [0.25, 0.5, 0.75])
+    iqr = q3 - q1
+    low = np.searchsorted(ordered, q1 - whis * iqr, side="left")
+    high = np.searchsorted(ordered, q3 + whis * iqr, side="right")
+    whislo, whishi = (ordered[low], ordered[high - 1]) if low < high else (q1, q3)
+    fliers = _thin_fliers(np.unique(np.concatenate([ordered[:low], ordered[high:]])))
+    return (counts, edges), {"med": med, "q1": q1, "q3": q3, "whislo": whislo, "whishi": whishi, "fliers": fliers}
+
+
+def _thin_fliers(fliers):
+    # evenly spaced distinct fliers, always keeping the extremes
+    if len(fliers) > MAX_FLIERS:
+        fliers = fliers[np.unique(np.linspace(0, len(fliers) - 1, MAX_FLIERS).round().astype(np.int64))]
+    return fliers
+
+
+def _describe_chunk(values, charts=None):
+    n, mean, m2, m3, m4 = _moments(values)
+    var, skew, kurtosis = _shape(n, m2, m3, m4)
+
+    # one sort per column gives min, max and median; NaN sorts to the end
+    ordered = np.sort(values, axis=0)
+    cols = np.arange(values.shape[1])
+    last = np.maximum(n - 1, 0)
+    if len(values):
+        minimum = np.where(n > 0, ordered[0], np.nan)
+        maximum = np.where(n > 0, ordered[last, cols], np.nan)
+        median = np.where(n > 0, (ordered[last // 2, cols] + ordered[n // 2, cols]) / 2, np.nan)
+    else:
+        minimum = maximum = median = np.full(values.shape[1], np.nan)
+    if charts is not None:
+        charts.extend(chart_stats(ordered[:n[j], j]) for j in range(values.shape[1]))
+
+    return np.column_stack([n, len(values) - n, mean, median, np.sqrt(var), var,
+                            minimum, maximum, maximum - minimum, skew, kurtosis])
+
+
+def describe_block(values, columns, charts=None):
+    """Descriptive statistics for every column of a 2-D array using NaN-aware array reductions.
+
+    Returns a frame indexed by ``columns`` with DESCRIPTIVE_FIELDS. std/var use
+    ddof=1 and skew/kurtosis are the bias-corrected (excess) estimators, so
+    every figure matches what pandas reports for the same column. Columns are
+    processed in blocks of about BLOCK_ELEMENTS values to bound temporaries.
+    When ``charts`` is a list, the chart_stats of every column are appended to
+    it from the same sort that gives min, max and median.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim == 1:
+        values = values[:, None]
+    step = max(1, BLOCK_ELEMENTS // max(len(values), 1))
+    parts = [_describe_chunk(values[:, start:start + step], charts) for start in range(0, values.shape[1], step)]
+    table = pd.DataFrame(np.vstack(parts) if parts else np.empty((0, len(DESCRIPTIVE_FIELDS))),
+                         columns=DESCRIPTIVE_FIELDS, index=pd.Index(columns, name="variable"))
+    return table.astype({"count": np.int64, "missing": np.int64})
+
+
+def describe_columns(data, columns):
+    """describe_block over the numeric columns of a DataFrame"""
+    columns = [col for col in dict.fromkeys(columns) if col in data.columns and pd.api.types.is_numeric_dtype(data[col])]
+    return describe_block(numeric_block(data, columns), columns)
+
+
+def describe_with_charts(data, columns, chunk_rows=STREAM_CHUNK_ROWS):
+    """describe_columns plus {column: chart_stats}, all from one pass over the frame.
+
+    Frames longer than STREAM_DESCRIBE_ROWS are fed to a StreamingDescriptives
+    ``chunk_rows`` rows at a time, so only one chunk is ever converted to
+    float64 and no column is sorted as a whole; the median, histogram and box
+    then come from each column's QuantileSketch (exact for columns with few
+    distinct values, such as Likert items).
+    """
+    columns = [col for col in dict.fromkeys(columns) if col in data.columns and pd.api.types.is_numeric_dtype(data[col])]
+    if len(data) > STREAM_DESCRIBE_ROWS:
+        acc = describe_chunks((data.iloc[start:start + chunk_rows] for start in range(0, len(data), chunk_rows)), columns)
+        return acc.table(), acc.charts()
+    charts = []
+    table = describe_block(numeric_block(data, columns), columns, charts)
+    return table, dict(zip(columns, charts))
+
+
+def describe_groups(values, codes, levels, columns):
+    """describe_block for every group at once, from one pass over rows sorted by group.
+
+    ``codes`` gives each row's group as an index into ``levels`` (every level
+    must occur). Moments come from segment sums over the group-sorted rows and
+    min/median/max from one (group, value) sort per column, so the cost does
+    not grow with the number of groups. Returns a frame indexed by
+    (group, variable) with DESCRIPTIVE_FIELDS.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim == 1:
+        values = values[:, None]
+    codes = np.asarray(codes)
+    rows = np.bincount(codes, minlength=len(levels))
+    starts = np.concatenate([[0], np.cumsum(rows)[:-1]])
+    by_group = values[np.argsort(codes, kind="stable")]
+    row_group = np.repeat(np.arange(len(levels)), rows)
+
+    observed = ~np.isnan(by_group)
+    n = np.add.reduceat(observed, starts, axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.add.reduceat(np.where(observed, by_group, 0.0), starts, axis=0) / n
+        dev = np.where(observed, by_group - mean[row_group], 0.0)
+        dev2 = dev * dev
+        m2 = np.add.reduceat(dev2, starts, axis=0)
+        m3 = np.add.reduceat(dev2 * dev, starts, axis=0)
+        m4 = np.add.reduceat(dev2 * dev2, starts, axis=0)
+    var, skew, kurtosis = _shape(n, m2, m3, m4)
+
+    minimum, maximum, median = (np.full(n.shape, np.nan) for _ in range(3))
+    last = starts[:, None] + np.maximum(n - 1, 0)
+    for j in range(values.shape[1]):
+        # NaN sorts to the end of each group's segment
+        ordered = values[np.lexsort((values[:, j], codes)), j]
+        has = n[:, j] > 0
+        minimum[has, j] = ordered[starts[has]]
+        maximum[has, j] = ordered[last[has, j]]
+        median[has, j] = (ordered[starts[has] + (n[has, j] - 1) // 2] + ordered[starts[has] + n[has, j] // 2]) / 2
+
+    fields = [n, rows[:, None] - n, mean, median, np.sqrt(var), var, minimum, maximum, maximum - minimum, skew, kurtosis]
+    table = pd.DataFrame(np.stack([f.ravel() for f in fields], axis=1), columns=DESCRIPTIVE_FIELDS,
+                         index=pd.MultiIndex.from_product([levels, columns], names=["group", "variable"]))
+    return table.astype({"count": np.int64, "missing": np.int64})
+
+
+def _weighted_quantiles(values, weights, qs):
+    """Linear-interpolated quantiles (numpy's default method) of sorted values carrying integer weights"""
+    cum = np.cumsum(weights)
+    positions = np.asarray(qs, dtype=np.float64) * (cum[-1] - 1)
+    lower = values[np.searchsorted(cum, np.floor(positions), side="right")]
+    upper = values[np.searchsorted(cum, np.ceil(positions), side="right")]
+    return lower + (upper - lower) * (positions - np.floor(positions))
+
+
+class QuantileSketch:
+    """Mergeable, bounded-memory summary of one column's distribution.
+
+    Values are counted exactly while the column has at most MAX_EXACT_VALUES
+    distinct values, which covers Likert items and most composites, so their
+    quantiles and histograms are exact. Past that the counts are folded into a
+    KLL sketch (Karnin, Lang & Liberty 2016) holding O(k) items; with the
+    default k=200 the normalized rank error of any single quantile stays below
+    about 1.65% with 99% probability, independent of the number of rows.
+    """
+
+    def __init__(self, k=SKETCH_K, seed=0):
+        self.k = k
+        self.n = 0
+        self.minimum = np.inf
+        self.maximum = -np.inf
+        self.values = np.empty(0)
+        self.counts = np.empty(0, dtype=np.int64)
+        self.levels = None
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def exact(self):
+        return self.levels is None
+
+    def update(self, x):
+        x = np.asarray(x, dtype=np.float64)
+        x = x[~np.isnan(x)]
+        if not len(x):
+            return
+        self.n += len(x)
+        self.minimum = min(self.minimum, x.min())
+        self.maximum = max(self.maximum, x.max())
+        if self.exact:
+            self._add_counts(*np.unique(x, return_counts=True))
+        else:
+            self.levels[0] = np.concatenate([self.levels[0], x])
+            self._compress()
+
+    def merge(self, other):
+        self.n += other.n
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        if self.exact and other.exact:
+            self._add_counts(other.values, other.counts)
+            return
+        if self.exact:
+            self._to_kll()
+        levels = other.levels if not other.exact else self._levels_from_counts(other.values, other.counts)
+        for h, level in enumerate(levels):
+            if h == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[h] = np.concatenate([self.levels[h], level])
+        self._compress()
+
+    def _add_counts(self, values, counts):
+        merged = np.concatenate([self.values, values])
+        weights = np.concatenate([self.counts, counts])
+        self.values, inverse = np.unique(merged, return_inverse=True)
+        self.counts = np.bincount(inverse, weights=weights, minlength=len(self.values)).astype(np.int64)
+        if len(self.values) > MAX_EXACT_VALUES:
+            self._to_kll()
+
+    @staticmethod
+    def _levels_from_counts(values, counts):
+        # a value seen c times goes to every level h where bit h of c is set, preserving its weight exactly
+        height = max(int(counts.max()).bit_length(), 1) if len(counts) else 1
+        return [values[(counts >> h) & 1 == 1] for h in range(height)]
+
+    def _to_kll(self):
+        self.levels = self._levels_from_counts(self.values, self.counts)
+        self.values = np.empty(0)
+        self.counts = np.empty(0, dtype=np.int64)
+        self._compress()
+
+    def _capacity(self, h):
+        return max(2, int(np.ceil(self.k * (2 / 3) ** (len(self.levels) - 1 - h))))
+
+    def _compress(self):
+        while sum(len(level) for level in self.levels) > sum(self._capacity(h) for h in range(len(self.levels))):
+            h = next(h for h, level in enumerate(self.levels) if len(level) > self._capacity(h))
+            items = np.sort(self.levels[h])
+            keep = items[:len(items) % 2]
+            items = items[len(items) % 2:]
+            if h + 1 == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[h] = keep
+            self.levels[h + 1] = np.concatenate([self.levels[h + 1], items[self._rng.integers(2)::2]])
+
+    def _weighted_items(self):
+        if self.exact:
+            return self.values, self.counts
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(level), 1 << h, dtype=np.int64) for h, level in enumerate(self.levels)])
+        order = np.argsort(values, kind="stable")
+        return values[order], weights[order]
+
+    def quantiles(self, qs):
+        if not self.n:
+            return np.full(len(qs), np.nan)
+        values, weights = self._weighted_items()
+        result = _weighted_quantiles(values, weights, qs)
+        return np.clip(result, self.minimum, self.maximum)
+
+    def histogram(self, bins=HIST_BINS):
+        """(counts, edges) over [min, max] like np.histogram, exact in counting mode"""
+        values, weights = self._weighted_items()
+        return np.histogram(values, bins=bins, range=(self.minimum, self.maximum) if self.n else None, weights=weights)
+
+    def box_stats(self, whis=1.5):
+        """Precomputed boxplot statistics in the form matplotlib's Axes.bxp expects"""
+        q1, med, q3 = self.quantiles([0.25, 0.5, 0.75])
+        iqr = q3 - q1
+        values, _ = self._weighted_items()
+        inside = values[(values >= q1 - whis * iqr) & (values <= q3 + whis * iqr)]
+        whislo = inside.min() if len(inside) else q1
+        whishi = inside.max() if len(inside) else q3
+        fliers = _thin_fliers(np.unique(np.concatenate([values[(values < whislo) | (values > whishi)],
+                                                        [v for v in (self.minimum, self.maximum) if v < whislo or v > whishi]])))
+        return {"med": med, "q1": q1, "q3": q3, "whislo": whislo, "whishi": whishi, "fliers": fliers}
+
+
+class StreamingDescriptives:
+    """Out-of-core descriptives: feed row chunks, read the same table describe_block returns.
+
+    Moments are merged with the pairwise update, so mean/std/var/skew/kurtosis
+    match a single in-memory pass up to floating point; min and max are exact;
+    the median comes from each column's QuantileSketch.
+    """
+
+    def __init__(self, columns, k=SKETCH_K):
+        self.columns = list(columns)
+        width = len(self.columns)
+        self.rows = 0
+        self._moments = (np.zeros(width, dtype=np.int64), np.zeros(width), np.zeros(width), np.zeros(width), np.zeros(width))
+        self.sketches = {col: QuantileSketch(k=k) for col in self.columns}
+
+    def update(self, values):
+        """Consume a (rows x columns) block ordered like ``columns``"""
+        values = np.asarray(values, dtype=np.float64).reshape(-1, len(self.columns))
+        self.rows += len(values)
+        self._moments = _merge_moments(self._moments, _moments(values))
+        for j, col in enumerate(self.columns):
+            self.sketches[col].update(values[:, j])
+
+    def update_frame(self, frame):
+        self.update(numeric_block(frame, self.columns))
+
+    def merge(self, other):
+        self.rows += other.rows
+        self._moments = _merge_moments(self._moments, other._moments)
+        for col in self.columns:
+            self.sketches[col].merge(other.sketches[col])
+
+    def table(self):
+        n, mean, m2, m3, m4 = self._moments
+        var, skew, kurtosis = _shape(n, m2, m3, m4)
+        sketches = [self.sketches[col] for col in self.columns]
+        minimum = np.array([sk.minimum if sk.n else np.nan for sk in sketches])
+        maximum = np.array([sk.maximum if sk.n else np.nan for sk in sketches])
+        median = np.array([sk.quantiles([0.5])[0] for sk in sketches])
+        table = pd.DataFrame({
+            "count": n, "missing": self.rows - n, "mean": np.where(n > 0, mean, np.nan), "median": median,
+            "std": np.sqrt(var), "var": var, "min": minimum, "max": maximum, "range": maximum - minimum,
+            "skew": skew, "kurtosis": kurtosis,
+        }, index=pd.Index(self.columns, name="variable"))
+        return table[DESCRIPTIVE_FIELDS]
+
+    def charts(self):
+        """{column: (histogram, box statistics)} from the sketches, in the form chart_stats returns"""
+        return {col: (sketch.histogram(), sketch.box_stats()) for col, sketch in self.sketches.items()}
+
+
+def describe_chunks(chunks, columns):
+    """StreamingDescriptives over an iterable of DataFrame chunks"""
+    acc = StreamingDescriptives(columns)
+    for chunk in chunks:
+        acc.update_frame(chunk)
+    return acc
@@ -0,0 +1,472 @@
+import json
+import os
+import shutil
+import time
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from charts import SCATTER_SEED, scatter_layer
+from composites import composite, score_composites
+from correlation import BOOTSTRAP_REPLICATES, correlation_pairs, bootstrap_ci, group_correlations, permutation_test
+from descriptives import DESCRIPTIVE_FIELDS, describe_groups, describe_with_charts, numeric_block
+from ingest import LocalFile, load_dataset
+from memo import column_digest, memoize, memoize_many
+from normality import normality_test
+from reliability import composite_reliability
+from translations import translator
+
+GROUP_MAX_LEVELS = int(os.environ.get("ANALYSIS_GROUP_MAX_LEVELS", "12"))
+GROUP_HIST_BINS = 20
+GROUP_SCATTER_POINTS = 2000
+
+Association = namedtuple("Association", "corr_method method r p p_asymptotic perm ci ci_level strength direction scatter_spec n_pairs")
+GroupAnalysis = namedtuple("GroupAnalysis", "by levels desc freq normality corr chart_specs dropped")
+AnalysisResult = namedtuple("AnalysisResult", "context matrix timings")
+
+
+def _value_counts(series):
+    vc = series.value_counts(dropna=False)
+    pct = (vc / len(series) * 100).round(2)
+    return vc.index.astype(str).to_numpy(), vc.to_numpy(), pct.to_numpy()
+
+
+def freq_table(series, t):
+    categories, counts, pct = memoize(("freq", column_digest(series)), lambda: _value_counts(series))
+    return pd.DataFrame({
+        t('category'): categories,
+        t('frequency'): counts,
+        t('percentage'): pct
+    })
+
+
+def corr_strength(r):
+    r = abs(r)
+    if r < 0.2: return "Very Weak"
+    if r < 0.4: return "Weak"
+    if r < 0.6: return "Moderate"
+    if r < 0.8: return "Strong"
+    return "Very Strong"
+
+
+def is_likert(series):
+    vals = series.dropna().unique()
+    return all(v in [1,2,3,4,5] for v in vals)
+
+
+def composite_specs(x_items, y_items, create_total=True, scoring=None, composites=()):
+    """Composite definitions of one run: X_total and Y_total, then the extra named ``composites``.
+
+    ``scoring`` holds the options all of them share (method, weights,
+    reverse, scale_min, scale_max, min_answered; see composites.composite),
+    and each extra composite is a dict with its name and items plus any
+    option it overrides.
+    """
+    scoring = scoring or {}
+    specs = []
+    if create_total:
+        specs += [composite(name, items, **scoring) for name, items in (("X_total", x_items), ("Y_total", y_items)) if items]
+    specs += [composite(**{**scoring, **extra}) for extra in composites]
+    names = [spec.name for spec in specs]
+    clashes = sorted({name for name in names if names.count(name) > 1 or name in x_items or name in y_items})
+    if clashes:
+        raise ValueError(f"composite names already in use: {', '.join(clashes)}")
+    return specs
+
+
+def _scores(data, specs):
+    scores = score_composites(data, specs)
+    for score in scores.values():
+        # memoized and shared by every run over the same items
+        score.flags.writeable = False
+    return scores
+
+
+def build_composites(data, x_items, y_items, create_total=True, keep=(), scoring=None, composites=()):
+    """Working set of one run, and the variables to analyze in display order.
+
+    The working set holds only the selected items, the items of the other
+    composites, the ``keep`` columns (such as the split-by column) and the
+    composite scores (see composite_specs). Item columns share memory with ``data``, and
+    copy-on-write leaves the cached upload untouched. The scores are
+    separate read-only arrays. So a run's memory grows with the selection,
+    not with the width of the file. Scores are memoized per definition and
+    item contents, and the missing ones are computed together.
+    """
+    specs = {spec.name: spec for spec in composite_specs(x_items, y_items, create_total, scoring, composites)}
+    composite_items = [item for spec in specs.values() for item in spec.items]
+    columns = {col: data[col] for col in dict.fromkeys([*x_items, *y_items, *composite_items, *keep])}
+    digests = {item: column_digest(data[item]) for spec in specs.values() for item in spec.items}
+    columns.update(memoize_many({name: ("composite", spec, tuple(digests[item] for item in spec.items)) for name, spec in specs.items()},
+                                lambda names: _scores(data, [specs[name] for name in names])))
+    variables = list(x_items) + list(y_items) + list(specs)
+    return pd.DataFrame(columns, index=data.index, copy=False), [col for col in variables if col in columns]
+
+
+def _describe_stats(data, columns):
+    table, charts = describe_with_charts(data, columns)
+    return {col: (table.loc[col].to_numpy(), *charts[col]) for col in columns}
+
+
+def describe_variables(data, variables, t):
+    """Descriptives table, chart specs and frequency tables for each variable.
+
+    Statistics are memoized per column contents; columns without a cached
+    result are described together in one vectorized pass, streamed in row
+    chunks for frames above STREAM_DESCRIBE_ROWS (see describe_with_charts).
+    """
+    numeric = [col for col in dict.fromkeys(variables) if pd.api.types.is_numeric_dtype(data[col])]
+    column_stats = memoize_many({col: ("describe", column_digest(data[col])) for col in numeric},
+                                lambda columns: _describe_stats(data, columns))
+    desc_table = pd.DataFrame([column_stats[col][0] for col in numeric], columns=DESCRIPTIVE_FIELDS,
+                              index=pd.Index(numeric, name="variable")).astype({"count": np.int64, "missing": np.int64})
+    chart_specs, freq_tables = {}, {}
+    for col in variables:
+        chart_specs[col] = {}
+        if col in desc_table.index:
+            desc = desc_table.loc[col]
+            _, (hist_counts, hist_edges), box_stats = column_stats[col]
+            chart_specs[col]['hist'] = {'counts': hist_counts, 'edges': hist_edges, 'mean': desc['mean'], 'median': desc['median'],
+                                        'title': f'Distribution of {col}', 'xlabel': col, 'ylabel': t('frequency'),
+                                        'mean_label': t('mean'), 'median_label': t('median')}
+            chart_specs[col]['box'] = {'stats': box_stats, 'title': f'Boxplot of {col}', 'xlabel': col}
+        freq = freq_tables[col] = freq_table(data[col], t)
+        chart_specs[col]['freq'] = {'categories': list(freq[t('category')]), 'counts': freq[t('frequency')].to_numpy(),
+                                    'percentages': freq[t('percentage')].to_numpy(), 'title': f'{t("frequency_dist")}: {col}',
+                                    'xlabel': t('category'), 'ylabel': t('frequency')}
+    return desc_table, chart_specs, freq_tables
+
+
+def reliability_analysis(data, specs):
+    """{name: Reliability} for every composite with at least two items.
+
+    Results are memoized on the items' contents and reverse coding, so
+    renaming a composite or changing how it is scored reuses them.
+    """
+    results = {}
+    for spec in specs:
+        if len(spec.items) < 2:
+            continue
+        key = ("reliability", spec.items, spec.reverse, spec.scale_min, spec.scale_max,
+               tuple(column_digest(data[item]) for item in spec.items))
+        results[spec.name] = memoize(key, lambda: composite_reliability(data, spec))._replace(name=spec.name)
+    return results
+
+
+def normality_of_totals(data, strategy="auto"):
+    """Normality results for X_total and Y_total"""
+    x_norm = normality_test(data["X_total"] if "X_total" in data else [], strategy)
+    y_norm = normality_test(data["Y_total"] if "Y_total" in data else [], strategy)
+    return x_norm, y_norm
+
+
+def associate(data, x_norm, y_norm, t, permutation=False, bootstrap_replicates=BOOTSTRAP_REPLICATES, progress=None,
+              cancel=None, checkpoint=None):
+    """Association between X_total and Y_total: Pearson when both are normal, Spearman otherwise.
+
+    With ``permutation`` the reported p-value comes from a permutation test
+    (``progress`` receives its completed fraction, ``cancel`` and
+    ``checkpoint`` are passed on to permutation_matrix) and the asymptotic one
+    is kept alongside; ``bootstrap_replicates`` > 0 adds a bootstrap interval.
+    The statistics are memoized on the two columns' contents and the options,
+    so a rerun that leaves both composites unchanged skips the resampling; a
+    cancelled permutation test is not memoized.
+    """
+    corr_method = 'pearson' if x_norm.normal and y_norm.normal else 'spearman'
+    key = ("associate", column_digest(data["X_total"]), column_digest(data["Y_total"]), corr_method, bool(permutation), bootstrap_replicates)
+    r, p, p_asymptotic, perm, ci, layer, x_range, z, n_pairs = memoize(
+        key, lambda: _association_stats(data["X_total"], data["Y_total"], corr_method, permutation, bootstrap_replicates, progress,
+                                        cancel, checkpoint),
+        keep=lambda stats: stats[3] is None or stats[3].status != "cancelled")
+
+    method = t('pearson') if corr_method == 'pearson' else t('spearman_rank')
+    ci_level = f"{ci.confidence:.0%}" if ci else None
+    scatter_spec = {**layer, 'count_label': t('scatter_count'),
+                    'x_range': x_range, 'slope': z[0], 'intercept': z[1],
+                    'trend_label': f'{t("pdf_trend_line")}: y = {z[0]:.3f}x + {z[1]:.3f}',
+                    'xlabel': "X_total", 'ylabel': "Y_total", 'title': f'{method}\nr = {r:.4f}, p = {p:.4f}, n = {n_pairs}'}
+    direction = t('positive') if r > 0 else t('negative')
+    return Association(corr_method, method, r, p, p_asymptotic, perm, ci, ci_level, corr_strength(r), direction, scatter_spec, n_pairs)
+
+
+def _association_stats(x, y, corr_method, permutation, bootstrap_replicates, progress, cancel=None, checkpoint=None):
+    # respondents without both scores (below a composite's min_answered) are left out
+    keep = ~(x.isna() | y.isna())
+    x, y = x[keep], y[keep]
+    if corr_method == 'pearson':
+        r, p = stats.pearsonr(x, y)
+    else:
+        r, p = stats.spearmanr(x, y)
+
+    perm = p_asymptotic = None
+    if permutation:
+        perm = permutation_test(x, y, corr_method, progress=progress, cancel=cancel, checkpoint=checkpoint)
+        p_asymptotic, p = p, perm.p_value
+
+    ci = None
+    if bootstrap_replicates:
+        ci = bootstrap_ci(x, y, corr_method, replicates=bootstrap_replicates)
+
+    z = np.polyfit(x, y, 1)
+    return r, p, p_asymptotic, perm, ci, scatter_layer(x, y), (x.min(), x.max()), z, len(x)
+
+
+def item_matrix(data, items, association, t, p_adjust="none", permutation=False, progress=None):
+    """Item correlation matrix with the association's method: (r matrix, pair table, chart spec)"""
+    key = ("matrix", tuple((col, column_digest(data[col])) for col in items), association.corr_method, p_adjust, bool(permutation))
+    r_matrix, pairs = memoize(key, lambda: correlation_pairs(data, items, association.corr_method, p_adjust,
+                                                             permutation={'progress': progress} if permutation else None))
+    matrix_spec = {'r': r_matrix, 'title': f"{t('corr_matrix')}: {association.method}", 'cbar_label': t('coefficient')}
+    return r_matrix, pairs, matrix_spec
+
+
+def group_codes(series, max_levels=GROUP_MAX_LEVELS):
+    """Group index of every row for a split-by column: (codes, levels, dropped rows).
+
+    Levels keep their sorted order; only the ``max_levels`` largest are kept,
+    and rows of other levels or with a missing value get code -1.
+    """
+    codes, uniques = pd.factorize(series, sort=True)
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    keep = np.sort(np.argsort(-counts, kind="stable")[:max_levels])
+    # the extra slot keeps missing values (code -1) at -1
+    remap = np.full(len(uniques) + 1, -1)
+    remap[keep] = np.arange(len(keep))
+    codes = remap[codes]
+    return codes, [str(level) for level in uniques[keep]], int((codes < 0).sum())
+
+
+def group_frequencies(series, codes, levels):
+    """Counts of every category (rows) in every group (columns) from one bincount"""
+    categories, uniques = pd.factorize(series, sort=True, use_na_sentinel=False)
+    counts = np.bincount(codes * len(uniques) + categories, minlength=len(levels) * len(uniques))
+    return pd.DataFrame(counts.reshape(len(levels), len(uniques)).T, columns=levels, index=pd.Index(uniques.astype(str)))
+
+
+def _group_hist_spec(values, codes, levels, means, column):
+    observed = ~np.isnan(values)
+    values, codes = values[observed], codes[observed]
+    # one bin per value for integer scores such as Likert sums, so no bin straddles two scores
+    if len(values) and np.array_equal(values, np.round(values)) and np.ptp(values) < 2 * GROUP_HIST_BINS:
+        edges = np.arange(values.min() - 0.5, values.max() + 1.5)
+    else:
+        edges = np.histogram_bin_edges(values, GROUP_HIST_BINS)
+    n_bins = len(edges) - 1
+    bins = np.clip(np.searchsorted(edges, values, side="right") - 1, 0, n_bins - 1)
+    counts = np.bincount(codes * n_bins + bins, minlength=len(levels) * n_bins)
+    return {'counts': counts.reshape(len(levels), n_bins), 'edges': edges, 'labels': levels, 'means': means, 'xlabel': column}
+
+
+def _group_scatter_spec(x, y, codes, levels, r):
+    keep = ~(np.isnan(x) | np.isnan(y))
+    x, y, codes = x[keep], y[keep], codes[keep]
+    k = len(levels)
+    # per-group least-squares lines from segment sums, like the r values themselves
+    n = np.bincount(codes, minlength=k)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        dx = x - (np.bincount(codes, x, k) / n)[codes]
+        slopes = np.bincount(codes, dx * y, k) / np.bincount(codes, dx * dx, k)
+        intercepts = (np.bincount(codes, y, k) - slopes * np.bincount(codes, x, k)) / n
+    order = np.argsort(codes, kind="stable")
+    starts = np.concatenate([[0], np.cumsum(n)])
+    rng = np.random.default_rng(SCATTER_SEED)
+    shown = [np.sort(rng.choice(order[starts[g]:starts[g + 1]], min(n[g], GROUP_SCATTER_POINTS), replace=False)) for g in range(k)]
+    x_min = np.array([x[order[starts[g]:starts[g + 1]]].min() if n[g] else np.nan for g in range(k)])
+    x_max = np.array([x[order[starts[g]:starts[g + 1]]].max() if n[g] else np.nan for g in range(k)])
+    rows = np.concatenate(shown) if shown else np.empty(0, dtype=np.int64)
+    return {'x': x[rows], 'y': y[rows], 'starts': np.concatenate([[0], np.cumsum([len(s) for s in shown])]), 'labels': levels,
+            'slopes': slopes, 'intercepts': intercepts, 'x_min': x_min, 'x_max': x_max, 'r': np.asarray(r),
+            'xlabel': "X_total", 'ylabel': "Y_total"}
+
+
+def split_analysis(data, by, variables, association, t, normality_strategy="auto", max_levels=GROUP_MAX_LEVELS):
+    """Descriptives, frequency tables, normality and the X/Y correlation within every level of ``by``.
+
+    Rows are coded by group once; descriptives, frequency counts, correlations
+    and chart data then come from segment sums and bincounts over all groups
+    together instead of re-running the whole analysis per group. Results are
+    memoized on the contents of ``by`` and the variables.
+    """
+    key = ("groups", by, column_digest(data[by]), tuple((col, column_digest(data[col])) for col in variables),
+           association.corr_method, normality_strategy, max_levels)
+    groups = memoize(key, lambda: _split_stats(data, by, variables, association.corr_method, normality_strategy, max_levels))
+    labels = {col: {'title': f"{t('group_distribution')} {col} {t('group_by')} {by}", 'mean_label': t('mean')}
+              for col in ("X_total", "Y_total")}
+    labels['scatter'] = {'title': f"X_total - Y_total {t('group_by')} {by}"}
+    return groups._replace(freq={col: freq.rename_axis(t('category')) for col, freq in groups.freq.items()},
+                           chart_specs={name: {**spec, **labels[name]} for name, spec in groups.chart_specs.items()})
+
+
+def _split_stats(data, by, variables, corr_method, normality_strategy, max_levels):
+    codes, levels, dropped = group_codes(data[by], max_levels)
+    rows = codes >= 0
+    codes = codes[rows]
+    numeric = [col for col in variables if pd.api.types.is_numeric_dtype(data[col])]
+    values = numeric_block(data, numeric)[rows]
+    desc = describe_groups(values, codes, levels, numeric)
+    freq = {col: group_frequencies(data[col][rows], codes, levels) for col in numeric if is_likert(data[col])}
+
+    chart_specs = {}
+    for col in ("X_total", "Y_total"):
+        if col in numeric:
+            chart_specs[col] = _group_hist_spec(values[:, numeric.index(col)], codes, levels,
+                                                desc.xs(col, level="variable")["mean"].to_numpy(), col)
+    normality, corr = {}, None
+    if "X_total" in numeric and "Y_total" in numeric:
+        x, y = values[:, numeric.index("X_total")], values[:, numeric.index("Y_total")]
+        order = np.argsort(codes, kind="stable")
+        bounds = np.concatenate([[0], np.cumsum(np.bincount(codes, minlength=len(levels)))])
+        for g, level in enumerate(levels):
+            segment = order[bounds[g]:bounds[g + 1]]
+            normality[level] = (normality_test(x[segment], normality_strategy), normality_test(y[segment], normality_strategy))
+        corr = group_correlations(x, y, codes, levels, corr_method, "fdr_bh")
+        chart_specs['scatter'] = _group_scatter_spec(x, y, codes, levels, corr["r"].to_numpy())
+    return GroupAnalysis(by, levels, desc, freq, normality, corr, chart_specs, dropped)
+
+
+def report_context(data, lang, x_items, y_items, variables, desc_table, chart_specs, freq_tables, x_norm, y_norm, association,
+                   groups=None, composites=(), reliability=None):
+    """Everything the PDF report shows, in the form report.build_report expects"""
+    return {
+        'n': len(data), 'lang': lang, 'x_items': x_items, 'y_items': y_items, 'variables': variables,
+        'likert': [col for col in variables if col in desc_table.index and is_likert(data[col])],
+        'desc_table': desc_table, 'chart_specs': chart_specs, 'freq_tables': freq_tables,
+        'x_norm': x_norm, 'y_norm': y_norm, 'corr_method': association.corr_method, 'method': association.method,
+        'r': association.r, 'p': association.p, 'strength': association.strength, 'direction': association.direction,
+        'perm': association.perm, 'p_asymptotic': association.p_asymptotic, 'ci': association.ci, 'ci_level': association.ci_level,
+        'scatter_spec': association.scatter_spec, 'groups': groups, 'composites': list(composites),
+        'reliability': reliability or {},
+    }
+
+
+def run_analysis(data, x_items, y_items, t, lang="en", create_total=True, normality_strategy="auto", corr_matrix=False,
+                 p_adjust="none", permutation=False, bootstrap_replicates=BOOTSTRAP_REPLICATES, split_by=None,
+                 scoring=None, composites=()):
+    """The whole analysis without Streamlit, as the app runs it.
+
+    Returns the report context, the item matrix (r matrix, pair table, chart
+    spec) when ``corr_matrix`` is set and there are at least two items, and
+    the wall time of each stage in seconds. ``split_by`` names a column whose
+    levels get their own subgroup results. ``scoring`` and ``composites``
+    define the composite scores as in composite_specs.
+    """
+    timings = {}
+    started = time.perf_counter()
+
+    def lap(stage):
+        nonlocal started
+        now = time.perf_counter()
+        timings[stage] = now - started
+        started = now
+
+    specs = composite_specs(x_items, y_items, create_total, scoring, composites)
+    data, variables = build_composites(data, x_items, y_items, create_total, keep=[split_by] if split_by else [],
+                                       scoring=scoring, composites=composites)
+    lap('composites')
+    desc_table, chart_specs, freq_tables = describe_variables(data, variables, t)
+    lap('descriptives')
+    reliability = reliability_analysis(data, specs)
+    lap('reliability')
+    x_norm, y_norm = normality_of_totals(data, normality_strategy)
+    lap('normality')
+    association = associate(data, x_norm, y_norm, t, permutation, bootstrap_replicates)
+    lap('association')
+    matrix = None
+    matrix_items = list(dict.fromkeys(list(x_items) + list(y_items)))
+    if corr_matrix and len(matrix_items) > 1:
+        matrix = item_matrix(data, matrix_items, association, t, p_adjust, permutation)
+        lap('matrix')
+    groups = None
+    if split_by:
+        groups = split_analysis(data, split_by, variables, association, t, normality_strategy)
+        lap('groups')
+    context = report_context(data, lang, x_items, y_items, variables, desc_table, chart_specs, freq_tables, x_norm, y_norm, association,
+                             groups, specs, reliability)
+    return AnalysisResult(context, matrix, timings)
+
+
+def _plain(value):
+    """JSON-safe form of numpy/pandas scalars and containers; NaN becomes None"""
+    if isinstance(value, dict):
+        return {str(k): _plain(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [_plain(v) for v in value]
+    if isinstance(value, (np.bool_, bool)):
+        return bool(value)
+    if isinstance(value, (np.integer, int)):
+        return int(value)
+    if isinstance(value, (np.floating, float)):
+        return None if np.isnan(value) else float(value)
+    return value
+
+
+def result_json(result):
+    """Machine-readable summary of an AnalysisResult"""
+    ctx = result.context
+    summary = {
+        'n': ctx['n'], 'x_items': ctx['x_items'], 'y_items': ctx['y_items'], 'variables': ctx['variables'],
+        'descriptives': ctx['desc_table'].to_dict(orient='index'),
+        'normality': {name: norm._asdict() for name, norm in (('X_total', ctx['x_norm']), ('Y_total', ctx['y_norm']))},
+        'association': {
+            'method': ctx['corr_method'], 'r': ctx['r'], 'p': ctx['p'], 'p_asymptotic': ctx['p_asymptotic'],
+            'strength': ctx['strength'], 'direction': ctx['direction'],
+            'permutation': ctx['perm']._asdict() if ctx['perm'] else None,
+            'ci': ctx['ci']._asdict() if ctx['ci'] else None,
+        },
+        'composites': [spec._asdict() for spec in ctx['composites']],
+        'reliability': {name: {'n': rel.n, 'alpha': rel.alpha, 'omega': rel.omega, 'items': rel.items.to_dict(orient='index')}
+                        for name, rel in ctx['reliability'].items()},
+        'timings': result.timings,
+    }
+    if result.matrix is not None:
+        r_matrix, pairs, _ = result.matrix
+        summary['matrix'] = {'r': r_matrix.to_dict(), 'pairs': pairs.to_dict(orient='records')}
+    groups = ctx['groups']
+    if groups is not None:
+        summary['groups'] = {
+            'by': groups.by, 'levels': groups.levels, 'dropped_rows': groups.dropped,
+            'descriptives': {level: groups.desc.loc[level].to_dict(orient='index') for level in groups.levels},
+            'frequencies': {col: freq.to_dict() for col, freq in groups.freq.items()},
+            'normality': {level: {'X_total': x._asdict(), 'Y_total': y._asdict()} for level, (x, y) in groups.normality.items()},
+            'correlation': groups.corr.to_dict(orient='index') if groups.corr is not None else None,
+        }
+    return _plain(summary)
+
+
+def analyze_file(path, x_items, y_items, out_dir, lang="en", sheets=None, pdf=True, name=None, **options):
+    """Analyze one file and write its JSON (and PDF) into ``out_dir``; returns the JSON summary.
+
+    The outputs are called ``name``.json and ``name``.pdf, by default after the file's stem.
+    """
+    t = translator(lang)
+    started = time.perf_counter()
+    data = load_dataset(LocalFile(path), sheets=sheets)
+    load_time = time.perf_counter() - started
+    composite_items = [item for extra in options.get('composites', ()) for item in extra['items']]
+    missing = [col for col in dict.fromkeys([*x_items, *y_items, *composite_items, options.get('split_by')])
+               if col and col not in data.columns]
+    if missing:
+        raise ValueError(f"{os.path.basename(path)}: columns not found: {', '.join(missing)}")
+
+    result = run_analysis(data, x_items, y_items, t, lang=lang, **options)
+    summary = result_json(result)
+    summary['source'] = os.path.abspath(path)
+    summary['timings'] = {'load': load_time, **summary['timings']}
+
+    stem = name or os.path.splitext(os.path.basename(path))[0]
+    os.makedirs(out_dir, exist_ok=True)
+    if pdf:
+        from report import build_report
+        started = time.perf_counter()
+        pdf_path = os.path.join(out_dir, f"{stem}.pdf")
+        report_file = build_report(result.context, t)
+        # copied rather than moved so the output gets normal permissions instead of the temp file's
+        shutil.copyfile(report_file, pdf_path)
+        os.remove(report_file)
+        summary['timings']['pdf'] = time.perf_counter() - started
+        summary['pdf'] = os.path.abspath(pdf_path)
+    with open(os.path.join(out_dir, f"{stem}.json"), "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2, ensure_ascii=False)
+    return summary
@@ -0,0 +1,529 @@
+import csv
+import hashlib
+import os
+import struct
+import threading
+from collections import OrderedDict
+from io import BytesIO, SEEK_END
+from itertools import repeat
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from pools import SpawnPool
+
+PARSE_CACHE_BYTES = int(os.environ.get("ANALYSIS_PARSE_CACHE_MB", "1024")) * 1024 * 1024
+STREAMING_THRESHOLD_BYTES = int(os.environ.get("ANALYSIS_STREAMING_THRESHOLD_MB", "50")) * 1024 * 1024
+CSV_CHUNK_ROWS = 100_000
+SNIFF_BYTES = 64 * 1024
+CATEGORY_MAX_RATIO = 0.5
+# float32 keeps about 7 significant digits, so non-integer measurements are only narrowed on request
+COMPACT_FLOAT32 = os.environ.get("ANALYSIS_COMPACT_FLOAT32", "0") == "1"
+CSV_ENCODINGS = ("utf-8-sig", "cp1252", "latin-1")
+CSV_DELIMITERS = ",;\t|"
+EXCEL_PARALLEL_MIN_BYTES = 5 * 1024 * 1024
+SHEET_INDEX_ENTRIES = 32
+# parsed uploads are only kept on disk when a store directory is configured
+STORE_DIR = os.environ.get("ANALYSIS_STORE_DIR", "")
+STORE_BYTES = int(os.environ.get("ANALYSIS_STORE_MB", "4096")) * 1024 * 1024
+
+
+class ParseCache:
+    """LRU cache of parsed DataFrames bounded by their total in-memory size"""
+
+    def __init__(self, max_bytes=PARSE_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    @staticmethod
+    def sizeof(df):
+        return int(df.memory_usage(deep=True).sum())
+
+    def evicted(self, value):
+        """Called for every value dropped from the cache; subclasses holding files delete them here"""
+
+    def put(self, key, df):
+        """Cache ``df`` under ``key``; a value larger than the whole cache is passed to evicted and False returned"""
+        size = self.sizeof(df)
+        if size > self.max_bytes:
+            self.evicted(df)
+            return False
+        with self._lock:
+            if key in self._entries:
+                old, old_size = self._entries.pop(key)
+                self.current_bytes -= old_size
+                if old is not df:
+                    self.evicted(old)
+            self._entries[key] = (df, size)
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, (value, value_size) = self._entries.popitem(last=False)
+                self.current_bytes -= value_size
+                self.evicted(value)
+        return True
+
+    def clear(self):
+        with self._lock:
+            for value, _ in self._entries.values():
+                self.evicted(value)
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_parse_cache = ParseCache()
+
+
+class LocalFile(BytesIO):
+    """A file on disk with the interface of a Streamlit upload, for running without a browser"""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            super().__init__(f.read())
+        self.name = os.path.basename(path)
+
+
+def file_digest(uploaded_file):
+    """Hash the uploaded bytes without copying them out of the upload buffer"""
+    return hashlib.blake2b(uploaded_file.getbuffer(), digest_size=20).hexdigest()
+
+
+def sniff_csv(head):
+    """Guess (encoding, delimiter) from the first bytes of a CSV file"""
+    # the sample may end mid-character, so only the last few bytes may fail to decode
+    for encoding in CSV_ENCODINGS:
+        try:
+            text = head.decode(encoding)
+            break
+        except UnicodeDecodeError as e:
+            if e.start >= len(head) - 3:
+                text = head[:e.start].decode(encoding)
+                break
+    try:
+        delimiter = csv.Sniffer().sniff(text.split("\n", 1)[0], delimiters=CSV_DELIMITERS).delimiter
+    except csv.Error:
+        delimiter = ","
+    return encoding, delimiter
+
+
+def _csv_options(source, options):
+    """``options`` with the encoding and delimiter sniffed from ``source`` when they are not given"""
+    if "encoding" in options and "sep" in options:
+        return options
+    position = source.tell()
+    encoding, delimiter = sniff_csv(source.read(SNIFF_BYTES))
+    source.seek(position)
+    return {"encoding": encoding, "sep": delimiter, **options}
+
+
+def _int_dtype(values, nullable, fallback):
+    """Smallest (nullable) integer dtype holding ``values``, or ``fallback`` when even int64 cannot (inf, huge values)"""
+    for dtype in (np.int8, np.int16, np.int32, np.int64):
+        info = np.iinfo(dtype)
+        if info.min <= values.min() and values.max() <= info.max:
+            return pd.api.types.pandas_dtype(dtype.__name__.capitalize()) if nullable else np.dtype(dtype)
+    return fallback
+
+
+def compact_dtype(series):
+    """Smallest dtype that holds every value of ``series`` without loss"""
+    if pd.api.types.is_bool_dtype(series) or isinstance(series.dtype, pd.CategoricalDtype):
+        return series.dtype
+    if pd.api.types.is_numeric_dtype(series):
+        values = series.dropna().to_numpy()
+        if not len(values):
+            return pd.Int8Dtype()
+        if np.array_equal(values, np.round(values)):
+            return _int_dtype(values, len(values) < len(series), series.dtype)
+        return series.dtype
+    if pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series):
+        if series.nunique() <= CATEGORY_MAX_RATIO * len(series):
+            return "category"
+    return series.dtype
+
+
+def compact_frame(df, float32=COMPACT_FLOAT32):
+    """``df`` with every column in its smallest lossless dtype (see compact_dtype).
+
+    Coded answers become int8/int16 (nullable Int8/Int16 when answers are
+    missing) and repeated labels become categories, which hold exactly the
+    same values, so statistics computed from the frame do not change.
+    ``float32`` also narrows the remaining float64 columns, which does round
+    them.
+    """
+    df = df.copy(deep=False)
+    for i, col in enumerate(df.columns):
+        series = df.iloc[:, i]
+        dtype = compact_dtype(series)
+        if float32 and dtype == np.float64:
+            dtype = np.dtype(np.float32)
+        if dtype != series.dtype:
+            df.isetitem(i, series.astype(dtype))
+    return df
+
+
+def _loaded_dtype(series):
+    # the dtype pd.read_csv gives the column before compacting
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        return dtype.categories.dtype
+    if pd.api.types.is_integer_dtype(dtype):
+        return np.dtype(np.float64) if series.hasnans else np.dtype(np.int64)
+    if pd.api.types.is_float_dtype(dtype):
+        return np.dtype(np.float64)
+    return dtype
+
+
+def memory_report(df):
+    """Per-column memory of ``df`` next to what the same column takes in pandas' default dtypes"""
+    rows = []
+    for i, col in enumerate(df.columns):
+        series = df.iloc[:, i]
+        loaded = _loaded_dtype(series)
+        after = int(series.memory_usage(deep=True, index=False))
+        before = after if loaded == series.dtype else int(series.astype(loaded).memory_usage(deep=True, index=False))
+        rows.append((col, str(loaded), str(series.dtype), before, after))
+    report = pd.DataFrame(rows, columns=["column", "dtype_before", "dtype_after", "bytes_before", "bytes_after"])
+    report["ratio"] = report["bytes_before"] / report["bytes_after"].clip(lower=1)
+    return report.set_index("column")
+
+
+def _widen(planned, observed):
+    if planned == observed:
+        return planned
+    if pd.api.types.is_integer_dtype(planned) and pd.api.types.is_integer_dtype(observed):
+        bits = 8 * max(planned.itemsize, observed.itemsize)
+        nullable = isinstance(planned, pd.api.extensions.ExtensionDtype) or isinstance(observed, pd.api.extensions.ExtensionDtype)
+        return pd.api.types.pandas_dtype(f"Int{bits}" if nullable else f"int{bits}")
+    if pd.api.types.is_numeric_dtype(planned) and pd.api.types.is_numeric_dtype(observed):
+        return np.dtype(np.float64)
+    return object
+
+
+def read_csv_streaming(source, chunk_rows=CSV_CHUNK_ROWS, progress=None, **options):
+    """Read a CSV in chunks, storing each chunk in compact dtypes as it arrives.
+
+    Dtypes are planned from the first chunk and only widened when a later chunk
+    does not fit (values out of range, missing answers, non-integers), so peak
+    memory stays close to the size of the final frame rather than the
+    object/float64 frame ``pd.read_csv`` would build.
+    """
+    total = source.seek(0, SEEK_END)
+    source.seek(0)
+    options = _csv_options(source, options)
+
+    plan, chunks = {}, []
+    for chunk in pd.read_csv(source, chunksize=chunk_rows, **options):
+        for col in chunk.columns:
+            observed = compact_dtype(chunk[col])
+            plan[col] = _widen(plan[col], observed) if col in plan else observed
+            chunk[col] = chunk[col].astype(observed)
+        chunks.append(chunk)
+        if progress is not None and total:
+            progress(min(source.tell() / total, 1.0))
+
+    if not chunks:
+        source.seek(0)
+        return pd.read_csv(source, **options)
+
+    columns = {}
+    for col in chunks[0].columns:
+        parts = [chunk.pop(col) for chunk in chunks]
+        if plan[col] == "category":
+            columns[col] = pd.Series(union_categoricals(parts, ignore_order=True), name=col)
+        else:
+            columns[col] = pd.concat(parts, ignore_index=True).astype(plan[col])
+        del parts
+    return pd.DataFrame(columns)
+
+
+_sheet_index = OrderedDict()
+_sheet_index_lock = threading.Lock()
+
+XLS_EOF = 0x000A
+XLS_BOUNDSHEET = 0x0085
+XLS_DIMENSIONS = 0x0200
+
+
+def _is_xls(name):
+    return name.lower().endswith(".xls")
+
+
+def _xls_records(mem, pos):
+    """(record type, data offset) of the BIFF records from ``pos`` up to the next EOF record"""
+    while pos + 4 <= len(mem):
+        code, length = struct.unpack_from("<HH", mem, pos)
+        yield code, pos + 4
+        if code == XLS_EOF:
+            return
+        pos += 4 + length
+
+
+def _xls_sheet_rows(book):
+    """Data row counts of the worksheets, read off each sheet's DIMENSIONS record without loading any cells"""
+    mem, base = book.mem, book.base
+    starts = []
+    for code, pos in _xls_records(mem, base):
+        if code == XLS_BOUNDSHEET:
+            offset, _, kind = struct.unpack_from("<iBB", mem, pos)
+            if kind == 0:
+                starts.append(base + offset)
+    rows = []
+    for start in starts:
+        count = None
+        for code, pos in _xls_records(mem, start):
+            if code == XLS_DIMENSIONS:
+                last_row = struct.unpack_from("<IIHH" if book.biff_version >= 80 else "<HHHH", mem, pos)[1]
+                count = max(last_row - 1, 0)
+                break
+        rows.append(count)
+    return rows
+
+
+def _excel_sheet_rows(data, xls):
+    if xls:
+        import xlrd
+        book = xlrd.open_workbook(file_contents=data, on_demand=True)
+        try:
+            names = book.sheet_names()
+            rows = _xls_sheet_rows(book)
+            if len(rows) != len(names):
+                rows = [None] * len(names)
+            return list(zip(names, rows))
+        finally:
+            book.release_resources()
+
+    from openpyxl import load_workbook
+    wb = load_workbook(BytesIO(data), read_only=True, data_only=True, keep_links=False)
+    try:
+        # read-only worksheets report the <dimension> tag without parsing any rows
+        return [(ws.title, None if ws.max_row is None else max(ws.max_row - 1, 0)) for ws in wb.worksheets]
+    finally:
+        wb.close()
+
+
+def list_excel_sheets(uploaded_file):
+    """Return [(sheet name, data row count)] for an uploaded workbook without loading the sheets"""
+    key = file_digest(uploaded_file)
+    with _sheet_index_lock:
+        sheets = _sheet_index.get(key)
+    if sheets is None:
+        sheets = _excel_sheet_rows(uploaded_file.getvalue(), _is_xls(uploaded_file.name))
+        with _sheet_index_lock:
+            _sheet_index[key] = sheets
+            while len(_sheet_index) > SHEET_INDEX_ENTRIES:
+                _sheet_index.popitem(last=False)
+    return sheets
+
+
+def read_excel_sheet(data, sheet, xls, options=None):
+    """Load one sheet from workbook bytes; runs in worker processes so it must stay picklable.
+
+    ``options`` are passed on to pandas.read_excel.
+    """
+    options = options or {}
+    if xls:
+        import xlrd
+        book = xlrd.open_workbook(file_contents=data, on_demand=True)
+        try:
+            return pd.read_excel(book, sheet_name=sheet, engine="xlrd", **options)
+        finally:
+            book.release_resources()
+
+    try:
+        import python_calamine  # noqa: F401
+        return pd.read_excel(BytesIO(data), sheet_name=sheet, engine="calamine", **options)
+    except ImportError:
+        pass
+
+    if options:
+        # the row loop below only covers the default header and columns
+        return pd.read_excel(BytesIO(data), sheet_name=sheet, engine="openpyxl", **options)
+
+    from openpyxl import load_workbook
+    wb = load_workbook(BytesIO(data), read_only=True, data_only=True, keep_links=False)
+    try:
+        rows = wb[sheet].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return pd.DataFrame()
+        columns = [f"Unnamed: {i}" if name is None else name for i, name in enumerate(header)]
+        df = pd.DataFrame.from_records(rows, columns=columns)
+    finally:
+        wb.close()
+    empty = df.isna().all(axis=1).to_numpy()
+    last = len(empty) - np.argmin(empty[::-1]) if not empty.all() else 0
+    return df.iloc[:last].infer_objects()
+
+
+def read_excel_sheets(uploaded_file, sheets=None, **options):
+    """Load the selected sheets, in parallel worker processes when there are several large ones.
+
+    Several sheets are stacked into one frame with a ``sheet`` column naming the source.
+    ``options`` are passed on to pandas.read_excel for every sheet.
+    """
+    data = uploaded_file.getvalue()
+    xls = _is_xls(uploaded_file.name)
+    if not sheets:
+        sheets = [list_excel_sheets(uploaded_file)[0][0]]
+    if len(sheets) > 1 and len(data) >= EXCEL_PARALLEL_MIN_BYTES:
+        # spawn rather than fork: the Streamlit server is multi-threaded
+        workers = min(len(sheets), os.cpu_count() or 1)
+        with SpawnPool(workers) as pool:
+            frames = list(pool.map(read_excel_sheet, repeat(data), sheets, repeat(xls), repeat(options)))
+    else:
+        frames = [read_excel_sheet(data, sheet, xls, options) for sheet in sheets]
+    if len(frames) == 1:
+        return frames[0]
+    return pd.concat([frame.assign(sheet=sheet) for sheet, frame in zip(sheets, frames)], ignore_index=True)
+
+
+def _parse(uploaded_file, streaming, sheets=None, progress=None, **options):
+    uploaded_file.seek(0)
+    if uploaded_file.name.endswith(".csv"):
+        # small files get the same sniffed encoding and delimiter as streamed ones
+        options = _csv_options(uploaded_file, options)
+        if streaming:
+            df = read_csv_streaming(uploaded_file, progress=progress, **options)
+        else:
+            df = pd.read_csv(uploaded_file, **options)
+    else:
+        df = read_excel_sheets(uploaded_file, sheets, **options)
+    # Excel headers can be numbers or dates; the columnar store only keeps string names
+    df.columns = df.columns.map(str)
+    return compact_frame(df)
+
+
+def _dataset_key(uploaded_file, streaming, sheets, options):
+    if streaming is None:
+        streaming = uploaded_file.getbuffer().nbytes > STREAMING_THRESHOLD_BYTES
+    sheets = tuple(sheets) if sheets else None
+    return (file_digest(uploaded_file), uploaded_file.name.endswith(".csv"), streaming, sheets, tuple(sorted(options.items())),
+            COMPACT_FLOAT32)
+
+
+def store_path(key):
+    """Where the columnar copy of a dataset lives, or None when STORE_DIR is not set"""
+    if not STORE_DIR:
+        return None
+    name = hashlib.blake2b(repr(key).encode(), digest_size=20).hexdigest()
+    return os.path.join(STORE_DIR, f"{name}.arrow")
+
+
+def write_store(df, path):
+    """Persist a frame as an uncompressed Arrow IPC file so it can be memory-mapped back"""
+    try:
+        from pyarrow import feather
+    except ImportError:
+        return False
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        feather.write_feather(df, tmp_path, compression="uncompressed")
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError):
+        # mixed-type object columns raise ArrowTypeError/ArrowInvalid, both ValueError/TypeError subclasses
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return False
+    _prune_store()
+    return True
+
+
+def read_store(path):
+    """Open a stored dataset as a memory-mapped Arrow table, or None if it is missing"""
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return None
+    try:
+        table = pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+    except (OSError, pa.ArrowInvalid):
+        return None
+    os.utime(path)
+    return table
+
+
+def _prune_store():
+    try:
+        entries = [entry for entry in os.scandir(STORE_DIR) if entry.name.endswith(".arrow")]
+    except OSError:
+        return
+    entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+    total = 0
+    for entry in entries:
+        total += entry.stat().st_size
+        if total > STORE_BYTES:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+
+def load_dataset(uploaded_file, streaming=None, sheets=None, progress=None, **options):
+    """Parse an uploaded CSV/Excel file once per server process.
+
+    Reruns with the same bytes and parse options get the cached DataFrame back.
+    Callers must treat the returned frame as read-only since it is shared.
+    ``streaming`` defaults to chunked ingestion for CSVs above
+    STREAMING_THRESHOLD_BYTES; ``sheets`` selects workbook sheets (first sheet
+    by default); ``progress`` receives the fraction read so far. When
+    STORE_DIR is set, a columnar copy there is reused instead of re-parsing
+    across restarts.
+    """
+    key = _dataset_key(uploaded_file, streaming, sheets, options)
+    df = _parse_cache.get(key)
+    if df is None:
+        path = store_path(key)
+        table = read_store(path) if path else None
+        if table is not None:
+            df = table.to_pandas()
+        else:
+            df = _parse(uploaded_file, key[2], sheets=key[3], progress=progress, **options)
+            if path:
+                write_store(df, path)
+        _parse_cache.put(key, df)
+    return df
+
+
+def open_dataset(uploaded_file, streaming=None, sheets=None, progress=None, **options):
+    """Return the upload as a memory-mapped Arrow table, parsing it only when no stored copy exists.
+
+    Returns None when STORE_DIR is not set, pyarrow is missing or the frame cannot be stored.
+    """
+    key = _dataset_key(uploaded_file, streaming, sheets, options)
+    path = store_path(key)
+    if path is None:
+        return None
+    table = read_store(path)
+    if table is None:
+        load_dataset(uploaded_file, streaming=streaming, sheets=sheets, progress=progress, **options)
+        table = read_store(path)
+    return table
+
+
+def dataset_overview(uploaded_file, sheets=None, progress=None):
+    """(rows, columns, size in bytes, size kind, preview frame) for the upload badge.
+
+    With a stored copy the badge is read off the mapped Arrow table and the
+    size is its columnar size ("arrow"); otherwise it is the in-memory size of
+    the parsed frame ("memory").
+    """
+    table = open_dataset(uploaded_file, sheets=sheets, progress=progress)
+    if table is None:
+        df = load_dataset(uploaded_file, sheets=sheets, progress=progress)
+        return len(df), list(df.columns), ParseCache.sizeof(df), "memory", df.head()
+    return table.num_rows, table.column_names, table.nbytes, "arrow", table.slice(0, 5).to_pandas()
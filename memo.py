@@ -0,0 +1,88 @@
+import hashlib
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+from ingest import ParseCache
+
+MEMO_CACHE_BYTES = int(os.environ.get("ANALYSIS_MEMO_CACHE_MB", "256")) * 1024 * 1024
+
+
+def _nbytes(value):
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(_nbytes(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(_nbytes(v) for v in value)
+    return sys.getsizeof(value)
+
+
+class ResultCache(ParseCache):
+    """LRU cache of intermediate analysis results bounded by their approximate size in bytes"""
+
+    sizeof = staticmethod(_nbytes)
+
+    def __init__(self, max_bytes=MEMO_CACHE_BYTES):
+        super().__init__(max_bytes)
+        self.hits = 0
+        self.misses = 0
+
+
+_results = ResultCache()
+
+
+def column_digest(series):
+    """Hash of a column's values and dtype (not its name), so equal data gives equal keys"""
+    values = series.to_numpy() if isinstance(series, pd.Series) else np.asarray(series)
+    if values.dtype == object or not isinstance(series.dtype, np.dtype):
+        # strings, categoricals and nullable integers hash through pandas, element by element
+        values = pd.util.hash_pandas_object(pd.Series(series), index=False).to_numpy()
+    h = hashlib.blake2b(str(series.dtype).encode(), digest_size=16)
+    h.update(np.ascontiguousarray(values).view(np.uint8))
+    return h.hexdigest()
+
+
+def memoize(key, compute, keep=None):
+    """``compute()`` for ``key``, computed only when no result for the same key is cached.
+
+    Keys name the stage and its exact inputs, e.g. ("describe", column digest)
+    or ("associate", x digest, y digest, method, options), so a rerun only
+    recomputes stages whose inputs changed. ``keep(value)`` returning False
+    leaves a result out of the cache, e.g. one cut short by the user.
+    """
+    value = _results.get(key)
+    if value is None:
+        _results.misses += 1
+        value = compute()
+        if keep is None or keep(value):
+            _results.put(key, value)
+    else:
+        _results.hits += 1
+    return value
+
+
+def memoize_many(keys, compute_missing):
+    """Like memoize for a batch: ``keys`` maps names to keys, and ``compute_missing(names)``
+    returns {name: result} for the names not in the cache, in one vectorized call"""
+    found = {name: _results.get(key) for name, key in keys.items()}
+    missing = [name for name, value in found.items() if value is None]
+    _results.hits += len(found) - len(missing)
+    _results.misses += len(missing)
+    if missing:
+        computed = compute_missing(missing)
+        for name in missing:
+            found[name] = computed[name]
+            _results.put(keys[name], computed[name])
+    return found
+
+
+def memo_stats():
+    """Hits, misses, entries and bytes of the result cache since the process started"""
+    return {"hits": _results.hits, "misses": _results.misses, "entries": len(_results), "bytes": _results.current_bytes}
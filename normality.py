@@ -0,0 +1,121 @@
+import hashlib
+import threading
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+from scipy import stats
+
+ALPHA = 0.05
+SHAPIRO_MAX_N = 5000
+SUBSAMPLE_MAX_N = 50_000
+SUBSAMPLE_SEED = 0
+QQ_MIN_R = 0.99
+CACHE_ENTRIES = 256
+STRATEGIES = ("auto", "shapiro", "dagostino", "anderson", "qq")
+
+NormalityResult = namedtuple("NormalityResult", "test statistic p_value n normal")
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _subsample(x, size=SHAPIRO_MAX_N, seed=SUBSAMPLE_SEED):
+    """Same rows for the same data on every run, so the reported p-value is reproducible"""
+    if len(x) <= size:
+        return x
+    return np.random.default_rng(seed).choice(x, size=size, replace=False)
+
+
+def _shapiro(x):
+    sample = _subsample(x)
+    res = stats.shapiro(sample)
+    test = "shapiro" if len(sample) == len(x) else "shapiro_subsample"
+    return NormalityResult(test, res.statistic, res.pvalue, len(x), res.pvalue > ALPHA)
+
+
+def _dagostino(x):
+    res = stats.normaltest(x)
+    return NormalityResult("dagostino", res.statistic, res.pvalue, len(x), res.pvalue > ALPHA)
+
+
+def _anderson_pvalue(a2, n):
+    # D'Agostino & Stephens (1986), Table 4.9: mean and variance estimated from the sample
+    a2 = a2 * (1 + 0.75 / n + 2.25 / n ** 2)
+    if a2 >= 0.6:
+        return np.exp(1.2937 - 5.709 * a2 + 0.0186 * a2 ** 2)
+    if a2 >= 0.34:
+        return np.exp(0.9177 - 4.279 * a2 - 1.38 * a2 ** 2)
+    if a2 >= 0.2:
+        return 1 - np.exp(-8.318 + 42.796 * a2 - 59.938 * a2 ** 2)
+    return 1 - np.exp(-13.436 + 101.14 * a2 - 223.73 * a2 ** 2)
+
+
+def _anderson_statistic(x):
+    z = np.sort((x - x.mean()) / x.std(ddof=1))
+    i = np.arange(1, len(z) + 1)
+    return -len(z) - np.mean((2 * i - 1) * (stats.norm.logcdf(z) + stats.norm.logsf(z[::-1])))
+
+
+def _anderson(x):
+    a2 = _anderson_statistic(x)
+    p = float(np.clip(_anderson_pvalue(a2, len(x)), 0.0, 1.0))
+    return NormalityResult("anderson", a2, p, len(x), p > ALPHA)
+
+
+def _qq(x):
+    """Probability-plot correlation of the sample against normal quantiles.
+
+    An effect size rather than a test: at millions of rows every test rejects
+    trivial departures, while r stays near 1 for practically normal data.
+    """
+    (_, _), (_, _, r) = stats.probplot(_subsample(x), dist="norm")
+    return NormalityResult("qq", r, np.nan, len(x), r >= QQ_MIN_R)
+
+
+_TESTS = {"shapiro": _shapiro, "dagostino": _dagostino, "anderson": _anderson, "qq": _qq}
+
+
+def choose_strategy(n):
+    """Shapiro-Wilk where its p-value is accurate, on a subsample up to SUBSAMPLE_MAX_N, Q-Q effect size beyond"""
+    if n <= SUBSAMPLE_MAX_N:
+        return "shapiro"
+    return "qq"
+
+
+def _digest(x):
+    return hashlib.blake2b(np.ascontiguousarray(x).view(np.uint8), digest_size=16).hexdigest()
+
+
+def normality_test(series, strategy="auto"):
+    """Run the normality stage on one column, reusing earlier results for identical data.
+
+    Results are cached per (column contents, strategy), so reruns that do not
+    change a composite skip the test entirely.
+    """
+    x = np.asarray(series, dtype=np.float64)
+    x = x[~np.isnan(x)]
+    if len(x) < 3 or np.ptp(x) == 0:
+        return NormalityResult("none", np.nan, 0.0, len(x), False)
+    if strategy == "auto":
+        strategy = choose_strategy(len(x))
+    if strategy == "dagostino" and len(x) < 8:
+        strategy = "shapiro"
+
+    key = (_digest(x), strategy)
+    with _cache_lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key]
+    result = _TESTS[strategy](x)
+    with _cache_lock:
+        _cache[key] = result
+        while len(_cache) > CACHE_ENTRIES:
+            _cache.popitem(last=False)
+    return result
+
+
+def format_statistic(result):
+    """Short figure shown next to a normality verdict"""
+    if result.test == "qq":
+        return f"r(Q-Q) = {result.statistic:.4f}"
+    return f"p = {result.p_value:.4f}"
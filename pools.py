@@ -0,0 +1,16 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+
+class SpawnPool(ProcessPoolExecutor):
+    """Process pool on the spawn context, safe to start from the multi-threaded Streamlit server.
+
+    A spawned worker runs the parent's main script again as ``__mp_main__``
+    before it takes any work. The Streamlit entry script (analysis.py) does
+    nothing under that name, so workers start without rendering the page;
+    worker functions must therefore live in importable modules.
+    """
+
+    def __init__(self, max_workers=None, initializer=None, initargs=(), max_tasks_per_child=None):
+        super().__init__(max_workers=max_workers, mp_context=get_context("spawn"), initializer=initializer,
+                         initargs=initargs, max_tasks_per_child=max_tasks_per_child)
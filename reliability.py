@@ -0,0 +1,107 @@
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from composites import item_block
+
+OMEGA_MAX_ITER = 200
+OMEGA_TOL = 1e-6
+RELIABILITY_FIELDS = ["mean", "std", "item_total_r", "alpha_if_deleted", "loading"]
+ACCEPTABLE_ALPHA = 0.7
+# conventional bands for alpha (George & Mallery), highest first
+ALPHA_LEVELS = ((0.9, "excellent"), (0.8, "good"), (ACCEPTABLE_ALPHA, "acceptable"), (0.6, "questionable"), (0.5, "poor"))
+
+Reliability = namedtuple("Reliability", "name n alpha omega items")
+
+
+def reliability_level(alpha):
+    """Band of an alpha value: excellent, good, acceptable, questionable, poor or unacceptable"""
+    for bound, level in ALPHA_LEVELS:
+        if alpha >= bound:
+            return level
+    return "unacceptable"
+
+
+def format_reliability(value, level=None):
+    """A coefficient to three decimals, with ``level`` in brackets when given; "n/a" when it could not be computed"""
+    if np.isnan(value):
+        return "n/a"
+    return f"{value:.3f}" if level is None else f"{value:.3f} ({level})"
+
+
+def item_covariance(values):
+    """Covariance matrix, means and n of the respondents who answered every item"""
+    values = values[~np.isnan(values).any(axis=1)]
+    n = len(values)
+    means = values.mean(axis=0) if n else np.full(values.shape[1], np.nan)
+    centered = values - means
+    cov = centered.T @ centered / (n - 1) if n > 1 else np.full((values.shape[1],) * 2, np.nan)
+    return cov, means, n
+
+
+def _one_factor_loadings(corr):
+    # principal axis factoring: start from squared multiple correlations, iterate the communalities
+    k = len(corr)
+    communality = 1 - 1 / np.diag(np.linalg.pinv(corr))
+    communality = np.clip(np.nan_to_num(communality, nan=0.5), 0.0, 1.0)
+    loadings = np.zeros(k)
+    for _ in range(OMEGA_MAX_ITER):
+        reduced = corr.copy()
+        np.fill_diagonal(reduced, communality)
+        eigenvalues, eigenvectors = np.linalg.eigh(reduced)
+        loadings = eigenvectors[:, -1] * np.sqrt(max(eigenvalues[-1], 0.0))
+        updated = np.minimum(loadings ** 2, 1.0)
+        if np.max(np.abs(updated - communality)) < OMEGA_TOL:
+            break
+        communality = updated
+    return loadings if loadings.sum() >= 0 else -loadings
+
+
+def scale_reliability(cov, means, n, items, name=None):
+    """Cronbach's alpha, McDonald's omega and item statistics, all from one item covariance matrix.
+
+    With S the sum of the item variances, V the variance of the total and
+    c_i the covariance of item i with the total (row sum of the matrix),
+    dropping item i leaves V - 2 c_i + var_i and S - var_i, so alpha if
+    deleted and the corrected item-total correlation (c_i - var_i) /
+    sqrt(var_i (V - 2 c_i + var_i)) take O(k) each. Omega uses the loadings
+    of a one-factor principal axis fit of the correlation matrix.
+    """
+    k = len(items)
+    variances = np.diag(cov)
+    total_var = cov.sum()
+    item_total = cov.sum(axis=1)
+    rest_var = total_var - 2 * item_total + variances
+    with np.errstate(invalid="ignore", divide="ignore"):
+        alpha = k / (k - 1) * (1 - variances.sum() / total_var)
+        alpha_if_deleted = (k - 1) / (k - 2) * (1 - (variances.sum() - variances) / rest_var) if k > 2 else np.full(k, np.nan)
+        item_total_r = (item_total - variances) / np.sqrt(variances * rest_var)
+        std = np.sqrt(variances)
+        corr = cov / np.outer(std, std)
+    if np.isfinite(corr).all():
+        loadings = _one_factor_loadings(corr)
+        common = loadings.sum() ** 2
+        omega = common / (common + np.sum(1 - loadings ** 2))
+    else:
+        loadings, omega = np.full(k, np.nan), np.nan
+    table = pd.DataFrame({"mean": means, "std": std, "item_total_r": item_total_r, "alpha_if_deleted": alpha_if_deleted,
+                          "loading": loadings}, index=pd.Index(items, name="item"), columns=RELIABILITY_FIELDS)
+    return Reliability(name, n, float(alpha), float(omega), table)
+
+
+def composite_reliability(data, spec):
+    """Reliability of a composites.Composite, with its reverse-coded items reversed; None below two items.
+
+    Reversing an item only flips the sign of its row and column of the
+    covariance matrix, so the matrix is computed once from the raw answers.
+    Weights are ignored: alpha and omega describe the items as a scale.
+    """
+    if len(spec.items) < 2:
+        return None
+    cov, means, n = item_covariance(item_block(data, list(spec.items)))
+    if spec.reverse:
+        sign = np.where(np.isin(spec.items, spec.reverse), -1.0, 1.0)
+        cov = cov * np.outer(sign, sign)
+        means = np.where(sign < 0, spec.scale_min + spec.scale_max - means, means)
+    return scale_reliability(cov, means, n, list(spec.items), spec.name)
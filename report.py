@@ -0,0 +1,654 @@
+import atexit
+import os
+import tempfile
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from io import BytesIO
+
+from PIL import Image as PILImage
+
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, Image
+
+from charts import get_chart
+from ingest import ParseCache
+from normality import format_statistic
+from reliability import ACCEPTABLE_ALPHA, format_reliability, reliability_level
+
+try:
+    from svglib.svglib import svg2rlg
+except ImportError:
+    svg2rlg = None
+
+REPORT_SECTIONS = ("cover", "descriptives", "reliability", "normality", "correlation", "groups", "interpretation", "conclusion", "build")
+REPORT_CACHE_BYTES = 512 * 1024 * 1024
+REPORT_WORKERS = 2
+REPORT_DIR = os.environ.get("ANALYSIS_REPORT_DIR", os.path.join(tempfile.gettempdir(), "analysis-reports"))
+REPORT_DPI = int(os.environ.get("ANALYSIS_REPORT_DPI", 200))
+REPORT_MIN_DPI = 72
+REPORT_MAX_PIXELS = int(os.environ.get("ANALYSIS_REPORT_MAX_MEGAPIXELS", 150)) * 1_000_000
+REPORT_IMAGE_FORMAT = os.environ.get("ANALYSIS_REPORT_IMAGE_FORMAT", "png")
+REPORT_PALETTE_COLORS = int(os.environ.get("ANALYSIS_REPORT_PALETTE_COLORS", 0))
+REPORT_JPEG_QUALITY = int(os.environ.get("ANALYSIS_REPORT_JPEG_QUALITY", 85))
+
+ImageBudget = namedtuple("ImageBudget", "dpi fmt colors quality")
+
+
+INFO_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1565c0')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 13),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('TOPPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f5f5f5')),
+    ('GRID', (0, 0), (-1, -1), 1.5, colors.HexColor('#1565c0')),
+    ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 1), (-1, -1), 11),
+    ('TOPPADDING', (0, 1), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
+])
+
+STATS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#e3f2fd')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#0d47a1')),
+    ('ALIGN', (0, 0), (1, -1), 'CENTER'),
+    ('ALIGN', (2, 0), (2, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('TOPPADDING', (0, 0), (-1, -1), 6),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9f9f9')]),
+])
+
+FREQ_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#fff3e0')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#e65100')),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#fffbf5')]),
+])
+
+NORM_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#e8f5e9')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#2e7d32')),
+    ('ALIGN', (0, 0), (2, -1), 'CENTER'),
+    ('ALIGN', (3, 0), (3, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9f9f9')]),
+])
+
+CORR_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#e3f2fd')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#0d47a1')),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('ALIGN', (0, 0), (1, -1), 'CENTER'),
+    ('ALIGN', (2, 0), (2, -1), 'LEFT'),
+    ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9f9f9')]),
+])
+
+GROUP_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#ede7f6')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#4527a0')),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+    ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('TOPPADDING', (0, 0), (-1, -1), 5),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9f9f9')]),
+])
+
+
+def _grid_height(n_panels, width, max_cols=4):
+    """Height that keeps the aspect of a small-multiples figure drawn ``width`` wide (see charts._panel_grid)"""
+    cols = min(n_panels, max_cols)
+    rows = -(-n_panels // cols)
+    return width * (2.6 * rows + 0.6) / (3.2 * cols)
+
+
+def _group_story(groups, t, lang, styles, budget):
+    """Subgroup section: a summary table, the small multiples and one short section per group"""
+    heading_style, subheading_style, body_style = styles
+    story = [Paragraph(f"3.1 {t('group_analysis')} {groups.by}", heading_style)]
+    if groups.dropped:
+        story.append(Paragraph(t('group_dropped').format(rows=f"{groups.dropped:,}", levels=len(groups.levels)), body_style))
+    # every table row is formatted in one pass over the columns, then picked per group below
+    corr = {}
+    if groups.corr is not None:
+        corr = {level: (f"{n:,}", f"{r:.4f}", f"{p:.4f}", f"{p_adj:.4f}") for level, n, r, p, p_adj in
+                zip(groups.corr.index, groups.corr['n'], groups.corr['r'], groups.corr['p'], groups.corr['p_adj'])}
+        rows = [[t('group'), 'n', 'r', 'p', t('p_adjusted'), 'X_total', 'Y_total']]
+        for level, cells in corr.items():
+            x_norm, y_norm = groups.normality[level]
+            rows.append([level, *cells, format_statistic(x_norm), format_statistic(y_norm)])
+        table = Table(rows, colWidths=[1.3*inch, 0.6*inch, 0.8*inch, 0.8*inch, 0.9*inch, 1.05*inch, 1.05*inch], repeatRows=1)
+        table.setStyle(GROUP_TABLE_STYLE)
+        story += [Paragraph(t('group_corr'), subheading_style), table, Spacer(1, 0.2*inch)]
+        story.append(_chart_flowable('group_scatter', groups.chart_specs['scatter'], groups.by, lang,
+                                     6*inch, _grid_height(len(groups.levels), 6*inch), budget))
+    for col in ("X_total", "Y_total"):
+        if col in groups.chart_specs:
+            story.append(_chart_flowable('group_hist', groups.chart_specs[col], f"{groups.by}|{col}", lang,
+                                         6*inch, _grid_height(len(groups.levels), 6*inch), budget))
+
+    desc = groups.desc
+    desc_rows = {level: [] for level in groups.levels}
+    for level, variable, count, mean, std, median, minimum, maximum in zip(
+            desc.index.get_level_values("group"), desc.index.get_level_values("variable"), desc['count'], desc['mean'],
+            desc['std'], desc['median'], desc['min'], desc['max']):
+        desc_rows[level].append([variable, f"{count:,}", f"{mean:.3f}", f"{std:.3f}", f"{median:.3f}", f"{minimum:.3f}", f"{maximum:.3f}"])
+    for level in groups.levels:
+        story.append(Paragraph(f"{t('group')}: {level}", subheading_style))
+        if level in corr:
+            n, r, p, _ = corr[level]
+            story.append(Paragraph(f"r = {r}, p = {p}, n = {n}", body_style))
+        rows = [[t('variable'), t('count'), t('mean'), t('std_dev'), t('median'), t('min'), t('max')], *desc_rows[level]]
+        table = Table(rows, colWidths=[1.3*inch, 0.8*inch, 0.9*inch, 0.9*inch, 0.9*inch, 0.85*inch, 0.85*inch], repeatRows=1)
+        table.setStyle(GROUP_TABLE_STYLE)
+        story += [table, Spacer(1, 0.2*inch)]
+    return story
+
+
+def _reliability_story(reliability, t, styles):
+    """Reliability section: alpha and omega of every composite, then its item statistics"""
+    heading_style, subheading_style, body_style = styles
+    story = [Paragraph(f"1.1 {t('reliability_analysis')}", heading_style), Paragraph(t('reliability_desc'), body_style),
+             Spacer(1, 0.15*inch)]
+    rows = [[t('variable'), t('n_items'), 'n', t('cronbach_alpha'), t('mcdonald_omega')]]
+    for name, rel in reliability.items():
+        rows.append([name, str(len(rel.items)), f"{rel.n:,}", format_reliability(rel.alpha, t(f'alpha_{reliability_level(rel.alpha)}')),
+                     format_reliability(rel.omega)])
+    table = Table(rows, colWidths=[1.4*inch, 0.7*inch, 0.9*inch, 2.0*inch, 1.3*inch], repeatRows=1)
+    table.setStyle(GROUP_TABLE_STYLE)
+    story += [table, Spacer(1, 0.2*inch)]
+    for name, rel in reliability.items():
+        story.append(Paragraph(name, subheading_style))
+        rows = [[t('item'), t('mean'), t('std_dev'), t('item_total_r'), t('alpha_if_deleted'), t('factor_loading')]]
+        for item, stat in rel.items.iterrows():
+            rows.append([item] + [format_reliability(stat[field]) for field in ("mean", "std", "item_total_r", "alpha_if_deleted", "loading")])
+        table = Table(rows, colWidths=[1.3*inch, 0.8*inch, 0.8*inch, 1.3*inch, 1.2*inch, 1.1*inch], repeatRows=1)
+        table.setStyle(GROUP_TABLE_STYLE)
+        story += [table, Spacer(1, 0.2*inch)]
+    return story
+
+
+def _composite_finding(reliability, t):
+    """The findings sentence on the composites: reliable only when every scale has an alpha of at least 0.70"""
+    if not reliability:
+        return t('pdf_composite_text_unrated')
+    # NaN alphas fail the comparison too, so a scale without an alpha never counts as reliable
+    if all(rel.alpha >= ACCEPTABLE_ALPHA for rel in reliability.values()):
+        return t('pdf_composite_text')
+    return t('pdf_composite_text_low')
+
+
+@lru_cache(maxsize=None)
+def report_styles(lang):
+    """(title, heading, subheading, body, footer) paragraph styles, built once per report language"""
+    styles = getSampleStyleSheet()
+    title_style = ParagraphStyle(f'CustomTitle-{lang}', parent=styles['Heading1'], fontSize=26, textColor=colors.HexColor('#0d47a1'), spaceAfter=20, alignment=TA_CENTER, fontName='Helvetica-Bold')
+    heading_style = ParagraphStyle(f'CustomHeading-{lang}', parent=styles['Heading2'], fontSize=18, textColor=colors.HexColor('#1565c0'), spaceAfter=15, spaceBefore=20, fontName='Helvetica-Bold')
+    subheading_style = ParagraphStyle(f'CustomSubHeading-{lang}', parent=styles['Heading3'], fontSize=14, textColor=colors.HexColor('#1976d2'), spaceAfter=10, spaceBefore=15, fontName='Helvetica-Bold')
+    body_style = ParagraphStyle(f'CustomBody-{lang}', parent=styles['Normal'], fontSize=11, alignment=TA_JUSTIFY, spaceAfter=10, leading=14)
+    footer_style = ParagraphStyle(f'Footer-{lang}', parent=body_style, fontSize=9, alignment=TA_CENTER, textColor=colors.grey, leading=12)
+    return title_style, heading_style, subheading_style, body_style, footer_style
+
+
+def image_budget(n_images, width=6, height=4.3):
+    """Resolution and encoding for the report's charts.
+
+    The configured DPI is lowered, down to REPORT_MIN_DPI, until ``n_images``
+    charts of at most ``width`` x ``height`` inches fit in REPORT_MAX_PIXELS,
+    so a report with hundreds of variables stays a manageable file.
+    """
+    dpi = REPORT_DPI
+    if n_images:
+        dpi = min(dpi, int((REPORT_MAX_PIXELS / (n_images * width * height)) ** 0.5))
+    fmt = REPORT_IMAGE_FORMAT
+    if fmt == "vector" and svg2rlg is None:
+        fmt = "png"
+    return ImageBudget(max(dpi, REPORT_MIN_DPI), fmt, REPORT_PALETTE_COLORS, REPORT_JPEG_QUALITY)
+
+
+def _encode(png, budget):
+    """Re-encode a rendered PNG as JPEG or as a palette PNG when the budget asks for it"""
+    if budget.fmt != "jpeg" and not budget.colors:
+        return png
+    image = PILImage.open(BytesIO(png)).convert("RGB")
+    out = BytesIO()
+    if budget.fmt == "jpeg":
+        image.save(out, format="JPEG", quality=budget.quality, optimize=True)
+    else:
+        image.quantize(colors=budget.colors).save(out, format="PNG", optimize=True)
+    return out.getvalue()
+
+
+def _chart_flowable(kind, spec, column, lang, width, height, budget):
+    """A chart as a PDF flowable: vector drawing when svglib is available and asked for, else an image"""
+    if budget.fmt == "vector":
+        drawing = svg2rlg(BytesIO(get_chart(kind, spec, column, lang, budget.dpi, fmt="svg").image))
+        drawing.scale(width / drawing.width, height / drawing.height)
+        drawing.width, drawing.height = width, height
+        return drawing
+    png = get_chart(kind, spec, column, lang, budget.dpi).image
+    return Image(BytesIO(_encode(png, budget)), width=width, height=height)
+
+
+class ReportCancelled(Exception):
+    pass
+
+
+def build_report(ctx, t, progress=None, cancel=None):
+    """Write the PDF for one analysis to a file in REPORT_DIR and return its path.
+
+    ``ctx`` holds everything the report shows (see app.py) and ``t`` is a
+    translator already bound to the report language, so this runs outside a
+    Streamlit session. ``progress(fraction, section)`` is called as each
+    section starts and during the final layout pass; ``cancel()`` is polled at
+    the same points and raises ReportCancelled when it returns True. The
+    partly written file is removed when the build is cancelled or fails.
+    """
+    def step(section, fraction=None):
+        if cancel is not None and cancel():
+            raise ReportCancelled()
+        if progress is not None:
+            index = REPORT_SECTIONS.index(section)
+            progress(fraction if fraction is not None else index / len(REPORT_SECTIONS), section)
+
+    def on_build_progress(kind, value):
+        # ReportLab reports the estimated page count first, then pages laid out so far
+        if kind == "SIZE_EST":
+            build_size[0] = max(value, 1)
+        elif kind == "PROGRESS":
+            done = (len(REPORT_SECTIONS) - 1 + min(value / build_size[0], 1.0)) / len(REPORT_SECTIONS)
+            step("build", done)
+
+    build_size = [1]
+    groups = ctx.get('groups')
+    budget = image_budget(len(ctx['chart_specs']) + 1 + (len(groups.chart_specs) if groups else 0))
+    os.makedirs(REPORT_DIR, exist_ok=True)
+    fd, path = tempfile.mkstemp(prefix="report-", suffix=".pdf", dir=REPORT_DIR)
+    os.close(fd)
+    try:
+        _build_story(path, ctx, t, step, on_build_progress, budget)
+    except BaseException:
+        os.remove(path)
+        raise
+    return path
+
+
+def _build_story(path, ctx, t, step, on_build_progress, budget):
+    n_rows, variables, likert = ctx['n'], ctx['variables'], ctx['likert']
+    x_items, y_items, desc_table, chart_specs, freq_tables = ctx['x_items'], ctx['y_items'], ctx['desc_table'], ctx['chart_specs'], ctx['freq_tables']
+    x_norm, y_norm, corr_method, method = ctx['x_norm'], ctx['y_norm'], ctx['corr_method'], ctx['method']
+    r, p, strength, direction = ctx['r'], ctx['p'], ctx['strength'], ctx['direction']
+    perm, p_asymptotic, ci, ci_level = ctx['perm'], ctx['p_asymptotic'], ctx['ci'], ctx['ci_level']
+    scatter_spec, lang, groups = ctx['scatter_spec'], ctx['lang'], ctx.get('groups')
+
+    doc = SimpleDocTemplate(path, pagesize=letter, rightMargin=50, leftMargin=50, topMargin=50, bottomMargin=30)
+    story = []
+    title_style, heading_style, subheading_style, body_style, footer_style = report_styles(lang)
+    
+    step('cover')
+    story.append(Paragraph(f"📊 {t('pdf_title')}", title_style))
+    story.append(Spacer(1, 0.5*inch))
+    
+    info_data = [
+        [t('pdf_report_info'), ''],
+        [t('pdf_generated'), datetime.now().strftime('%Y-%m-%d %H:%M:%S')],
+        [t('pdf_total_resp'), str(n_rows)],
+        [t('pdf_x_vars'), ', '.join(x_items) if x_items else 'N/A'],
+        [t('pdf_y_vars'), ', '.join(y_items) if y_items else 'N/A'],
+        [t('method'), method],
+    ]
+    info_table = Table(info_data, colWidths=[2.5*inch, 4*inch])
+    info_table.setStyle(INFO_TABLE_STYLE)
+    story.append(info_table)
+    story.append(Spacer(1, 0.4*inch))
+    
+    story.append(Paragraph(t('pdf_exec_summary'), heading_style))
+    sig_text = t('pdf_statistically_sig') if p < 0.05 else t('pdf_not_statistically_sig')
+    
+    summary_text = f"""{t('pdf_exec_text_1')} <b>{n_rows} {t('pdf_exec_text_2')}</b> {strength.lower()} {direction.lower()} {t('pdf_exec_text_3')} <b>r = {r:.3f}</b>, 
+    <b>{t('pdf_exec_text_4')} {p:.4f}</b>). {t('pdf_exec_text_5')} <b>{sig_text}</b> 
+    {t('pdf_exec_text_6')} <b>{method}</b> {t('pdf_exec_text_7')}"""
+    
+    story.append(Paragraph(summary_text, body_style))
+    story.append(PageBreak())
+    
+    step('descriptives')
+    story.append(Paragraph(f"1. {t('pdf_desc_stats')}", heading_style))
+    story.append(Paragraph(t('descriptive_desc'), body_style))
+    story.append(Spacer(1, 0.2*inch))
+    
+    for idx, col in enumerate(variables):
+        story.append(Paragraph(f"{t('pdf_variable')} {col}", subheading_style))
+        
+        if col in desc_table.index:
+            desc = desc_table.loc[col]
+            
+            stats_data = [
+                [t('pdf_statistic'), t('pdf_value'), t('pdf_interpretation_col')],
+                [t('count'), str(int(desc['count'])), t('size')],
+                [t('mean'), f"{desc['mean']:.3f}", t('central_tendency')],
+                [t('median'), f"{desc['median']:.3f}", t('central_tendency')],
+                [t('std_dev'), f"{desc['std']:.3f}", t('spread')],
+                [t('variance'), f"{desc['var']:.3f}", t('spread')],
+                [t('min'), f"{desc['min']:.3f}", t('min')],
+                [t('max'), f"{desc['max']:.3f}", t('max')],
+                [t('range'), f"{desc['range']:.3f}", t('range')],
+            ]
+            
+            stats_table = Table(stats_data, colWidths=[1.5*inch, 1.3*inch, 3.7*inch])
+            stats_table.setStyle(STATS_TABLE_STYLE)
+            story.append(stats_table)
+            story.append(Spacer(1, 0.2*inch))
+            
+          
+            try:
+                story.append(Paragraph(f"{t('pdf_distribution')} {col}", subheading_style))
+                img = _chart_flowable('hist', chart_specs[col]['hist'], col, lang, 6*inch, 3*inch, budget)
+                story.append(img)
+                story.append(Spacer(1, 0.15*inch))
+            except Exception as e:
+                story.append(Paragraph(f"<i>Chart generation error: {str(e)}</i>", body_style))
+            
+            
+            if col in likert:
+                story.append(Paragraph(f"{t('frequency_dist')} - {col}:", subheading_style))
+                freq = freq_tables[col]
+                
+                freq_data = [[t('category'), t('frequency'), t('percentage')]]
+                for _, row in freq.iterrows():
+                    freq_data.append([
+                        str(row[t('category')]),
+                        str(row[t('frequency')]),
+                        f"{row[t('percentage')]:.1f}%"
+                    ])
+                
+                freq_table_pdf = Table(freq_data, colWidths=[2*inch, 2*inch, 2*inch])
+                freq_table_pdf.setStyle(FREQ_TABLE_STYLE)
+                story.append(freq_table_pdf)
+                story.append(Spacer(1, 0.2*inch))
+        
+        if idx < len(variables) - 1:
+            story.append(Spacer(1, 0.15*inch))
+    
+    story.append(PageBreak())
+
+    if ctx.get('reliability'):
+        step('reliability')
+        story += _reliability_story(ctx['reliability'], t, (heading_style, subheading_style, body_style))
+        story.append(PageBreak())
+    
+    step('normality')
+    story.append(Paragraph(f"2. {t('pdf_normality_test')}", heading_style))
+    story.append(Paragraph(f"{t('pdf_normality_text')} X_total: {t(f'norm_{x_norm.test}')}; Y_total: {t(f'norm_{y_norm.test}')}.", body_style))
+    story.append(Spacer(1, 0.2*inch))
+    
+    norm_data = [
+        [t('variable'), t('pdf_statistic'), t('distribution'), t('pdf_interpretation_col')],
+        ['X_total', format_statistic(x_norm), 
+         f'✓ {t("normal")}' if x_norm.normal else f'✗ {t("non_normal")}',
+         t('pdf_data_follows') if x_norm.normal else t('pdf_data_not_follows')],
+        ['Y_total', format_statistic(y_norm),
+         f'✓ {t("normal")}' if y_norm.normal else f'✗ {t("non_normal")}',
+         t('pdf_data_follows') if y_norm.normal else t('pdf_data_not_follows')]
+    ]
+    
+    norm_table = Table(norm_data, colWidths=[1.1*inch, 1.3*inch, 1.2*inch, 2.9*inch])
+    norm_table.setStyle(NORM_TABLE_STYLE)
+    story.append(norm_table)
+    story.append(Spacer(1, 0.3*inch))
+    
+    
+    method_box = f"""<b>{t('pdf_selected_method')} {method}</b><br/><br/>
+    {t('pdf_method_text_1')} <b>{method}</b> {t('pdf_method_text_2')} 
+    {t('pdf_pearson_suitable') if corr_method == 'pearson' else t('pdf_spearman_suitable')}
+    """
+    story.append(Paragraph(method_box, body_style))
+    story.append(PageBreak())
+    
+    
+    step('correlation')
+    story.append(Paragraph(f"3. {t('pdf_corr_analysis')}", heading_style))
+    story.append(Paragraph(f"{t('association')} X_total {t('and')} Y_total {t('method').lower()} {method}.", body_style))
+    story.append(Spacer(1, 0.2*inch))
+    
+    
+    corr_data = [
+        [t('pdf_metric'), t('pdf_value'), t('pdf_interp')],
+        [t('method'), method, t('pdf_method_used')],
+        [t('coefficient') + ' (r)', f'{r:.4f}', f'{strength} {direction.lower()} {t("pdf_relationship")}'],
+        ['p-value', f'{p:.4f}', f'{t("pdf_statistically_sig") if p < 0.05 else t("pdf_not_statistically_sig")} (α = 0.05)'],
+        [t('pdf_sample_size') + ' (n)', str(n_rows), t('pdf_num_obs')],
+        [t('strength'), strength, t('strength')],
+        [t('direction'), direction, t('positive') if r > 0 else t('negative')],
+    ]
+    if perm:
+        corr_data += [
+            [t('p_permutation'), f'{perm.p_value:.4f}', f"± {perm.mc_error:.4f}, {perm.permutations:,} {t('permutations')} ({t('perm_' + perm.status)})"],
+            [t('p_asymptotic'), f'{p_asymptotic:.4f}', method],
+        ]
+    if ci:
+        corr_data += [
+            [f"{ci_level} {t('ci_bca')}", f'[{ci.bca[0]:.4f}, {ci.bca[1]:.4f}]', f"{ci.replicates:,} {t('bootstrap_resamples')}"],
+            [f"{ci_level} {t('ci_percentile')}", f'[{ci.percentile[0]:.4f}, {ci.percentile[1]:.4f}]', f"{ci.replicates:,} {t('bootstrap_resamples')}"],
+        ]
+    
+    corr_table = Table(corr_data, colWidths=[2*inch, 1.5*inch, 3*inch])
+    corr_table.setStyle(CORR_TABLE_STYLE)
+    story.append(corr_table)
+    story.append(Spacer(1, 0.3*inch))
+    
+    
+    story.append(Paragraph(t('pdf_scatter_plot'), subheading_style))
+    story.append(Spacer(1, 0.1*inch))
+    
+    try:
+        img_scatter = _chart_flowable('scatter', scatter_spec, "X_total|Y_total", lang, 6*inch, 4.3*inch, budget)
+        story.append(img_scatter)
+    except Exception as e:
+        story.append(Paragraph(f"<i>Error: {str(e)}</i>", body_style))
+    
+    story.append(PageBreak())
+
+    if groups is not None:
+        step('groups')
+        story += _group_story(groups, t, lang, (heading_style, subheading_style, body_style), budget)
+        story.append(PageBreak())
+    
+    step('interpretation')
+    story.append(Paragraph(f"4. {t('pdf_interpretation').upper()}", heading_style))
+    story.append(Paragraph(t('pdf_key_findings'), body_style))
+    story.append(Spacer(1, 0.2*inch))
+    
+
+    story.append(Paragraph(t('pdf_strength_rel'), subheading_style))
+    substantial_text = t('pdf_substantial') if abs(r) > 0.5 else t('pdf_moderate')
+    strength_interp = f"""{t('pdf_strength_text_1')} <b>{r:.4f}</b> {t('pdf_strength_text_2')} <b>{strength.lower()}</b> {t('pdf_strength_text_3')} 
+    {substantial_text} {t('pdf_between_vars')}"""
+    story.append(Paragraph(strength_interp, body_style))
+    story.append(Spacer(1, 0.15*inch))
+    
+    
+    story.append(Paragraph(t('pdf_direction_rel'), subheading_style))
+    direction_text = t('pdf_increase') if r > 0 else t('pdf_decrease')
+    movement = t('pdf_same_direction') if r > 0 else t('pdf_opposite_direction')
+    dir_type = t('pdf_direct') if r > 0 else t('pdf_inverse')
+    dir_interp = f"""{t('pdf_direction_text_1')} <b>{direction.lower()}</b> {t('pdf_direction_text_2')} <b>{direction_text}</b>. 
+    {t('pdf_direction_text_3')} <b>{dir_type}</b> {t('pdf_direction_text_4')} {movement}."""
+    story.append(Paragraph(dir_interp, body_style))
+    story.append(Spacer(1, 0.15*inch))
+    
+
+    story.append(Paragraph(t('pdf_stat_sig'), subheading_style))
+    sig_result = t('pdf_reject_null') if p < 0.05 else t('pdf_cannot_reject')
+    sig_interp = f"""{t('pdf_sig_text_1')} <b>{p:.4f}</b>, {t('pdf_sig_text_2')} <b>{t('significant') if p < 0.05 else t('not_significant')}</b>. 
+    {t('pdf_sig_text_3')} {sig_result}."""
+    story.append(Paragraph(sig_interp, body_style))
+    story.append(Spacer(1, 0.15*inch))
+    
+
+    story.append(Paragraph(t('pdf_important_note'), subheading_style))
+    note_text = f"""<b>{t('pdf_causation')}</b> {t('pdf_sig_association') if p < 0.05 else t('pdf_an_association')} {t('pdf_causation_text')}"""
+    story.append(Paragraph(note_text, body_style))
+    story.append(PageBreak())
+    
+    
+    step('conclusion')
+    story.append(Paragraph(f"5. {t('pdf_conclusion').upper()}", heading_style))
+    story.append(Spacer(1, 0.2*inch))
+    
+    story.append(Paragraph(t('pdf_summary'), subheading_style))
+    
+    reliability = ctx.get('reliability', {})
+    reliability_text = "; ".join(t('reliability_summary').format(name=name, alpha=format_reliability(rel.alpha, t(f'alpha_{reliability_level(rel.alpha)}')),
+                                                                 omega=format_reliability(rel.omega), n=f"{rel.n:,}")
+                                 for name, rel in reliability.items())
+    findings_list = f"""
+    <b>1. {t('pdf_desc_analysis_sum')}</b> {t('pdf_desc_text')} {len(variables)} {t('pdf_desc_text_2')}<br/><br/>
+    
+    <b>2. {t('pdf_composite')}</b> {_composite_finding(reliability, t)} {reliability_text}<br/><br/>
+    
+    <b>3. {t('pdf_corr_analysis_sum')}</b> {t('pdf_corr_text_1')} <b>{strength.lower()} {direction.lower()}</b> (r = {r:.4f}) 
+    {t('pdf_corr_text_2')} <b>{t('significant') if p < 0.05 else t('not_significant')}</b> {t('pdf_corr_text_3')}<br/><br/>
+    
+    <b>4. {t('pdf_method_rigor')}</b> {t('pdf_method_text')} ({method}) {t('pdf_method_text_2')}<br/><br/>
+    
+    <b>5. {t('pdf_academic')}</b> {t('pdf_academic_text')}
+    """
+    story.append(Paragraph(findings_list, body_style))
+    story.append(Spacer(1, 0.3*inch))
+    
+
+    story.append(Paragraph(t('pdf_recommendations'), subheading_style))
+    recommendations = f"""
+    <b>1.</b> {t('pdf_rec_1')}<br/><br/>
+    <b>2.</b> {t('pdf_rec_2')}<br/><br/>
+    <b>3.</b> {t('pdf_rec_3')}<br/><br/>
+    <b>4.</b> {t('pdf_rec_4')}
+    """
+    story.append(Paragraph(recommendations, body_style))
+    
+    
+    story.append(Spacer(1, 0.6*inch))
+    footer_text = f"""<i>{t('pdf_footer')} {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</i>"""
+    story.append(Paragraph(footer_text, footer_style))
+    
+
+    step('build')
+    doc.setProgressCallBack(on_build_progress)
+    doc.build(story)
+
+
+class ReportCache(ParseCache):
+    """LRU cache of finished report files bounded by their size on disk; dropped files are deleted"""
+
+    @staticmethod
+    def sizeof(path):
+        return os.path.getsize(path)
+
+    def evicted(self, path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+class ReportJob:
+    """One background build of a report; progress, section and status are read by the UI"""
+
+    def __init__(self, fingerprint):
+        self.fingerprint = fingerprint
+        self.progress = 0.0
+        self.section = REPORT_SECTIONS[0]
+        self.status = "running"
+        self.error = None
+        self.future = None
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def _update(self, fraction, section):
+        self.progress, self.section = fraction, section
+
+    def run(self, ctx, t):
+        try:
+            path = build_report(ctx, t, self._update, self.cancelled)
+        except ReportCancelled:
+            self.status = "cancelled"
+            return None
+        except Exception as e:
+            self.status, self.error = "failed", e
+            return None
+        size = os.path.getsize(path)
+        if not _report_cache.put(self.fingerprint, path):
+            # the cache has already deleted the file, so it cannot be offered for download
+            self.status = "failed"
+            self.error = ValueError(f"the report is {size / 2**20:.1f} MB, more than the {_report_cache.max_bytes / 2**20:.1f} MB report cache")
+            return None
+        self.progress, self.status = 1.0, "done"
+        return path
+
+
+_report_cache = ReportCache(REPORT_CACHE_BYTES)
+atexit.register(_report_cache.clear)
+_report_jobs = {}
+_report_jobs_lock = threading.Lock()
+_report_executor = ThreadPoolExecutor(max_workers=REPORT_WORKERS, thread_name_prefix="report")
+
+
+def cached_report(fingerprint):
+    """Path of the finished report for a fingerprint, if it is still on disk"""
+    path = _report_cache.get(fingerprint)
+    if path is not None and os.path.exists(path):
+        return path
+    return None
+
+
+def report_job(fingerprint):
+    """The running or most recent job for a fingerprint, if any"""
+    with _report_jobs_lock:
+        return _report_jobs.get(fingerprint)
+
+
+def submit_report(fingerprint, ctx, t):
+    """Start building a report in the background unless the same one is already running"""
+    with _report_jobs_lock:
+        job = _report_jobs.get(fingerprint)
+        if job is not None and job.status == "running":
+            return job
+        job = _report_jobs[fingerprint] = ReportJob(fingerprint)
+        # finished jobs only matter until their report is in the cache
+        for key in [k for k, j in _report_jobs.items() if j.status != "running" and k != fingerprint]:
+            del _report_jobs[key]
+    job.future = _report_executor.submit(job.run, ctx, t)
+    return job
@@ -0,0 +1,135 @@
+"""Measure how long the app takes to start, so slow imports are caught before they ship.
+
+    python startup_benchmark.py --out startup.json
+    python startup_benchmark.py --baseline startup.json
+
+Every measurement runs in a fresh interpreter, so nothing is already in
+``sys.modules``. The report has an import-time breakdown (``python -X
+importtime``) per app module, by top-level package, and the time to first
+render: the app script run once with Streamlit's AppTest, without a
+dataset, which is what a visitor opening the Home tab waits for. It also
+lists any heavy library that first render loaded. Those should only load
+once a dataset is uploaded.
+
+With ``--baseline`` the run is compared to an earlier report. The exit
+status is 1 when first render is more than ``--tolerance`` slower, or
+when first render loads a heavy library.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+APP = "analysis.py"
+# what first paint imports, then the analysis stack in the order an upload and report pull it in
+MODULES = ("streamlit", "translations", "ingest", "engine", "charts", "report")
+HEAVY_MODULES = ("numpy", "pandas", "scipy", "matplotlib", "seaborn", "pyarrow", "reportlab", "PIL")
+TOP_PACKAGES = 8
+
+FIRST_RENDER = """
+import json, sys, time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+imported = time.perf_counter()
+app = AppTest.from_file({app!r}, default_timeout=120).run()
+done = time.perf_counter()
+print(json.dumps({{"import_s": imported - start, "run_s": done - imported, "total_s": done - start,
+                  "exceptions": [e.message for e in app.exception],
+                  "heavy_loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def _run(args, **kwargs):
+    here = os.path.dirname(os.path.abspath(__file__))
+    return subprocess.run([sys.executable, *args], cwd=here, capture_output=True, text=True, check=True, **kwargs)
+
+
+def import_breakdown(module):
+    """Import time of ``module`` in a fresh interpreter, in ms: the total and the slowest top-level packages"""
+    stderr = _run(["-X", "importtime", "-c", f"import {module}"]).stderr
+    total, packages = 0, {}
+    for line in stderr.splitlines()[1:]:
+        self_us, cumulative, name = line[len("import time:"):].split("|")
+        if name.strip() == "site" and not name.startswith("  "):
+            # everything up to here is interpreter startup, the same for every module
+            total, packages = 0, {}
+            continue
+        if not name.startswith("  "):
+            total += int(cumulative)
+        # self times add up without counting nested imports twice
+        package = name.strip().split(".")[0]
+        packages[package] = packages.get(package, 0) + int(self_us) / 1000
+    top = sorted(packages.items(), key=lambda item: -item[1])[:TOP_PACKAGES]
+    return {"total_ms": round(total / 1000, 1), "packages": {name: round(ms, 1) for name, ms in top}}
+
+
+def first_render():
+    """One run of the app script with no dataset, in a fresh interpreter"""
+    here = os.path.dirname(os.path.abspath(__file__))
+    code = FIRST_RENDER.format(app=os.path.join(here, APP), heavy=HEAVY_MODULES)
+    return json.loads(_run(["-c", code]).stdout.strip().splitlines()[-1])
+
+
+def run_benchmark(repeat=3):
+    """Median import and first-render times over ``repeat`` fresh interpreters"""
+    imports = {module: [import_breakdown(module) for _ in range(repeat)] for module in MODULES}
+    renders = [first_render() for _ in range(repeat)]
+    return {
+        "python": sys.version.split()[0],
+        "repeat": repeat,
+        "imports": {module: min(runs, key=lambda run: run["total_ms"]) | {"median_ms": round(statistics.median(run["total_ms"] for run in runs), 1)}
+                    for module, runs in imports.items()},
+        "first_render": {
+            "import_s": round(statistics.median(r["import_s"] for r in renders), 3),
+            "run_s": round(statistics.median(r["run_s"] for r in renders), 3),
+            "total_s": round(statistics.median(r["total_s"] for r in renders), 3),
+            "exceptions": renders[-1]["exceptions"],
+            "heavy_loaded": sorted({m for r in renders for m in r["heavy_loaded"]}),
+        },
+    }
+
+
+def regressions(result, baseline, tolerance):
+    """Messages for everything in ``result`` that is worse than ``baseline``"""
+    found = []
+    render, before = result["first_render"], baseline["first_render"]
+    if render["total_s"] > before["total_s"] * (1 + tolerance):
+        found.append(f"first render {render['total_s']:.2f}s, baseline {before['total_s']:.2f}s")
+    for module, stats in result["imports"].items():
+        if module in baseline["imports"] and stats["median_ms"] > baseline["imports"][module]["median_ms"] * (1 + tolerance):
+            found.append(f"import {module} {stats['median_ms']:.0f}ms, baseline {baseline['imports'][module]['median_ms']:.0f}ms")
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import-time breakdown and time to first render of the app.")
+    parser.add_argument("--repeat", type=int, default=3, help="fresh interpreters per measurement (default: 3)")
+    parser.add_argument("--out", metavar="JSON", help="write the results here")
+    parser.add_argument("--baseline", metavar="JSON", help="compare against an earlier --out file")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown against the baseline (default: 0.25)")
+    args = parser.parse_args(argv)
+
+    result = run_benchmark(max(1, args.repeat))
+    for module, stats in result["imports"].items():
+        packages = ", ".join(f"{name} {ms:.0f}" for name, ms in stats["packages"].items())
+        print(f"import {module:<13} {stats['median_ms']:8.0f} ms   ({packages})")
+    render = result["first_render"]
+    print(f"first render       {render['total_s'] * 1000:8.0f} ms   (AppTest import {render['import_s'] * 1000:.0f}, script {render['run_s'] * 1000:.0f})")
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+
+    problems = [f"first render raised: {message}" for message in render["exceptions"]]
+    problems += [f"first render loaded {', '.join(render['heavy_loaded'])}"] if render["heavy_loaded"] else []
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            problems += regressions(result, json.load(f), args.tolerance)
+    for problem in problems:
+        print(f"regression: {problem}", file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
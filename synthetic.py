@@ -0,0 +1,82 @@
+"""Synthetic questionnaire data with a known structure, for benchmarks and demos.
+
+    python synthetic.py survey.csv --rows 1000000 --items 10 --missing 0.05
+"""
+import argparse
+import os
+import sys
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+SCALES = ("X", "Y")
+GROUP_LEVELS = ("North", "South", "East", "West")
+CHUNK_ROWS = 1_000_000
+
+
+def _thresholds(levels, agreement):
+    # cut points of equal-probability answers, shifted down so answers lean towards agreement
+    normal = NormalDist()
+    return np.array([normal.inv_cdf(i / levels) for i in range(1, levels)]) - agreement
+
+
+def likert_frame(rows, items=5, levels=5, missing=0.0, loading=0.7, scale_corr=0.5, agreement=0.3,
+                 scales=SCALES, groups=GROUP_LEVELS, seed=0):
+    """A survey of ``rows`` respondents answering ``items`` Likert items per scale.
+
+    Each scale has a standard normal latent trait, and the traits of
+    different scales correlate at ``scale_corr``. An item is its trait
+    times a loading (spread by up to 0.15 around ``loading``) plus noise,
+    cut into ``levels`` answers. ``agreement`` shifts answers upwards, as in
+    real surveys. Each answer is then missing with probability ``missing``.
+    Columns are named X1..Xk, Y1..Yk, and so on, followed by a ``region``
+    column drawn from ``groups``.
+    """
+    rng = np.random.default_rng(seed)
+    k = len(scales)
+    traits_corr = np.full((k, k), scale_corr) + np.eye(k) * (1 - scale_corr)
+    traits = rng.standard_normal((rows, k)) @ np.linalg.cholesky(traits_corr).T
+    loadings = np.clip(loading + rng.uniform(-0.15, 0.15, (k, items)), 0.05, 0.95)
+    cuts = _thresholds(levels, agreement)
+
+    columns = {}
+    for s, scale in enumerate(scales):
+        for i in range(items):
+            latent = loadings[s, i] * traits[:, s] + np.sqrt(1 - loadings[s, i] ** 2) * rng.standard_normal(rows)
+            answers = pd.array(np.searchsorted(cuts, latent).astype(np.int8) + 1, dtype="Int8")
+            if missing:
+                answers[rng.random(rows) < missing] = pd.NA
+            columns[f"{scale}{i + 1}"] = answers
+    columns["region"] = pd.Categorical.from_codes(rng.integers(0, len(groups), rows), groups)
+    return pd.DataFrame(columns)
+
+
+def write_likert_csv(path, rows, chunk_rows=CHUNK_ROWS, seed=0, **options):
+    """Write likert_frame data to ``path`` in chunks, so 10 million rows never sit in memory at once"""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        for i, start in enumerate(range(0, rows, chunk_rows)):
+            chunk = likert_frame(min(chunk_rows, rows - start), seed=(seed, i), **options)
+            chunk.to_csv(f, header=i == 0, index=False)
+    return os.path.getsize(path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write a synthetic Likert questionnaire as CSV.")
+    parser.add_argument("path", help="CSV file to write")
+    parser.add_argument("--rows", type=int, default=10_000, help="respondents (default: 10000)")
+    parser.add_argument("--items", type=int, default=5, help="items per scale (default: 5)")
+    parser.add_argument("--levels", type=int, default=5, help="answer levels (default: 5)")
+    parser.add_argument("--missing", type=float, default=0.0, help="share of missing answers (default: 0)")
+    parser.add_argument("--loading", type=float, default=0.7, help="average item loading on its scale (default: 0.7)")
+    parser.add_argument("--scale-corr", type=float, default=0.5, help="correlation between the scales (default: 0.5)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    size = write_likert_csv(args.path, args.rows, seed=args.seed, items=args.items, levels=args.levels, missing=args.missing,
+                            loading=args.loading, scale_corr=args.scale_corr)
+    print(f"{args.path}: {args.rows:,} rows, {size / 1024 / 1024:.1f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
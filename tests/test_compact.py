@@ -0,0 +1,58 @@
+from io import StringIO
+
+import numpy as np
+import pandas as pd
+
+import normality
+from correlation import correlation_matrix
+from descriptives import describe_columns, numeric_block
+from engine import build_composites
+from ingest import compact_dtype, compact_frame
+from synthetic import likert_frame
+
+ITEMS = ["X1", "X2", "X3", "X4", "X5", "Y1", "Y2", "Y3", "Y4", "Y5"]
+
+
+def _survey():
+    # what pd.read_csv gives before compacting: float64 answers with NaN and string labels
+    csv = likert_frame(3000, missing=0.05, seed=3).to_csv(index=False)
+    return pd.read_csv(StringIO(csv))
+
+
+def test_compact_dtype_narrows_coded_answers():
+    assert compact_dtype(pd.Series([1.0, 5.0, 3.0])) == np.int8
+    assert compact_dtype(pd.Series([1.0, np.nan, 300.0])) == pd.Int16Dtype()
+    assert compact_dtype(pd.Series([0.5, 1.0])) == np.float64
+
+
+def test_compact_dtype_keeps_values_no_integer_holds():
+    assert compact_dtype(pd.Series([1.0, np.inf])) == np.float64
+    assert compact_dtype(pd.Series([1.0, 2.0 ** 70, np.nan])) == np.float64
+    assert compact_dtype(pd.Series(np.array([1, 2 ** 63 + 5], dtype=np.uint64))) == np.uint64
+    frame = compact_frame(pd.DataFrame({"a": [1.0, -np.inf, 2.0]}))
+    assert frame["a"].dtype == np.float64
+
+
+def test_compacted_frame_gives_the_same_statistics():
+    raw = _survey()
+    compact = compact_frame(raw)
+    assert all(compact[col].dtype != raw[col].dtype for col in raw.columns)
+    pd.testing.assert_frame_equal(describe_columns(compact, ITEMS), describe_columns(raw, ITEMS))
+
+    for method in ("pearson", "spearman"):
+        for got, expected in zip(correlation_matrix(numeric_block(compact, ITEMS), method),
+                                 correlation_matrix(numeric_block(raw, ITEMS), method)):
+            np.testing.assert_array_equal(got, expected)
+
+    raw_scores, _ = build_composites(raw, ITEMS[:5], ITEMS[5:])
+    compact_scores, _ = build_composites(compact, ITEMS[:5], ITEMS[5:])
+    for col in ("X_total", "Y_total"):
+        np.testing.assert_array_equal(compact_scores[col].to_numpy(dtype=np.float64, na_value=np.nan),
+                                      raw_scores[col].to_numpy(dtype=np.float64, na_value=np.nan))
+        for strategy in ("shapiro", "dagostino", "anderson"):
+            with normality._cache_lock:
+                normality._cache.clear()
+            expected = normality.normality_test(raw_scores[col], strategy)
+            with normality._cache_lock:
+                normality._cache.clear()
+            assert normality.normality_test(compact_scores[col], strategy) == expected
@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from composites import composite, score_composites
+
+ITEMS = ["X1", "X2", "X3", "X4"]
+
+
+def _answers(rows=1000, missing=0.2, seed=13):
+    # 1-5 answers driven by one trait, each missing with probability ``missing``
+    rng = np.random.default_rng(seed)
+    values = np.clip(np.round(3 + rng.standard_normal((rows, 1)) + rng.standard_normal((rows, len(ITEMS)))), 1, 5)
+    values[rng.random(values.shape) < missing] = np.nan
+    return pd.DataFrame(values, columns=ITEMS)
+
+
+def _expected(frame, spec):
+    # the scoring rules applied row by row, as a reader of composite's docstring would
+    answers = frame[list(spec.items)].astype(np.float64)
+    for item in spec.reverse:
+        answers[item] = spec.scale_min + spec.scale_max - answers[item]
+    weights = pd.Series(spec.weights, index=list(spec.items))
+    answered = answers.notna()
+    total = (answers * weights).sum(axis=1)
+    weight_answered = answered.mul(weights).sum(axis=1)
+    if spec.method == "sum" and spec.min_answered is None:
+        score = total
+    elif spec.method == "sum":
+        score = total / weight_answered * weights.sum()
+    else:
+        score = total / weight_answered
+    needed = spec.min_answered if spec.min_answered is not None else (0 if spec.method == "sum" else 1)
+    return score.where(answered.sum(axis=1) >= needed).to_numpy()
+
+
+def test_scores_match_row_by_row_rules():
+    frame = _answers()
+    specs = [
+        composite("sum", ITEMS),
+        composite("prorated", ITEMS, min_answered=3),
+        composite("mean", ITEMS, "mean", reverse=["X2"], scale_max=5),
+        composite("weighted", ITEMS, "weighted", weights={"X1": 2.0, "X3": 0.5}, reverse=["X4"], scale_max=5,
+                  min_answered=2),
+    ]
+    scores = score_composites(frame, specs)
+    for spec in specs:
+        np.testing.assert_allclose(scores[spec.name], _expected(frame, spec), rtol=1e-12, equal_nan=True, err_msg=spec.name)
+
+
+def test_composite_rejects_invalid_definitions():
+    with pytest.raises(ValueError):
+        composite("empty", [])
+    with pytest.raises(ValueError):
+        composite("median", ITEMS, "median")
+    with pytest.raises(ValueError):
+        composite("reversed", ITEMS, reverse=["X1"])
+    with pytest.raises(ValueError):
+        composite("weights", ITEMS, "weighted", weights={item: 0.0 for item in ITEMS})
+    assert composite("capped", ITEMS, min_answered=9).min_answered == len(ITEMS)
@@ -0,0 +1,117 @@
+from itertools import permutations
+
+import numpy as np
+from scipy import stats
+
+import correlation
+from correlation import (BOOTSTRAP_BATCH_ELEMENTS, PERMUTATION_CHUNK, PERMUTATION_ROUND_CHUNKS, _permutation_batch, correlation_matrix,
+                         group_correlations, permutation_matrix)
+
+
+def _answers(missing=0.1, rows=500, seed=7, columns=6):
+    # 1-5 answers driven by one trait, each missing with probability ``missing``
+    rng = np.random.default_rng(seed)
+    values = np.clip(np.round(3 + rng.standard_normal((rows, 1)) + rng.standard_normal((rows, columns))), 1, 5)
+    values[rng.random(values.shape) < missing] = np.nan
+    return values
+
+
+def _scipy_pair(x, y, method):
+    both = ~(np.isnan(x) | np.isnan(y))
+    test = stats.pearsonr if method == "pearson" else stats.spearmanr
+    result = test(x[both], y[both])
+    return result[0], result[1], both.sum()
+
+
+def test_correlation_matrix_matches_scipy_on_pairwise_complete_rows():
+    for missing in (0.0, 0.1):
+        values = _answers(missing)
+        for method in ("pearson", "spearman"):
+            r, p, n = correlation_matrix(values, method)
+            for i in range(values.shape[1]):
+                for j in range(i + 1, values.shape[1]):
+                    expected_r, expected_p, expected_n = _scipy_pair(values[:, i], values[:, j], method)
+                    assert n[i, j] == n[j, i] == expected_n
+                    assert np.isclose(r[i, j], expected_r, rtol=0, atol=1e-12), (method, missing, i, j)
+                    assert np.isclose(p[i, j], expected_p, rtol=1e-8, atol=1e-300), (method, missing, i, j)
+            np.testing.assert_array_equal(np.diag(r), 1.0)
+
+
+def test_spearman_reranks_mixed_columns_in_small_blocks(monkeypatch):
+    # Likert items go through the value-code counts, continuous columns pair by pair
+    rng = np.random.default_rng(3)
+    values = np.column_stack([_answers(0.0, rows=300, seed=3), rng.standard_normal((300, 2))])
+    values[rng.random(values.shape) < 0.15] = np.nan
+    monkeypatch.setattr(correlation, "SPEARMAN_CODE_WIDTH", 7)
+    monkeypatch.setattr(correlation, "SPEARMAN_BATCH_ELEMENTS", 64)
+    r, _, _ = correlation_matrix(values, "spearman")
+    for i in range(values.shape[1]):
+        for j in range(i + 1, values.shape[1]):
+            assert np.isclose(r[i, j], _scipy_pair(values[:, i], values[:, j], "spearman")[0], rtol=0, atol=1e-12), (i, j)
+
+
+def test_correlation_matrix_without_enough_pairs():
+    values = np.array([[1.0, np.nan], [2.0, 3.0], [3.0, np.nan]])
+    r, p, n = correlation_matrix(values)
+    assert n[0, 1] == 1
+    assert np.isnan(r[0, 1]) and np.isnan(p[0, 1])
+
+
+def test_group_correlations_match_scipy_per_group():
+    values = _answers(0.1, rows=800, seed=11, columns=2)
+    x, y = values[:, 0], values[:, 1]
+    levels = ["North", "South", "East", "West"]
+    codes = np.random.default_rng(11).integers(0, len(levels), len(values))
+    for method in ("pearson", "spearman"):
+        table = group_correlations(x, y, codes, levels, method)
+        for g, level in enumerate(levels):
+            expected_r, expected_p, expected_n = _scipy_pair(x[codes == g], y[codes == g], method)
+            assert table.loc[level, "n"] == expected_n
+            assert np.isclose(table.loc[level, "r"], expected_r, rtol=0, atol=1e-12), (method, level)
+            assert np.isclose(table.loc[level, "p"], expected_p, rtol=1e-8), (method, level)
+
+
+def test_exact_permutation_p_counts_every_ordering():
+    x = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+    y = np.array([2.0, 1.0, 4.0, 3.0, 6.0, 5.0])
+    observed = abs(stats.pearsonr(x, y)[0])
+    shuffled = [abs(stats.pearsonr(x, y[list(order)])[0]) for order in permutations(range(len(y)))]
+    result = permutation_matrix(np.column_stack([x, y]))
+    assert result.exact and result.status == "exact" and result.permutations == len(shuffled)
+    assert np.isclose(result.p_value[0, 1], np.mean(np.array(shuffled) >= observed - 1e-12))
+
+
+def test_permutation_p_is_nan_without_an_observed_r():
+    values = np.column_stack([np.full(6, 3.0), np.arange(6.0), np.arange(6.0)[::-1]])
+    result = permutation_matrix(values)
+    assert result.status == "exact"
+    assert np.isnan(result.p_value[0, 1:]).all() and np.isnan(result.mc_error[0, 1:]).all()
+    assert result.p_value[1, 2] == 2 / 720
+
+
+def test_permutation_batches_bound_the_correlation_stack():
+    # many items on a small sample: the (batch, k, k) correlations dominate, not the permuted data
+    for n, k in ((10, 80), (5000, 10), (30, 500)):
+        batch = _permutation_batch(n, k)
+        assert batch * (n * k + k * k) <= BOOTSTRAP_BATCH_ELEMENTS or batch == 1
+
+
+def test_permutation_matrix_with_too_few_rows():
+    result = permutation_matrix(np.array([[1.0, 2.0]]))
+    assert result.status == "too_few" and result.permutations == 0
+    assert np.isnan(result.p_value).all()
+
+
+def test_cancelled_permutations_resume_where_they_stopped():
+    values = _answers(0.0, rows=60)
+    options = {"max_permutations": 2 * PERMUTATION_CHUNK * PERMUTATION_ROUND_CHUNKS, "target_se": 0.0, "workers": 1}
+    uninterrupted = permutation_matrix(values, **options)
+
+    polls = iter([False, True])
+    checkpoint = {}
+    cancelled = permutation_matrix(values, cancel=lambda: next(polls), checkpoint=checkpoint, **options)
+    assert cancelled.status == "cancelled" and cancelled.permutations == PERMUTATION_CHUNK * PERMUTATION_ROUND_CHUNKS
+    resumed = permutation_matrix(values, checkpoint=checkpoint, **options)
+    assert resumed.status == uninterrupted.status == "max"
+    assert resumed.permutations == uninterrupted.permutations
+    np.testing.assert_array_equal(resumed.p_value, uninterrupted.p_value)
@@ -0,0 +1,109 @@
+import numpy as np
+import pandas as pd
+from matplotlib import cbook
+
+import descriptives
+from descriptives import (DESCRIPTIVE_FIELDS, describe_block, describe_chunks, describe_columns, describe_groups, describe_with_charts,
+                          numeric_block)
+
+ITEMS = ["X1", "X2", "X3", "Y1", "Y2", "Y3"]
+LEVELS = ["North", "South", "East", "West"]
+
+
+def _survey(rows=2000, seed=5):
+    # 1-5 answers driven by one trait with 10% missing, a continuous score and a grouping column
+    rng = np.random.default_rng(seed)
+    answers = np.clip(np.round(3 + rng.standard_normal((rows, 1)) + rng.standard_normal((rows, len(ITEMS)))), 1, 5)
+    answers[rng.random(answers.shape) < 0.1] = np.nan
+    frame = pd.DataFrame(answers, columns=ITEMS)
+    frame["score"] = rng.standard_normal(rows)
+    frame.loc[::7, "score"] = np.nan
+    frame["region"] = pd.Categorical.from_codes(rng.integers(0, len(LEVELS), rows), LEVELS)
+    return frame
+
+
+def _pandas_describe(frame, columns):
+    # the same figures computed column by column with pandas' own estimators
+    numbers = frame[columns].astype(np.float64)
+    table = pd.DataFrame({
+        "count": numbers.count(), "missing": numbers.isna().sum(), "mean": numbers.mean(), "median": numbers.median(),
+        "std": numbers.std(), "var": numbers.var(), "min": numbers.min(), "max": numbers.max(),
+        "range": numbers.max() - numbers.min(), "skew": numbers.skew(), "kurtosis": numbers.kurt(),
+    })
+    table.index.name = "variable"
+    return table[DESCRIPTIVE_FIELDS]
+
+
+def test_describe_block_matches_pandas():
+    frame = _survey()
+    columns = ITEMS + ["score"]
+    pd.testing.assert_frame_equal(describe_columns(frame, columns), _pandas_describe(frame, columns), check_dtype=False)
+
+
+def test_describe_block_handles_empty_and_constant_columns():
+    values = np.column_stack([np.full(5, np.nan), np.full(5, 3.0), np.arange(5.0)])
+    table = describe_block(values, ["empty", "constant", "ramp"])
+    assert table.loc["empty", "count"] == 0 and table.loc["empty", "missing"] == 5
+    assert np.isnan(table.loc["empty", ["mean", "median", "min", "max"]].astype(float)).all()
+    assert table.loc["constant", "std"] == 0.0 and table.loc["constant", "range"] == 0.0
+    assert table.loc["ramp", "median"] == 2.0
+    assert describe_block(np.empty((0, 2)), ["a", "b"])["count"].tolist() == [0, 0]
+
+
+def test_chart_stats_match_numpy_and_matplotlib():
+    frame = _survey()
+    table, charts = describe_with_charts(frame, ITEMS + ["score"])
+    pd.testing.assert_frame_equal(table, describe_columns(frame, ITEMS + ["score"]))
+    for col, ((counts, edges), box) in charts.items():
+        observed = frame[col].dropna().to_numpy(dtype=np.float64)
+        expected_counts, expected_edges = np.histogram(observed, bins=len(counts))
+        np.testing.assert_array_equal(counts, expected_counts)
+        np.testing.assert_allclose(edges, expected_edges)
+        expected = cbook.boxplot_stats(observed)[0]
+        for field in ("med", "q1", "q3", "whislo", "whishi"):
+            assert np.isclose(box[field], expected[field]), (col, field)
+        np.testing.assert_array_equal(box["fliers"], np.unique(expected["fliers"]))
+
+
+def test_streaming_descriptives_match_one_pass():
+    # few distinct values are counted exactly, so even the medians agree
+    frame = _survey()[ITEMS]
+    expected = describe_columns(frame, ITEMS)
+    streamed = describe_chunks((frame.iloc[start:start + 300] for start in range(0, len(frame), 300)), ITEMS).table()
+    pd.testing.assert_frame_equal(streamed, expected, check_dtype=False)
+
+
+def test_long_frames_are_described_from_sketches(monkeypatch):
+    frame = _survey()
+    columns = ITEMS + ["score"]
+    table, charts = describe_with_charts(frame, columns)
+    monkeypatch.setattr(descriptives, "STREAM_DESCRIBE_ROWS", 500)
+    streamed_table, streamed_charts = describe_with_charts(frame, columns, chunk_rows=300)
+
+    # Likert items are counted exactly: the same table and charts as the in-memory pass
+    pd.testing.assert_frame_equal(streamed_table.loc[ITEMS], table.loc[ITEMS])
+    for col in ITEMS:
+        (counts, edges), box = streamed_charts[col]
+        np.testing.assert_array_equal(counts, charts[col][0][0])
+        np.testing.assert_allclose(edges, charts[col][0][1])
+        for field, value in box.items():
+            np.testing.assert_allclose(value, charts[col][1][field], err_msg=f"{col} {field}")
+
+    # the continuous score has exact moments and extremes, and sketch quantiles within their rank error
+    exact = ["count", "missing", "mean", "std", "var", "min", "max", "range", "skew", "kurtosis"]
+    pd.testing.assert_series_equal(streamed_table.loc["score", exact], table.loc["score", exact])
+    observed = np.sort(frame["score"].dropna().to_numpy())
+    (counts, _), box = streamed_charts["score"]
+    assert counts.sum() == len(observed)
+    for field, q in (("q1", 0.25), ("med", 0.5), ("q3", 0.75)):
+        rank = np.searchsorted(observed, box[field]) / len(observed)
+        assert abs(rank - q) < 0.0165, field
+
+
+def test_describe_groups_matches_describe_block_per_group():
+    frame = _survey()
+    columns = ITEMS + ["score"]
+    grouped = describe_groups(numeric_block(frame, columns), frame["region"].cat.codes.to_numpy(), LEVELS, columns)
+    for level in LEVELS:
+        expected = describe_block(numeric_block(frame[frame["region"] == level], columns), columns)
+        pd.testing.assert_frame_equal(grouped.loc[level], expected)
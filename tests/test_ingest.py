@@ -0,0 +1,25 @@
+from ingest import LocalFile, _parse_cache, load_dataset
+
+
+def _write(path, text, encoding):
+    with open(path, "w", encoding=encoding, newline="") as f:
+        f.write(text)
+    return LocalFile(path)
+
+
+def test_small_csv_gets_the_sniffed_delimiter_and_encoding(tmp_path):
+    _parse_cache.clear()
+    upload = _write(tmp_path / "survey.csv", "name;X1;X2\r\nJosé;1;5\r\nRenée;2;4\r\nZoë;3;3\r\n", "cp1252")
+    for streaming in (False, True):
+        frame = load_dataset(upload, streaming=streaming)
+        assert list(frame.columns) == ["name", "X1", "X2"]
+        assert list(frame["name"].astype(str)) == ["José", "Renée", "Zoë"]
+        assert frame["X1"].tolist() == [1, 2, 3]
+
+
+def test_explicit_options_win_over_sniffing(tmp_path):
+    _parse_cache.clear()
+    upload = _write(tmp_path / "plain.csv", "a;b\n1;2\n", "utf-8")
+    frame = load_dataset(upload, streaming=False, sep=",")
+    assert list(frame.columns) == ["a;b"]
+    assert frame["a;b"].astype(str).tolist() == ["1;2"]
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+
+from composites import composite, item_block
+from reliability import composite_reliability, format_reliability, reliability_level, scale_reliability
+
+ITEMS = ["X1", "X2", "X3", "X4", "X5"]
+
+
+def _answers(rows=1500, missing=0.05, seed=17):
+    # 1-5 answers driven by one trait, each missing with probability ``missing``
+    rng = np.random.default_rng(seed)
+    values = np.clip(np.round(3 + rng.standard_normal((rows, 1)) + rng.standard_normal((rows, len(ITEMS)))), 1, 5)
+    values[rng.random(values.shape) < missing] = np.nan
+    return pd.DataFrame(values, columns=ITEMS)
+
+
+def _alpha(values):
+    k = values.shape[1]
+    return k / (k - 1) * (1 - values.var(axis=0, ddof=1).sum() / values.sum(axis=1).var(ddof=1))
+
+
+def test_alpha_and_item_statistics_match_the_textbook_formulas():
+    frame = _answers()
+    spec = composite("X_total", ITEMS, reverse=["X3"], scale_max=5)
+    rel = composite_reliability(frame, spec)
+
+    values = item_block(frame, ITEMS)
+    values = values[~np.isnan(values).any(axis=1)]
+    values[:, 2] = 6 - values[:, 2]
+    assert rel.n == len(values)
+    assert np.isclose(rel.alpha, _alpha(values))
+    for i, item in enumerate(ITEMS):
+        rest = np.delete(values, i, axis=1)
+        stat = rel.items.loc[item]
+        assert np.isclose(stat["mean"], values[:, i].mean())
+        assert np.isclose(stat["std"], values[:, i].std(ddof=1))
+        assert np.isclose(stat["alpha_if_deleted"], _alpha(rest)), item
+        assert np.isclose(stat["item_total_r"], np.corrcoef(values[:, i], rest.sum(axis=1))[0, 1]), item
+
+
+def test_omega_recovers_a_one_factor_structure():
+    loadings = np.array([0.8, 0.7, 0.6, 0.5])
+    corr = np.outer(loadings, loadings)
+    np.fill_diagonal(corr, 1.0)
+    rel = scale_reliability(corr, np.zeros(4), 100, ["a", "b", "c", "d"])
+    np.testing.assert_allclose(rel.items["loading"], loadings, atol=1e-4)
+    assert np.isclose(rel.omega, loadings.sum() ** 2 / (loadings.sum() ** 2 + np.sum(1 - loadings ** 2)), atol=1e-4)
+
+
+def test_reliability_levels_and_formatting():
+    assert [reliability_level(a) for a in (0.95, 0.85, 0.7, 0.65, 0.5, 0.2, np.nan)] == [
+        "excellent", "good", "acceptable", "questionable", "poor", "unacceptable", "unacceptable"]
+    assert format_reliability(0.81234, "good") == "0.812 (good)"
+    assert format_reliability(0.5) == "0.500"
+    assert format_reliability(np.nan, "unacceptable") == "n/a"
+    assert composite_reliability(_answers(10), composite("one", ["X1"])) is None
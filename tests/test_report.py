@@ -0,0 +1,17 @@
+import numpy as np
+
+from reliability import Reliability
+from report import _composite_finding
+from translations import translator
+
+
+def _scale(alpha):
+    return Reliability("X_total", 100, alpha, alpha, None)
+
+
+def test_composite_finding_follows_the_scale_reliability():
+    t = translator("en")
+    assert _composite_finding({}, t) == t('pdf_composite_text_unrated')
+    assert _composite_finding({"X_total": _scale(0.85), "Y_total": _scale(0.7)}, t) == t('pdf_composite_text')
+    assert _composite_finding({"X_total": _scale(0.85), "Y_total": _scale(0.65)}, t) == t('pdf_composite_text_low')
+    assert _composite_finding({"X_total": _scale(np.nan)}, t) == t('pdf_composite_text_low')
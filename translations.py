@@ -0,0 +1,765 @@
+translations = {
+    'en': {
+        'title': 'Data Analytics Platform',
+        'subtitle': 'Complete Statistical Analysis Solution for Researchers',
+        'welcome': 'Welcome!',
+        'welcome_text': 'Empowering researchers with intuitive statistical analysis tools. Transform your data into meaningful insights with our comprehensive platform.',
+        'core_features': 'Core Features',
+        'descriptive_stats': 'Descriptive Statistics',
+        'descriptive_desc': 'Mean, median, variance, etc.',
+        'spearman': 'Spearman Correlation',
+        'spearman_desc': 'For ordinal data analysis',
+        'data_viz': 'Data Visualization',
+        'data_viz_desc': 'Interactive charts & plots',
+        'regression': 'Regression Analysis',
+        'regression_desc': 'Trend lines & predictions',
+        'stat_testing': 'Statistical Testing',
+        'stat_testing_desc': 'p-values & significance',
+        'corr_matrix': 'Correlation Matrix',
+        'corr_matrix_desc': 'Multi-variable relationships',
+        'corr_matrix_mode': 'Compute correlation matrix of all selected items',
+        'p_adjust': 'Multiple-comparison correction',
+        'p_adjust_none': 'None',
+        'p_adjust_fdr_bh': 'False discovery rate (Benjamini-Hochberg)',
+        'p_adjust_bonferroni': 'Bonferroni',
+        'p_adjusted': 'Adjusted p-value',
+        'bootstrap_replicates': 'Bootstrap resamples for the confidence interval',
+        'bootstrap_off': 'Off',
+        'ci_bca': 'CI (BCa)',
+        'ci_percentile': 'CI (percentile)',
+        'bootstrap_resamples': 'bootstrap resamples',
+        'permutation_mode': 'Permutation test p-value (exact for small samples)',
+        'permutation_running': 'Running permutation test...',
+        'permutation_stop': 'Stop permutation test',
+        'p_permutation': 'p-value (permutation)',
+        'p_asymptotic': 'p-value (asymptotic)',
+        'permutations': 'permutations',
+        'perm_exact': 'exact',
+        'perm_converged': 'converged',
+        'perm_max': 'limit reached',
+        'perm_cancelled': 'cancelled',
+        'perm_too_few': 'too few pairs',
+        'scatter_count': 'Respondents per cell',
+        'scatter_hist2d_note': 'Large sample: the scatter is drawn as a 2-D histogram of all {n} rows; the trend line is fitted on all rows.',
+        'scatter_sample_note': 'Large sample: the scatter shows a stratified sample of {shown} of {n} rows; the trend line is fitted on all rows.',
+        'corr_pairs': 'Item pairs',
+        'footer': '© 2024 Data Analytics Platform | Group 3 Project',
+        'footer_sub': 'Advanced Statistical Analysis with Spearman Correlation',
+        'platform_title': 'Advanced Statistical Analysis Platform',
+        'platform_subtitle': 'Comprehensive Data Analysis Solution • Group 3 Project • Professional Analytics Tool',
+        'objectives': 'Project Objectives',
+        'global_access': 'Global Accessibility',
+        'global_text_1': 'Develop an intuitive web-based platform for statistical analysis accessible to users of all skill levels',
+        'global_text_2': 'Support 12 international languages to ensure global accessibility and usability',
+        'comprehensive': 'Comprehensive Analysis',
+        'comp_text_1': 'Implement comprehensive descriptive statistics tools for data exploration and summary',
+        'comp_text_2': 'Provide advanced correlation analysis using Spearman method for ordinal data',
+        'tech_stack': 'Technology Stack',
+        'tech_text': 'Our platform is built on a modern technology stack that ensures reliability, performance, and scalability.',
+        'our_team': 'Our Team',
+        'team_text': 'Meet the talented team behind this project.',
+        'about_analysis': 'About the Analysis',
+        'about_text': 'This application performs two major statistical procedures:',
+        'descriptive_analysis': 'Descriptive Analysis - summarizes characteristics of variables',
+        'association_analysis': 'Association Analysis (Spearman Correlation) - evaluates relationships',
+        'desc_analysis_title': '1) Descriptive Analysis',
+        'basic_stats_title': 'Basic Statistics:',
+        'basic_stats_text': 'Mean, Median, Mode, Min/Max, Standard Deviation',
+        'distribution_title': 'Distribution & Frequency:',
+        'distribution_text': 'Histograms, Bar charts, Frequency tables',
+        'summaries_title': 'Variable Summaries:',
+        'summaries_text': 'Boxplots, Quartiles',
+        'assoc_analysis_title': '2) Association Analysis',
+        'spearman_coef': 'Spearman Correlation Coefficient (ρ): Measures strength and direction',
+        'p_value': 'p-value: Determines statistical significance',
+        'visualizations': 'Visualizations: Scatter plots with trend lines',
+        'interpretations': 'Interpretations: Automatic classification of strength',
+        'program_obj': 'Program Objectives',
+        'obj_1': 'Provide complete descriptive statistics',
+        'obj_2': 'Display interactive visualizations',
+        'obj_3': 'Measure associations using Spearman correlation',
+        'obj_4': 'Generate interpretable insights for academic reports',
+        'obj_5': 'Allow custom data upload for flexibility',
+        'upload_dataset': 'Upload Dataset',
+        'accepted_formats': 'Accepted formats: CSV, Excel (.xlsx, .xls)',
+        'dataset_loaded': 'Dataset loaded successfully',
+        'loading_dataset': 'Loading dataset...',
+        'select_sheets': 'Select sheets to analyze',
+        'rows': 'Rows',
+        'columns': 'Columns',
+        'size': 'Size',
+        'variable_selection': 'Variable Selection',
+        'select_x': 'Select X variables',
+        'select_y': 'Select Y variables',
+        'create_composite': 'Create composite scores',
+        'run_analysis': 'Run Full Analysis',
+        'desc_analysis': 'Descriptive Analysis',
+        'variable': 'Variable',
+        'count': 'Count',
+        'mean': 'Mean',
+        'median': 'Median',
+        'min': 'Min',
+        'max': 'Max',
+        'std_dev': 'Std Dev',
+        'variance': 'Variance',
+        'range': 'Range',
+        'missing': 'Missing',
+        'skewness': 'Skewness',
+        'kurtosis': 'Kurtosis',
+        'key_insights': 'Key Insights:',
+        'central_tendency': 'Central Tendency',
+        'spread': 'Spread',
+        'likert_detected': 'Likert Scale Detected',
+        'likert_text': 'Suitable for non-parametric testing.',
+        'frequency_dist': 'Frequency Distribution',
+        'category': 'Category',
+        'frequency': 'Frequency',
+        'percentage': 'Percentage (%)',
+        'normality_test': 'Normality Testing',
+        'normality_strategy': 'Normality test',
+        'norm_auto': 'Automatic (by sample size)',
+        'norm_shapiro': 'Shapiro-Wilk',
+        'norm_shapiro_subsample': 'Shapiro-Wilk (5,000-row subsample)',
+        'norm_dagostino': "D'Agostino K²",
+        'norm_anderson': 'Anderson-Darling',
+        'norm_qq': 'Q-Q correlation (effect size)',
+        'norm_none': 'Not available',
+        'normal': 'Normal',
+        'non_normal': 'Non-Normal',
+        'method': 'Method',
+        'association': 'Association Analysis',
+        'pearson': 'Pearson Correlation',
+        'spearman_rank': 'Spearman Rank Correlation',
+        'coefficient': 'Coefficient',
+        'strength': 'Strength',
+        'direction': 'Direction',
+        'positive': 'Positive',
+        'negative': 'Negative',
+        'significance': 'Significance',
+        'yes': 'Yes',
+        'no': 'No',
+        'interpretation': 'Interpretation:',
+        'relationship': 'relationship',
+        'correlation': 'correlation',
+        'significant': 'Significant',
+        'not_significant': 'Not Significant',
+        'note': 'Note',
+        'causation_note': 'Correlation ≠ Causation',
+        'conclusion': 'Conclusion',
+        'key_findings': 'Key Findings:',
+        'finding_1': 'Descriptive analysis revealed meaningful patterns',
+        'finding_2': 'Composite scores improve reliability',
+        'finding_3': 'Association analysis shows interpretable relationships',
+        'finding_4': 'Results suitable for academic reporting',
+        'understanding_corr': 'Understanding Correlation Methods',
+        'pearson_corr': 'Pearson Correlation',
+        'spearman_corr': 'Spearman Rank Correlation (ρ)',
+        'purpose': 'Purpose:',
+        'requirements': 'Requirements:',
+        'when_use': 'When to use:',
+        'method_calc': 'Method:',
+        'formula': 'Formula:',
+        'range_val': 'Range:',
+        'sensitivity': 'Sensitivity:',
+        'advantage': 'Advantage:',
+        'perfect_for': 'Perfect for:',
+        'pearson_purpose': 'Measures linear relationships between continuous variables',
+        'pearson_req': 'Assumes normal distribution, interval/ratio data, linear relationship',
+        'pearson_when': 'When both variables are normally distributed and relationship is linear',
+        'pearson_formula': 'r = Σ[(xi - x̄)(yi - ȳ)] / √[Σ(xi - x̄)²Σ(yi - ȳ)²]',
+        'pearson_range': '-1 to +1 (perfect negative to perfect positive correlation)',
+        'pearson_sensitivity': 'Highly sensitive to outliers and extreme values',
+        'spearman_purpose': 'Measures monotonic relationships (not necessarily linear)',
+        'spearman_req': 'Works with ordinal, interval, or ratio data; non-parametric',
+        'spearman_when': 'When data is not normally distributed, contains outliers, or involves ordinal data (like Likert scales 1-5)',
+        'spearman_method': 'Uses rank-based calculation instead of raw values',
+        'spearman_advantage': 'More robust to outliers and non-normal distributions',
+        'spearman_perfect': 'Survey data with Likert scales, ranked preferences, ordinal measurements',
+        'key_diff': 'Key Differences: Pearson vs Spearman',
+        'aspect': 'Aspect',
+        'data_type': 'Data Type',
+        'relationship_type': 'Relationship Type',
+        'distribution': 'Distribution',
+        'outliers': 'Outliers',
+        'likert_scales': 'Likert Scales (1-5)',
+        'calculation': 'Calculation',
+        'best_app': 'Best Application',
+        'continuous': 'Continuous (interval/ratio)',
+        'ordinal_continuous': 'Ordinal or continuous',
+        'linear_only': 'Linear only',
+        'monotonic': 'Monotonic (any consistent direction)',
+        'requires_norm': 'Requires normality',
+        'no_assumption': 'No distribution assumption needed',
+        'highly_sensitive': 'Highly sensitive',
+        'robust_resistant': 'Robust and resistant',
+        'not_recommended': 'Not recommended',
+        'ideal_choice': 'Ideal choice',
+        'uses_raw': 'Uses raw data values',
+        'uses_ranked': 'Uses ranked data',
+        'experimental': 'Experimental data, measurements',
+        'survey_research': 'Survey research, questionnaires',
+        'when_use_which': 'When to Use Which Method?',
+        'use_pearson_when': 'Use Pearson when:',
+        'use_spearman_when': 'Use Spearman when:',
+        'normal_dist': 'Data is normally distributed',
+        'linear_rel': 'Relationship is linear',
+        'vars_continuous': 'Variables are continuous',
+        'no_outliers': 'No significant outliers',
+        'ordinal_data': 'Data is ordinal (Likert scales)',
+        'non_normal': 'Non-normal distribution',
+        'presence_outliers': 'Presence of outliers',
+        'monotonic_not_linear': 'Monotonic but not linear',
+        'pdf_title': 'STATISTICAL ANALYSIS REPORT',
+        'pdf_report_info': 'Report Information',
+        'pdf_generated': 'Generated',
+        'pdf_total_resp': 'Total Respondents',
+        'pdf_x_vars': 'X Variables',
+        'pdf_y_vars': 'Y Variables',
+        'pdf_exec_summary': 'EXECUTIVE SUMMARY',
+        'pdf_exec_text_1': 'This comprehensive statistical analysis report presents findings from survey data with',
+        'pdf_exec_text_2': 'respondents. The analysis reveals a',
+        'pdf_exec_text_3': 'relationship between X and Y variables (correlation coefficient =',
+        'pdf_exec_text_4': 'p-value =',
+        'pdf_exec_text_5': 'The relationship is',
+        'pdf_statistically_sig': 'statistically significant',
+        'pdf_not_statistically_sig': 'not statistically significant',
+        'pdf_exec_text_6': 'at α = 0.05 level. The chosen method',
+        'pdf_exec_text_7': 'was selected based on normality testing of the data distribution.',
+        'pdf_desc_stats': 'DESCRIPTIVE STATISTICS',
+        'pdf_variable': 'Variable:',
+        'pdf_statistic': 'Statistic',
+        'pdf_value': 'Value',
+        'pdf_distribution': 'Distribution:',
+        'pdf_normality_test': 'NORMALITY TESTING',
+        'pdf_normality_text': 'Normality of the data distribution was assessed with the following tests:',
+        'pdf_interpretation_col': 'Interpretation',
+        'pdf_data_follows': 'Data follows normal distribution',
+        'pdf_data_not_follows': 'Data does not follow normal distribution',
+        'pdf_selected_method': 'Selected Method:',
+        'pdf_method_text_1': 'Based on the normality test results,',
+        'pdf_method_text_2': 'was selected as the appropriate correlation analysis method.',
+        'pdf_pearson_suitable': 'Pearson correlation is suitable when both variables follow normal distribution.',
+        'pdf_spearman_suitable': 'Spearman correlation is more robust for non-normal distributions and ordinal data.',
+        'pdf_corr_analysis': 'CORRELATION ANALYSIS',
+        'pdf_metric': 'Metric',
+        'pdf_interp': 'Interpretation',
+        'pdf_method_used': 'Statistical method used',
+        'pdf_relationship': 'relationship',
+        'pdf_sample_size': 'Sample Size',
+        'pdf_num_obs': 'Number of observations',
+        'pdf_scatter_plot': 'Scatter Plot with Trend Line:',
+        'pdf_trend_line': 'Trend Line',
+        'pdf_interpretation': 'INTERPRETATION',
+        'pdf_key_findings': 'The correlation analysis reveals the following key findings:',
+        'pdf_strength_rel': 'Strength of Relationship:',
+        'pdf_strength_text_1': 'The correlation coefficient of r =',
+        'pdf_strength_text_2': 'indicates a',
+        'pdf_strength_text_3': 'relationship between the variables. This suggests that',
+        'pdf_substantial': 'there is a substantial association',
+        'pdf_moderate': 'there is a moderate to weak association',
+        'pdf_between_vars': 'between X and Y variables.',
+        'pdf_direction_rel': 'Direction of Relationship:',
+        'pdf_direction_text_1': 'The',
+        'pdf_direction_text_2': 'correlation coefficient indicates that as X increases, Y tends to',
+        'pdf_increase': 'increase as well',
+        'pdf_decrease': 'decrease',
+        'pdf_direction_text_3': 'This',
+        'pdf_direct': 'direct',
+        'pdf_inverse': 'inverse',
+        'pdf_direction_text_4': 'relationship',
+        'pdf_same_direction': 'suggests both variables move in the same direction',
+        'pdf_opposite_direction': 'suggests the variables move in opposite directions',
+        'pdf_stat_sig': 'Statistical Significance:',
+        'pdf_sig_text_1': 'With a p-value of',
+        'pdf_sig_text_2': 'the relationship is',
+        'pdf_sig_text_3': 'This means',
+        'pdf_reject_null': 'we can reject the null hypothesis and conclude that the observed correlation is unlikely due to chance',
+        'pdf_cannot_reject': 'we cannot reject the null hypothesis, and the observed correlation may be due to random variation',
+        'pdf_important_note': 'Important Note:',
+        'pdf_causation': 'Correlation does not imply causation. While we observe',
+        'pdf_sig_association': 'a significant association',
+        'pdf_an_association': 'an association',
+        'pdf_causation_text': 'between variables, this analysis alone cannot determine if one variable causes changes in the other.',
+        'pdf_conclusion': 'CONCLUSION',
+        'pdf_summary': 'Summary of Key Findings:',
+        'pdf_desc_analysis_sum': 'Descriptive Analysis:',
+        'pdf_desc_text': 'Successfully analyzed',
+        'pdf_desc_text_2': 'variables, revealing meaningful patterns in the data distribution.',
+        'pdf_composite': 'Composite Scores:',
+        'pdf_composite_text': 'Created reliable aggregate measures (X_total and Y_total) that improve measurement reliability and reduce random error.',
+        'pdf_composite_text_low': 'Created aggregate measures (X_total and Y_total), but not every scale reaches acceptable internal consistency (α of 0.70 or more), so results built on those scales should be read with caution:',
+        'pdf_composite_text_unrated': 'Created aggregate measures (X_total and Y_total). No scale has two or more items, so their internal consistency could not be estimated.',
+        'pdf_corr_analysis_sum': 'Correlation Analysis:',
+        'pdf_corr_text_1': 'Found a',
+        'pdf_corr_text_2': 'that is',
+        'pdf_corr_text_3': 'at the 0.05 level.',
+        'pdf_method_rigor': 'Methodological Rigor:',
+        'pdf_method_text': 'Applied appropriate statistical methods',
+        'pdf_method_text_2': 'based on data distribution characteristics, ensuring valid and reliable results.',
+        'pdf_academic': 'Academic Reporting:',
+        'pdf_academic_text': 'Results are suitable for inclusion in academic papers, theses, and research reports with proper citation of methods and limitations.',
+        'pdf_recommendations': 'Recommendations:',
+        'pdf_rec_1': 'Consider conducting additional analyses to explore potential confounding variables',
+        'pdf_rec_2': 'Examine subgroup differences if applicable to your research context',
+        'pdf_rec_3': 'Replicate findings with independent samples to validate results',
+        'pdf_rec_4': 'Consider qualitative methods to understand the mechanisms behind observed relationships',
+        'pdf_footer': 'Report generated by Data Analytics Platform | © 2024 | Generated on',
+        'pdf_download_btn': 'Download Complete Analysis Report with Charts (PDF)',
+        'pdf_success': 'PDF report with all charts generated successfully!',
+        'pdf_includes': 'This report includes: Executive Summary, Descriptive Statistics with Charts, Normality Tests, Correlation Analysis with Scatter Plot, Detailed Interpretation, and Conclusions.',
+        'pdf_generate': 'Generate PDF Report',
+        'pdf_generating': 'Generating PDF report',
+        'pdf_cancel': 'Cancel report',
+        'pdf_cancelled': 'PDF generation was cancelled.',
+        'pdf_section_cover': 'cover and summary',
+        'pdf_section_descriptives': 'descriptive statistics',
+        'pdf_section_reliability': 'scale reliability',
+        'pdf_section_normality': 'normality tests',
+        'pdf_section_correlation': 'correlation analysis',
+        'pdf_section_interpretation': 'interpretation',
+        'pdf_section_conclusion': 'conclusion',
+        'pdf_section_build': 'laying out pages',
+        'batch_mode': 'Batch mode: same selection over many files',
+        'batch_help': 'Runs the current variable selection on every file below, several at a time, and writes one PDF per file plus a summary table.',
+        'batch_files': 'Data files',
+        'batch_save_selection': 'Save selection',
+        'batch_start': 'Analyze all files',
+        'batch_running': 'Analyzing files',
+        'batch_summary': 'Batch summary',
+        'batch_download': 'Download PDFs and summary (ZIP)',
+        'batch_no_files': 'No CSV or Excel files to analyze.',
+        'batch_failed': 'files could not be analyzed',
+        'split_by': 'Split by (subgroup analysis)',
+        'split_none': 'No split',
+        'group_analysis': 'Subgroup analysis by',
+        'group_by': 'by',
+        'group_distribution': 'Distribution of',
+        'group_corr': 'Correlation within each group',
+        'group_desc': 'Descriptive statistics by group',
+        'group': 'Group',
+        'group_dropped': '{rows} rows outside the {levels} largest groups or without a group value are left out.',
+        'pdf_section_groups': 'subgroup analysis',
+        'memory_report': 'Memory by column',
+        'memory_before': 'Before',
+        'memory_after': 'After',
+        'memory_ratio': 'Smaller by',
+        'memory_saved': 'Held in {after} instead of {before} ({ratio:.1f}× smaller); answers and statistics are unchanged.',
+        'composite_scoring': 'Composite scoring',
+        'score_method': 'Score',
+        'score_sum': 'Sum of items',
+        'score_mean': 'Mean of answered items',
+        'score_weighted': 'Weighted mean of answered items',
+        'reverse_items': 'Reverse-coded items',
+        'scale_min': 'Scale minimum',
+        'scale_max': 'Scale maximum',
+        'min_answered': 'Minimum answered items',
+        'min_answered_help': 'Respondents who answered fewer items get no score; sums are prorated to the full item count. 0 counts missing answers as zero.',
+        'item_weight': 'Weight',
+        'extra_composites': 'More composites',
+        'extra_composites_help': 'One per line, as Name = item, item, item. Scored like X_total and Y_total.',
+        'composite_unknown_items': 'Composite {name} uses columns that are not in the dataset: {items}',
+        'reliability_analysis': 'Scale Reliability',
+        'reliability_desc': 'How consistently the items of each composite measure the same thing. Alpha and omega of 0.70 or more are usually taken as acceptable; an item with a low item-total correlation, or whose removal raises alpha, may not belong to the scale.',
+        'cronbach_alpha': "Cronbach's α",
+        'mcdonald_omega': "McDonald's ω",
+        'complete_responses': 'Complete responses',
+        'item': 'Item',
+        'n_items': 'Items',
+        'item_total_r': 'Corrected item-total r',
+        'alpha_if_deleted': 'α if item deleted',
+        'factor_loading': 'Factor loading',
+        'alpha_excellent': 'excellent',
+        'alpha_good': 'good',
+        'alpha_acceptable': 'acceptable',
+        'alpha_questionable': 'questionable',
+        'alpha_poor': 'poor',
+        'alpha_unacceptable': 'unacceptable',
+        'reliability_summary': '{name}: α = {alpha}, ω = {omega}, n = {n}',
+        'size_arrow': 'Size (Arrow columns)',
+        'and': 'and',
+    },
+    'id': {
+        'title': 'Platform Analitik Data',
+        'subtitle': 'Solusi Analisis Statistik Lengkap untuk Peneliti',
+        'welcome': 'Selamat Datang!',
+        'welcome_text': 'Memberdayakan peneliti dengan alat analisis statistik yang intuitif. Ubah data Anda menjadi wawasan yang bermakna dengan platform komprehensif kami.',
+        'core_features': 'Fitur Utama',
+        'descriptive_stats': 'Statistik Deskriptif',
+        'descriptive_desc': 'Mean, median, varians, dll.',
+        'spearman': 'Korelasi Spearman',
+        'spearman_desc': 'Untuk analisis data ordinal',
+        'data_viz': 'Visualisasi Data',
+        'data_viz_desc': 'Grafik & plot interaktif',
+        'regression': 'Analisis Regresi',
+        'regression_desc': 'Garis tren & prediksi',
+        'stat_testing': 'Pengujian Statistik',
+        'stat_testing_desc': 'Nilai-p & signifikansi',
+        'corr_matrix': 'Matriks Korelasi',
+        'corr_matrix_desc': 'Hubungan multi-variabel',
+        'corr_matrix_mode': 'Hitung matriks korelasi semua item terpilih',
+        'p_adjust': 'Koreksi perbandingan berganda',
+        'p_adjust_none': 'Tidak ada',
+        'p_adjust_fdr_bh': 'False discovery rate (Benjamini-Hochberg)',
+        'p_adjust_bonferroni': 'Bonferroni',
+        'p_adjusted': 'Nilai-p terkoreksi',
+        'bootstrap_replicates': 'Jumlah resampel bootstrap untuk interval kepercayaan',
+        'bootstrap_off': 'Nonaktif',
+        'ci_bca': 'IK (BCa)',
+        'ci_percentile': 'IK (persentil)',
+        'bootstrap_resamples': 'resampel bootstrap',
+        'permutation_mode': 'Nilai-p uji permutasi (eksak untuk sampel kecil)',
+        'permutation_running': 'Menjalankan uji permutasi...',
+        'permutation_stop': 'Hentikan uji permutasi',
+        'p_permutation': 'Nilai-p (permutasi)',
+        'p_asymptotic': 'Nilai-p (asimtotik)',
+        'permutations': 'permutasi',
+        'perm_exact': 'eksak',
+        'perm_converged': 'konvergen',
+        'perm_max': 'batas tercapai',
+        'perm_cancelled': 'dibatalkan',
+        'perm_too_few': 'pasangan terlalu sedikit',
+        'scatter_count': 'Responden per sel',
+        'scatter_hist2d_note': 'Sampel besar: diagram pencar digambar sebagai histogram 2-D dari seluruh {n} baris; garis tren dihitung dari semua baris.',
+        'scatter_sample_note': 'Sampel besar: diagram pencar menampilkan sampel terstratifikasi {shown} dari {n} baris; garis tren dihitung dari semua baris.',
+        'corr_pairs': 'Pasangan item',
+        'footer': '© 2024 Platform Analitik Data | Proyek Kelompok 3',
+        'footer_sub': 'Analisis Statistik Lanjutan dengan Korelasi Spearman',
+        'platform_title': 'Platform Analisis Statistik Lanjutan',
+        'platform_subtitle': 'Solusi Analisis Data Komprehensif • Proyek Kelompok 3 • Alat Analitik Profesional',
+        'objectives': 'Tujuan Proyek',
+        'global_access': 'Aksesibilitas Global',
+        'global_text_1': 'Mengembangkan platform berbasis web yang intuitif untuk analisis statistik yang dapat diakses oleh pengguna dari semua tingkat keahlian',
+        'global_text_2': 'Mendukung 12 bahasa internasional untuk memastikan aksesibilitas dan kegunaan global',
+        'comprehensive': 'Analisis Komprehensif',
+        'comp_text_1': 'Menerapkan alat statistik deskriptif yang komprehensif untuk eksplorasi dan ringkasan data',
+        'comp_text_2': 'Menyediakan analisis korelasi lanjutan menggunakan metode Spearman untuk data ordinal',
+        'tech_stack': 'Teknologi',
+        'tech_text': 'Platform kami dibangun dengan teknologi modern yang menjamin keandalan, performa, dan skalabilitas.',
+        'our_team': 'Tim Kami',
+        'team_text': 'Kenali tim berbakat di balik proyek ini.',
+        'about_analysis': 'Tentang Analisis',
+        'about_text': 'Aplikasi ini melakukan dua prosedur statistik utama:',
+        'descriptive_analysis': 'Analisis Deskriptif - merangkum karakteristik variabel',
+        'association_analysis': 'Analisis Asosiasi (Korelasi Spearman) - mengevaluasi hubungan',
+        'desc_analysis_title': '1) Analisis Deskriptif',
+        'basic_stats_title': 'Statistik Dasar:',
+        'basic_stats_text': 'Mean, Median, Modus, Min/Maks, Deviasi Standar',
+        'distribution_title': 'Distribusi & Frekuensi:',
+        'distribution_text': 'Histogram, Diagram batang, Tabel frekuensi',
+        'summaries_title': 'Ringkasan Variabel:',
+        'summaries_text': 'Boxplot, Kuartil',
+        'assoc_analysis_title': '2) Analisis Asosiasi',
+        'spearman_coef': 'Koefisien Korelasi Spearman (ρ): Mengukur kekuatan dan arah',
+        'p_value': 'Nilai-p: Menentukan signifikansi statistik',
+        'visualizations': 'Visualisasi: Diagram sebar dengan garis tren',
+        'interpretations': 'Interpretasi: Klasifikasi kekuatan otomatis',
+        'program_obj': 'Tujuan Program',
+        'obj_1': 'Menyediakan statistik deskriptif lengkap',
+        'obj_2': 'Menampilkan visualisasi interaktif',
+        'obj_3': 'Mengukur asosiasi menggunakan korelasi Spearman',
+        'obj_4': 'Menghasilkan wawasan yang dapat diinterpretasi untuk laporan akademik',
+        'obj_5': 'Memungkinkan unggah data kustom untuk fleksibilitas',
+        'upload_dataset': 'Unggah Dataset',
+        'accepted_formats': 'Format diterima: CSV, Excel (.xlsx, .xls)',
+        'dataset_loaded': 'Dataset berhasil dimuat',
+        'loading_dataset': 'Memuat dataset...',
+        'select_sheets': 'Pilih sheet untuk dianalisis',
+        'rows': 'Baris',
+        'columns': 'Kolom',
+        'size': 'Ukuran',
+        'variable_selection': 'Pemilihan Variabel',
+        'select_x': 'Pilih variabel X',
+        'select_y': 'Pilih variabel Y',
+        'create_composite': 'Buat skor komposit',
+        'run_analysis': 'Jalankan Analisis Lengkap',
+        'desc_analysis': 'Analisis Deskriptif',
+        'variable': 'Variabel',
+        'count': 'Jumlah',
+        'mean': 'Rata-rata',
+        'median': 'Median',
+        'min': 'Min',
+        'max': 'Maks',
+        'std_dev': 'Dev Std',
+        'variance': 'Varians',
+        'range': 'Rentang',
+        'missing': 'Hilang',
+        'skewness': 'Kemencengan',
+        'kurtosis': 'Kurtosis',
+        'key_insights': 'Wawasan Utama:',
+        'central_tendency': 'Tendensi Sentral',
+        'spread': 'Sebaran',
+        'likert_detected': 'Skala Likert Terdeteksi',
+        'likert_text': 'Cocok untuk pengujian non-parametrik.',
+        'frequency_dist': 'Distribusi Frekuensi',
+        'category': 'Kategori',
+        'frequency': 'Frekuensi',
+        'percentage': 'Persentase (%)',
+        'normality_test': 'Uji Normalitas',
+        'normality_strategy': 'Uji normalitas',
+        'norm_auto': 'Otomatis (berdasarkan ukuran sampel)',
+        'norm_shapiro': 'Shapiro-Wilk',
+        'norm_shapiro_subsample': 'Shapiro-Wilk (subsampel 5.000 baris)',
+        'norm_dagostino': "D'Agostino K²",
+        'norm_anderson': 'Anderson-Darling',
+        'norm_qq': 'Korelasi Q-Q (ukuran efek)',
+        'norm_none': 'Tidak tersedia',
+        'normal': 'Normal',
+        'non_normal': 'Tidak Normal',
+        'method': 'Metode',
+        'association': 'Analisis Asosiasi',
+        'pearson': 'Korelasi Pearson',
+        'spearman_rank': 'Korelasi Peringkat Spearman',
+        'coefficient': 'Koefisien',
+        'strength': 'Kekuatan',
+        'direction': 'Arah',
+        'positive': 'Positif',
+        'negative': 'Negatif',
+        'significance': 'Signifikansi',
+        'yes': 'Ya',
+        'no': 'Tidak',
+        'interpretation': 'Interpretasi:',
+        'relationship': 'hubungan',
+        'correlation': 'korelasi',
+        'significant': 'Signifikan',
+        'not_significant': 'Tidak Signifikan',
+        'note': 'Catatan',
+        'causation_note': 'Korelasi ≠ Kausalitas',
+        'conclusion': 'Kesimpulan',
+        'key_findings': 'Temuan Utama:',
+        'finding_1': 'Analisis deskriptif mengungkapkan pola bermakna',
+        'finding_2': 'Skor komposit meningkatkan reliabilitas',
+        'finding_3': 'Analisis asosiasi menunjukkan hubungan yang dapat diinterpretasi',
+        'finding_4': 'Hasil cocok untuk pelaporan akademik',
+        'understanding_corr': 'Memahami Metode Korelasi',
+        'pearson_corr': 'Korelasi Pearson',
+        'spearman_corr': 'Korelasi Peringkat Spearman (ρ)',
+        'purpose': 'Tujuan:',
+        'requirements': 'Persyaratan:',
+        'when_use': 'Kapan digunakan:',
+        'method_calc': 'Metode:',
+        'formula': 'Rumus:',
+        'range_val': 'Rentang:',
+        'sensitivity': 'Sensitivitas:',
+        'advantage': 'Keunggulan:',
+        'perfect_for': 'Sempurna untuk:',
+        'pearson_purpose': 'Mengukur hubungan linear antara variabel kontinu',
+        'pearson_req': 'Mengasumsikan distribusi normal, data interval/rasio, hubungan linear',
+        'pearson_when': 'Ketika kedua variabel berdistribusi normal dan hubungannya linear',
+        'pearson_formula': 'r = Σ[(xi - x̄)(yi - ȳ)] / √[Σ(xi - x̄)²Σ(yi - ȳ)²]',
+        'pearson_range': '-1 hingga +1 (korelasi negatif sempurna ke positif sempurna)',
+        'pearson_sensitivity': 'Sangat sensitif terhadap outlier dan nilai ekstrem',
+        'spearman_purpose': 'Mengukur hubungan monotonik (tidak harus linear)',
+        'spearman_req': 'Bekerja dengan data ordinal, interval, atau rasio; non-parametrik',
+        'spearman_when': 'Ketika data tidak berdistribusi normal, mengandung outlier, atau melibatkan data ordinal (seperti skala Likert 1-5)',
+        'spearman_method': 'Menggunakan perhitungan berbasis peringkat bukan nilai mentah',
+        'spearman_advantage': 'Lebih robust terhadap outlier dan distribusi non-normal',
+        'spearman_perfect': 'Data survei dengan skala Likert, preferensi peringkat, pengukuran ordinal',
+        'key_diff': 'Perbedaan Utama: Pearson vs Spearman',
+        'aspect': 'Aspek',
+        'data_type': 'Tipe Data',
+        'relationship_type': 'Tipe Hubungan',
+        'distribution': 'Distribusi',
+        'outliers': 'Outlier',
+        'likert_scales': 'Skala Likert (1-5)',
+        'calculation': 'Perhitungan',
+        'best_app': 'Aplikasi Terbaik',
+        'continuous': 'Kontinu (interval/rasio)',
+        'ordinal_continuous': 'Ordinal atau kontinu',
+        'linear_only': 'Hanya linear',
+        'monotonic': 'Monotonik (arah yang konsisten)',
+        'requires_norm': 'Membutuhkan normalitas',
+        'no_assumption': 'Tidak ada asumsi distribusi',
+        'highly_sensitive': 'Sangat sensitif',
+        'robust_resistant': 'Robust dan resisten',
+        'not_recommended': 'Tidak direkomendasikan',
+        'ideal_choice': 'Pilihan ideal',
+        'uses_raw': 'Menggunakan nilai data mentah',
+        'uses_ranked': 'Menggunakan data peringkat',
+        'experimental': 'Data eksperimental, pengukuran',
+        'survey_research': 'Riset survei, kuesioner',
+        'when_use_which': 'Kapan Menggunakan Metode Mana?',
+        'use_pearson_when': 'Gunakan Pearson ketika:',
+        'use_spearman_when': 'Gunakan Spearman ketika:',
+        'normal_dist': 'Data berdistribusi normal',
+        'linear_rel': 'Hubungan bersifat linear',
+        'vars_continuous': 'Variabel bersifat kontinu',
+        'no_outliers': 'Tidak ada outlier signifikan',
+        'ordinal_data': 'Data bersifat ordinal (skala Likert)',
+        'non_normal': 'Distribusi non-normal',
+        'presence_outliers': 'Terdapat outlier',
+        'monotonic_not_linear': 'Monotonik tapi tidak linear',
+        'pdf_title': 'LAPORAN ANALISIS STATISTIK',
+        'pdf_report_info': 'Informasi Laporan',
+        'pdf_generated': 'Dibuat',
+        'pdf_total_resp': 'Total Responden',
+        'pdf_x_vars': 'Variabel X',
+        'pdf_y_vars': 'Variabel Y',
+        'pdf_exec_summary': 'RINGKASAN EKSEKUTIF',
+        'pdf_exec_text_1': 'Laporan analisis statistik komprehensif ini menyajikan temuan dari data survei dengan',
+        'pdf_exec_text_2': 'responden. Analisis mengungkapkan hubungan',
+        'pdf_exec_text_3': 'antara variabel X dan Y (koefisien korelasi =',
+        'pdf_exec_text_4': 'nilai-p =',
+        'pdf_exec_text_5': 'Hubungan tersebut',
+        'pdf_statistically_sig': 'signifikan secara statistik',
+        'pdf_not_statistically_sig': 'tidak signifikan secara statistik',
+        'pdf_exec_text_6': 'pada tingkat α = 0,05. Metode yang dipilih',
+        'pdf_exec_text_7': 'dipilih berdasarkan pengujian normalitas distribusi data.',
+        'pdf_desc_stats': 'STATISTIK DESKRIPTIF',
+        'pdf_variable': 'Variabel:',
+        'pdf_statistic': 'Statistik',
+        'pdf_value': 'Nilai',
+        'pdf_distribution': 'Distribusi:',
+        'pdf_normality_test': 'UJI NORMALITAS',
+        'pdf_normality_text': 'Normalitas distribusi data dinilai dengan uji berikut:',
+        'pdf_interpretation_col': 'Interpretasi',
+        'pdf_data_follows': 'Data mengikuti distribusi normal',
+        'pdf_data_not_follows': 'Data tidak mengikuti distribusi normal',
+        'pdf_selected_method': 'Metode Terpilih:',
+        'pdf_method_text_1': 'Berdasarkan hasil uji normalitas,',
+        'pdf_method_text_2': 'dipilih sebagai metode analisis korelasi yang sesuai.',
+        'pdf_pearson_suitable': 'Korelasi Pearson cocok ketika kedua variabel mengikuti distribusi normal.',
+        'pdf_spearman_suitable': 'Korelasi Spearman lebih robust untuk distribusi non-normal dan data ordinal.',
+        'pdf_corr_analysis': 'ANALISIS KORELASI',
+        'pdf_metric': 'Metrik',
+        'pdf_interp': 'Interpretasi',
+        'pdf_method_used': 'Metode statistik yang digunakan',
+        'pdf_relationship': 'hubungan',
+        'pdf_sample_size': 'Ukuran Sampel',
+        'pdf_num_obs': 'Jumlah pengamatan',
+        'pdf_scatter_plot': 'Diagram Sebar dengan Garis Tren:',
+        'pdf_trend_line': 'Garis Tren',
+        'pdf_interpretation': 'INTERPRETASI',
+        'pdf_key_findings': 'Analisis korelasi mengungkapkan temuan utama berikut:',
+        'pdf_strength_rel': 'Kekuatan Hubungan:',
+        'pdf_strength_text_1': 'Koefisien korelasi r =',
+        'pdf_strength_text_2': 'menunjukkan hubungan',
+        'pdf_strength_text_3': 'antara variabel. Ini menunjukkan bahwa',
+        'pdf_substantial': 'terdapat asosiasi yang substansial',
+        'pdf_moderate': 'terdapat asosiasi yang moderat hingga lemah',
+        'pdf_between_vars': 'antara variabel X dan Y.',
+        'pdf_direction_rel': 'Arah Hubungan:',
+        'pdf_direction_text_1': 'Koefisien korelasi',
+        'pdf_direction_text_2': 'menunjukkan bahwa ketika X meningkat, Y cenderung',
+        'pdf_increase': 'meningkat juga',
+        'pdf_decrease': 'menurun',
+        'pdf_direction_text_3': 'Hubungan',
+        'pdf_direct': 'langsung',
+        'pdf_inverse': 'terbalik',
+        'pdf_direction_text_4': 'ini',
+        'pdf_same_direction': 'menunjukkan kedua variabel bergerak dalam arah yang sama',
+        'pdf_opposite_direction': 'menunjukkan variabel bergerak dalam arah berlawanan',
+        'pdf_stat_sig': 'Signifikansi Statistik:',
+        'pdf_sig_text_1': 'Dengan nilai-p sebesar',
+        'pdf_sig_text_2': 'hubungan tersebut',
+        'pdf_sig_text_3': 'Ini berarti',
+        'pdf_reject_null': 'kita dapat menolak hipotesis nol dan menyimpulkan bahwa korelasi yang diamati tidak mungkin terjadi karena kebetulan',
+        'pdf_cannot_reject': 'kita tidak dapat menolak hipotesis nol, dan korelasi yang diamati mungkin disebabkan oleh variasi acak',
+        'pdf_important_note': 'Catatan Penting:',
+        'pdf_causation': 'Korelasi tidak menyiratkan kausalitas. Meskipun kita mengamati',
+        'pdf_sig_association': 'asosiasi yang signifikan',
+        'pdf_an_association': 'sebuah asosiasi',
+        'pdf_causation_text': 'antara variabel, analisis ini sendiri tidak dapat menentukan apakah satu variabel menyebabkan perubahan pada variabel lainnya.',
+        'pdf_conclusion': 'KESIMPULAN',
+        'pdf_summary': 'Ringkasan Temuan Utama:',
+        'pdf_desc_analysis_sum': 'Analisis Deskriptif:',
+        'pdf_desc_text': 'Berhasil menganalisis',
+        'pdf_desc_text_2': 'variabel, mengungkapkan pola bermakna dalam distribusi data.',
+        'pdf_composite': 'Skor Komposit:',
+        'pdf_composite_text': 'Membuat ukuran agregat yang andal (X_total dan Y_total) yang meningkatkan reliabilitas pengukuran dan mengurangi kesalahan acak.',
+        'pdf_composite_text_low': 'Membuat ukuran agregat (X_total dan Y_total), tetapi tidak semua skala mencapai konsistensi internal yang dapat diterima (α 0,70 atau lebih), sehingga hasil yang dibangun dari skala tersebut perlu dibaca dengan hati-hati:',
+        'pdf_composite_text_unrated': 'Membuat ukuran agregat (X_total dan Y_total). Tidak ada skala dengan dua item atau lebih, sehingga konsistensi internalnya tidak dapat diperkirakan.',
+        'pdf_corr_analysis_sum': 'Analisis Korelasi:',
+        'pdf_corr_text_1': 'Menemukan hubungan',
+        'pdf_corr_text_2': 'yang',
+        'pdf_corr_text_3': 'pada tingkat 0,05.',
+        'pdf_method_rigor': 'Ketelitian Metodologis:',
+        'pdf_method_text': 'Menerapkan metode statistik yang sesuai',
+        'pdf_method_text_2': 'berdasarkan karakteristik distribusi data, memastikan hasil yang valid dan reliabel.',
+        'pdf_academic': 'Pelaporan Akademik:',
+        'pdf_academic_text': 'Hasil cocok untuk dimasukkan dalam makalah akademik, tesis, dan laporan penelitian dengan kutipan metode dan keterbatasan yang tepat.',
+        'pdf_recommendations': 'Rekomendasi:',
+        'pdf_rec_1': 'Pertimbangkan untuk melakukan analisis tambahan untuk mengeksplorasi variabel perancu potensial',
+        'pdf_rec_2': 'Periksa perbedaan subkelompok jika berlaku untuk konteks penelitian Anda',
+        'pdf_rec_3': 'Replikasi temuan dengan sampel independen untuk memvalidasi hasil',
+        'pdf_rec_4': 'Pertimbangkan metode kualitatif untuk memahami mekanisme di balik hubungan yang diamati',
+        'pdf_footer': 'Laporan dibuat oleh Data Analytics Platform | © 2024 | Dibuat pada',
+        'pdf_download_btn': 'Unduh Laporan Analisis Lengkap dengan Grafik (PDF)',
+        'pdf_success': 'Laporan PDF dengan semua grafik berhasil dibuat!',
+        'pdf_includes': 'Laporan ini mencakup: Ringkasan Eksekutif, Statistik Deskriptif dengan Grafik, Uji Normalitas, Analisis Korelasi dengan Diagram Sebar, Interpretasi Terperinci, dan Kesimpulan.',
+        'pdf_generate': 'Buat Laporan PDF',
+        'pdf_generating': 'Membuat laporan PDF',
+        'pdf_cancel': 'Batalkan laporan',
+        'pdf_cancelled': 'Pembuatan PDF dibatalkan.',
+        'pdf_section_cover': 'sampul dan ringkasan',
+        'pdf_section_descriptives': 'statistik deskriptif',
+        'pdf_section_reliability': 'reliabilitas skala',
+        'pdf_section_normality': 'uji normalitas',
+        'pdf_section_correlation': 'analisis korelasi',
+        'pdf_section_interpretation': 'interpretasi',
+        'pdf_section_conclusion': 'kesimpulan',
+        'pdf_section_build': 'menyusun halaman',
+        'batch_mode': 'Mode batch: pilihan sama untuk banyak file',
+        'batch_help': 'Menjalankan pilihan variabel saat ini pada setiap file di bawah, beberapa sekaligus, dan menulis satu PDF per file beserta tabel ringkasan.',
+        'batch_files': 'File data',
+        'batch_save_selection': 'Simpan pilihan',
+        'batch_start': 'Analisis semua file',
+        'batch_running': 'Menganalisis file',
+        'batch_summary': 'Ringkasan batch',
+        'batch_download': 'Unduh PDF dan ringkasan (ZIP)',
+        'batch_no_files': 'Tidak ada file CSV atau Excel untuk dianalisis.',
+        'batch_failed': 'file tidak dapat dianalisis',
+        'split_by': 'Pisahkan menurut (analisis subkelompok)',
+        'split_none': 'Tanpa pemisahan',
+        'group_analysis': 'Analisis subkelompok menurut',
+        'group_by': 'menurut',
+        'group_distribution': 'Distribusi',
+        'group_corr': 'Korelasi dalam setiap kelompok',
+        'group_desc': 'Statistik deskriptif per kelompok',
+        'group': 'Kelompok',
+        'group_dropped': '{rows} baris di luar {levels} kelompok terbesar atau tanpa nilai kelompok tidak disertakan.',
+        'pdf_section_groups': 'analisis subkelompok',
+        'memory_report': 'Memori per kolom',
+        'memory_before': 'Sebelum',
+        'memory_after': 'Sesudah',
+        'memory_ratio': 'Lebih kecil',
+        'memory_saved': 'Disimpan dalam {after}, bukan {before} ({ratio:.1f}× lebih kecil); jawaban dan statistik tidak berubah.',
+        'composite_scoring': 'Penilaian komposit',
+        'score_method': 'Skor',
+        'score_sum': 'Jumlah item',
+        'score_mean': 'Rata-rata item yang dijawab',
+        'score_weighted': 'Rata-rata berbobot item yang dijawab',
+        'reverse_items': 'Item dengan skor terbalik',
+        'scale_min': 'Skala minimum',
+        'scale_max': 'Skala maksimum',
+        'min_answered': 'Minimum item terjawab',
+        'min_answered_help': 'Responden yang menjawab lebih sedikit item tidak mendapat skor; jumlah diproyeksikan ke seluruh item. 0 menghitung jawaban kosong sebagai nol.',
+        'item_weight': 'Bobot',
+        'extra_composites': 'Komposit tambahan',
+        'extra_composites_help': 'Satu per baris, seperti Nama = item, item, item. Dinilai seperti X_total dan Y_total.',
+        'composite_unknown_items': 'Komposit {name} memakai kolom yang tidak ada di dataset: {items}',
+        'reliability_analysis': 'Reliabilitas Skala',
+        'reliability_desc': 'Seberapa konsisten item-item setiap komposit mengukur hal yang sama. Alpha dan omega 0,70 atau lebih umumnya dianggap dapat diterima; item dengan korelasi item-total rendah, atau yang jika dihapus menaikkan alpha, mungkin tidak termasuk dalam skala.',
+        'cronbach_alpha': 'α Cronbach',
+        'mcdonald_omega': 'ω McDonald',
+        'complete_responses': 'Jawaban lengkap',
+        'item': 'Item',
+        'n_items': 'Jumlah item',
+        'item_total_r': 'r item-total terkoreksi',
+        'alpha_if_deleted': 'α jika item dihapus',
+        'factor_loading': 'Muatan faktor',
+        'alpha_excellent': 'sangat baik',
+        'alpha_good': 'baik',
+        'alpha_acceptable': 'dapat diterima',
+        'alpha_questionable': 'diragukan',
+        'alpha_poor': 'buruk',
+        'alpha_unacceptable': 'tidak dapat diterima',
+        'reliability_summary': '{name}: α = {alpha}, ω = {omega}, n = {n}',
+        'size_arrow': 'Ukuran (kolom Arrow)',
+        'and': 'dan',
+    }
+}
+
+
+def translator(lang):
+    """Translate keys into ``lang``, falling back to the key itself"""
+    return lambda key: translations[lang].get(key, key)